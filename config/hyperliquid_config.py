@@ -1,78 +1,201 @@
 """Configuration module for Hyperliquid MCP Server."""
 import os
-from typing import Optional
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional, Tuple
 from dotenv import load_dotenv
-
-# Load environment variables from .env file
-# override=False means env vars from system/Claude Desktop take priority
-load_dotenv(override=False)
-
-# Network configuration
-NETWORK = os.getenv("HYPERLIQUID_NETWORK", "mainnet")
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
+from eth_utils import is_checksum_address, is_hex_address
 
 # API endpoints
 MAINNET_API_URL = "https://api.hyperliquid.xyz"
 TESTNET_API_URL = "https://api.hyperliquid-testnet.xyz"
 
-API_URL = MAINNET_API_URL if NETWORK == "mainnet" else TESTNET_API_URL
-
 # WebSocket endpoints
 MAINNET_WS_URL = "wss://api.hyperliquid.xyz/ws"
 TESTNET_WS_URL = "wss://api.hyperliquid-testnet.xyz/ws"
 
-WS_URL = MAINNET_WS_URL if NETWORK == "mainnet" else TESTNET_WS_URL
+# Every variable get_config() reads; .env is skipped only when the process
+# environment already provides all of them
+_CONFIG_ENV_VARS = (
+    "HYPERLIQUID_NETWORK",
+    "HYPERLIQUID_PRIVATE_KEY",
+    "HYPERLIQUID_ACCOUNT_ADDRESS",
+    "HYPERLIQUID_DEFAULT_SLIPPAGE",
+    "HYPERLIQUID_MAX_RETRY_ATTEMPTS",
+    "HYPERLIQUID_REQUEST_TIMEOUT",
+    "HYPERLIQUID_STREAM_COINS",
+)
+# Set once .env has been processed in this process (kept out of os.environ so
+# child processes still load their own .env)
+_dotenv_loaded = False
+_dotenv_lock = threading.Lock()
+
+
+def _ensure_dotenv_loaded() -> None:
+    """
+    Load the .env file at most once, and only when it is actually needed.
 
-# Authentication credentials
-PRIVATE_KEY = os.getenv("HYPERLIQUID_PRIVATE_KEY", "")
-ACCOUNT_ADDRESS = os.getenv("HYPERLIQUID_ACCOUNT_ADDRESS", "")
+    Hosts such as Claude Desktop may pass the whole configuration through
+    the process environment; in that case the .env file is never opened.
+    If any setting is missing from the environment, .env fills it in.
+    """
+    global _dotenv_loaded
 
-# Additional configuration
-DEFAULT_SLIPPAGE = float(os.getenv("HYPERLIQUID_DEFAULT_SLIPPAGE", "0.01"))  # 1% default
-MAX_RETRY_ATTEMPTS = int(os.getenv("HYPERLIQUID_MAX_RETRY_ATTEMPTS", "3"))
-REQUEST_TIMEOUT = int(os.getenv("HYPERLIQUID_REQUEST_TIMEOUT", "30"))  # seconds
+    if _dotenv_loaded:
+        return
 
+    with _dotenv_lock:
+        if _dotenv_loaded:
+            return
 
-def validate_config() -> tuple[bool, Optional[str]]:
+        if not all(name in os.environ for name in _CONFIG_ENV_VARS):
+            # override=False means env vars from system/Claude Desktop take priority
+            load_dotenv(override=False)
+
+        _dotenv_loaded = True
+
+
+@dataclass(slots=True, frozen=True)
+class Config:
     """
-    Validate that all required configuration variables are set.
+    Immutable configuration snapshot.
 
-    Returns:
-        Tuple of (is_valid, error_message)
+    Built once per process by get_config(); derived values (endpoints,
+    validation result, summary, signing wallet) are computed at construction
+    so later reads are plain attribute loads. Once the wallet has been
+    derived, private_key is cleared so the config no longer references the
+    raw key.
     """
-    if not PRIVATE_KEY:
-        return False, "HYPERLIQUID_PRIVATE_KEY environment variable is required"
+    network: str
+    private_key: Optional[str] = field(repr=False)
+    account_address: str
+    default_slippage: float
+    max_retry_attempts: int
+    request_timeout: int
+    stream_coins: Tuple[str, ...]
+    api_url: str = field(init=False)
+    ws_url: str = field(init=False)
+    account_address_lower: str = field(init=False, repr=False)
+    address_short: str = field(init=False, repr=False)
+    wallet: Optional[LocalAccount] = field(init=False, repr=False)
+    wallet_address: Optional[str] = field(init=False)
+    is_valid: bool = field(init=False)
+    validation_error: Optional[str] = field(init=False)
+    summary: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        is_mainnet = self.network == "mainnet"
+        object.__setattr__(self, "api_url", MAINNET_API_URL if is_mainnet else TESTNET_API_URL)
+        object.__setattr__(self, "ws_url", MAINNET_WS_URL if is_mainnet else TESTNET_WS_URL)
+        object.__setattr__(self, "account_address_lower", self.account_address.lower())
+        address = self.account_address
+        object.__setattr__(self, "address_short", f"{address[:6]}...{address[-4:]}" if address else "Not set")
+
+        error = self._validate()
+        wallet = None
+        if error is None:
+            try:
+                wallet = Account.from_key(self.private_key)
+            except Exception:
+                error = "HYPERLIQUID_PRIVATE_KEY is not a valid private key"
+
+        object.__setattr__(self, "wallet", wallet)
+        object.__setattr__(self, "wallet_address", wallet.address if wallet else None)
+        object.__setattr__(self, "is_valid", error is None)
+        object.__setattr__(self, "validation_error", error)
+        object.__setattr__(self, "summary", self._build_summary())
+        if wallet is not None:
+            object.__setattr__(self, "private_key", None)
+
+    def _validate(self) -> Optional[str]:
+        """Return the first configuration error, or None if the config is valid."""
+        if not self.private_key:
+            return "HYPERLIQUID_PRIVATE_KEY environment variable is required"
+
+        if not self.account_address:
+            return "HYPERLIQUID_ACCOUNT_ADDRESS environment variable is required"
+
+        if self.network not in ("mainnet", "testnet"):
+            return f"Invalid HYPERLIQUID_NETWORK value: {self.network}. Must be 'mainnet' or 'testnet'"
+
+        # Validate private key format (should be hex string)
+        if not self.private_key.startswith("0x"):
+            return "HYPERLIQUID_PRIVATE_KEY must start with '0x'"
+
+        # Validate account address format (should be Ethereum-style address)
+        address = self.account_address
+        if not address.startswith("0x") or not is_hex_address(address):
+            return "HYPERLIQUID_ACCOUNT_ADDRESS must be a valid Ethereum address (0x...)"
+
+        # Mixed-case addresses carry an EIP-55 checksum; all-lower/all-upper do not
+        body = address[2:]
+        if body != body.lower() and body != body.upper() and not is_checksum_address(address):
+            return "HYPERLIQUID_ACCOUNT_ADDRESS has an invalid EIP-55 checksum"
+
+        return None
+
+    def _build_summary(self) -> str:
+        return f"""Hyperliquid MCP Server Configuration:
+- Network: {self.network}
+- API URL: {self.api_url}
+- WebSocket URL: {self.ws_url}
+- Account Address: {self.address_short}
+- Private Key: {'Set' if self.private_key else 'Not set'}
+- Default Slippage: {self.default_slippage * 100}%
+- Max Retry Attempts: {self.max_retry_attempts}
+- Request Timeout: {self.request_timeout}s
+- Streamed Coins: {', '.join(self.stream_coins) or 'None'}
+"""
 
-    if not ACCOUNT_ADDRESS:
-        return False, "HYPERLIQUID_ACCOUNT_ADDRESS environment variable is required"
 
-    if NETWORK not in ["mainnet", "testnet"]:
-        return False, f"Invalid HYPERLIQUID_NETWORK value: {NETWORK}. Must be 'mainnet' or 'testnet'"
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Build the process-wide configuration from environment variables.
+
+    Returns:
+        Cached Config instance (environment is read only on the first call)
+    """
+    _ensure_dotenv_loaded()
+
+    return Config(
+        network=os.getenv("HYPERLIQUID_NETWORK", "mainnet"),
+        private_key=os.getenv("HYPERLIQUID_PRIVATE_KEY", ""),
+        account_address=os.getenv("HYPERLIQUID_ACCOUNT_ADDRESS", ""),
+        default_slippage=float(os.getenv("HYPERLIQUID_DEFAULT_SLIPPAGE", "0.01")),  # 1% default
+        max_retry_attempts=int(os.getenv("HYPERLIQUID_MAX_RETRY_ATTEMPTS", "3")),
+        request_timeout=int(os.getenv("HYPERLIQUID_REQUEST_TIMEOUT", "30")),  # seconds
+        # Comma-separated coins whose mids/L2 books are served from WebSocket pushes
+        stream_coins=tuple(
+            coin.strip() for coin in os.getenv("HYPERLIQUID_STREAM_COINS", "").split(",") if coin.strip()
+        ),
+    )
 
-    # Validate private key format (should be hex string)
-    if not PRIVATE_KEY.startswith("0x"):
-        return False, "HYPERLIQUID_PRIVATE_KEY must start with '0x'"
 
-    # Validate account address format (should be Ethereum-style address)
-    if not ACCOUNT_ADDRESS.startswith("0x") or len(ACCOUNT_ADDRESS) != 42:
-        return False, "HYPERLIQUID_ACCOUNT_ADDRESS must be a valid Ethereum address (0x...)"
+def validate_config() -> tuple[bool, Optional[str]]:
+    """
+    Validate that all required configuration variables are set.
 
-    return True, None
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    cfg = get_config()
+    return cfg.is_valid, cfg.validation_error
 
 
 def get_config_summary() -> str:
     """
     Get a summary of the current configuration.
 
+    Describes the configuration the running clients were built from:
+    get_config() is cached for the life of the process and the summary is
+    computed with it, so edits to .env or the environment show up only
+    after a restart.
+
     Returns:
         String representation of current configuration
     """
-    return f"""Hyperliquid MCP Server Configuration:
-- Network: {NETWORK}
-- API URL: {API_URL}
-- WebSocket URL: {WS_URL}
-- Account Address: {ACCOUNT_ADDRESS[:6]}...{ACCOUNT_ADDRESS[-4:] if ACCOUNT_ADDRESS else 'Not set'}
-- Private Key: {'Set' if PRIVATE_KEY else 'Not set'}
-- Default Slippage: {DEFAULT_SLIPPAGE * 100}%
-- Max Retry Attempts: {MAX_RETRY_ATTEMPTS}
-- Request Timeout: {REQUEST_TIMEOUT}s
-"""
+    return get_config().summary
@@ -1,26 +1,29 @@
 """MCP Server for Hyperliquid Trading Platform."""
 import os
+import asyncio
+import inspect
 import logging
-from typing import Dict, Any, Optional, List
+import functools
+from typing import Annotated, Callable, Dict, Any, Optional, List
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from mcp.server.fastmcp import FastMCP, Context
+from mcp.server.fastmcp.resources import TextResource
+from mcp.server.fastmcp.tools import Tool
+from mcp.server.session import ServerSession
+from mcp.types import CallToolResult, TextContent
 from hyperliquid.info import Info
 from hyperliquid.exchange import Exchange
-from eth_account import Account
-
-from tools import TradingTools, AccountTools, MarketTools, WebSocketTools
-from config.hyperliquid_config import (
-    API_URL,
-    WS_URL,
-    PRIVATE_KEY,
-    ACCOUNT_ADDRESS,
-    NETWORK,
-    validate_config,
-    get_config_summary
-)
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+
+from tools import TradingTools, AccountTools, MarketTools, WebSocketTools, RateLimitGovernor
+from tools._text import SYMBOLS_GUIDE, TRADING_GUIDE
+from config.hyperliquid_config import Config, get_config, get_config_summary
 
 # Configure logging
 logging.basicConfig(
@@ -29,727 +32,449 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Global variable to store application context
-app_context: Optional[AppContext] = None
+# Progress message templates sent to the client via _tool_log (%-style, so
+# substitution only happens when the message is actually emitted)
+_LOG_PLACE_ORDER = "Placing %s %s order: %s %s @ %s"
+_LOG_PLACE_BATCH_ORDERS = "Placing batch of %d orders"
+_LOG_CANCEL_ORDER = "Canceling order for %s: order_id=%s, cloid=%s"
+_LOG_CANCEL_ALL_ORDERS = "Canceling all orders%s"
+_LOG_MODIFY_ORDER = "Modifying order %s for %s: price=%s, size=%s"
+_LOG_PLACE_TWAP_ORDER = "Placing TWAP order: %s %s over %sm"
+_LOG_ADJUST_LEVERAGE = "Adjusting leverage for %s to %sx (%s)"
+_LOG_MODIFY_ISOLATED_MARGIN = "%s %s USDC margin for %s"
+_LOG_UPDATE_DEAD_MANS_SWITCH = "Updating dead man's switch: %ss delay"
+_LOG_GET_USER_STATE = "Fetching user state for account %s"
+_LOG_GET_OPEN_ORDERS = "Fetching open orders%s"
+_LOG_GET_POSITIONS = "Fetching open positions"
+_LOG_GET_USER_FILLS = "Fetching user fills%s (limit=%s)"
+_LOG_GET_HISTORICAL_ORDERS = "Fetching historical orders%s (limit=%s)"
+_LOG_GET_PORTFOLIO_VALUE = "Calculating portfolio value and PnL"
+_LOG_GET_SUBACCOUNTS = "Fetching subaccounts"
+_LOG_GET_RATE_LIMIT_STATUS = "Checking rate limit status"
+_LOG_GET_ALL_MIDS = "Fetching all mid prices"
+_LOG_GET_L2_ORDERBOOK = "Fetching L2 orderbook for %s (depth=%s)"
+_LOG_GET_CANDLES = "Fetching %s %s candles for %s"
+_LOG_GET_RECENT_TRADES = "Fetching %s recent trades for %s"
+_LOG_GET_FUNDING_RATES = "Fetching funding rates for all perpetuals"
+_LOG_GET_ASSET_CONTEXTS = "Fetching asset contexts for %s"
+_LOG_GET_ASSET_CONTEXTS_BATCH = "Fetching asset contexts for %d coins"
+_LOG_SUBSCRIBE_USER_EVENTS = "Subscribing to user events for %s"
+_LOG_SUBSCRIBE_MARKET_DATA = "Subscribing to market data for %s: %s"
+_LOG_SUBSCRIBE_ORDER_UPDATES = "Subscribing to order updates for %s"
+_LOG_GET_ACTIVE_SUBSCRIPTIONS = "Fetching active WebSocket subscriptions"
 
 
 @dataclass
 class AppContext:
-    """Application context with tool instances and SDK clients."""
-    info_client: Info
-    exchange_client: Exchange
-    trading_tools: TradingTools
-    account_tools: AccountTools
-    market_tools: MarketTools
+    """
+    Application context with tool instances and SDK clients.
+
+    The SDK clients are built in the background after the MCP handshake;
+    call wait_info() / wait_exchange() before touching them.
+    """
     websocket_tools: WebSocketTools
     account_address: str
+    address_short: str
     network: str
+    info_client: Optional[Info] = None
+    exchange_client: Optional[Exchange] = None
+    trading_tools: Optional[TradingTools] = None
+    account_tools: Optional[AccountTools] = None
+    market_tools: Optional[MarketTools] = None
+    info_ready: asyncio.Event = field(default_factory=asyncio.Event)
+    exchange_ready: asyncio.Event = field(default_factory=asyncio.Event)
+    bootstrap_error: Optional[BaseException] = None
+    # Pooled HTTP adapters mounted on the SDK sessions, keyed by client name
+    http_adapters: Dict[str, HTTPAdapter] = field(default_factory=dict)
+
+    async def wait_info(self) -> None:
+        """Wait until the Info client and read-only tools are available."""
+        await self.info_ready.wait()
+        if self.market_tools is None:
+            raise RuntimeError(f"Hyperliquid clients failed to initialize: {self.bootstrap_error}")
+
+    async def wait_exchange(self) -> None:
+        """Wait until the Exchange client and trading tools are available."""
+        await self.exchange_ready.wait()
+        if self.trading_tools is None:
+            raise RuntimeError(f"Hyperliquid clients failed to initialize: {self.bootstrap_error}")
+
+
+# Request context type for tool handlers; lifespan_context is the AppContext
+ToolContext = Context[ServerSession, AppContext]
+
+
+def _mount_pool(session: Session, retries: Retry) -> HTTPAdapter:
+    """Mount a keep-alive connection pool on an SDK requests session."""
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retries)
+    session.mount("https://", adapter)
+    return adapter
+
+
+def _orjson_response_hook(response: Response, *args: Any, **kwargs: Any) -> None:
+    """
+    Make response.json() decode with orjson.
+
+    The SDK returns response.json() straight from every API call; large
+    payloads (candles, metadata, fills) decode several times faster this
+    way. orjson.JSONDecodeError subclasses ValueError, which is what the SDK
+    catches for unparsable bodies.
+    """
+    content = response.content
+    response.json = lambda **_: orjson.loads(content)
+
+
+def _make_info(cfg: Config) -> Info:
+    """Create the Info client used for market data and account queries."""
+    info = Info(cfg.api_url, skip_ws=True)
+    # Info requests are read-only POSTs, so they are safe to retry
+    _mount_pool(info.session, Retry(
+        total=cfg.max_retry_attempts,
+        backoff_factor=0.1,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=None
+    ))
+    info.session.hooks["response"].append(_orjson_response_hook)
+    return info
+
+
+def _make_exchange(cfg: Config) -> Exchange:
+    """Create the Exchange client for trading operations, signing with the config's wallet."""
+    exchange = Exchange(
+        wallet=cfg.wallet,
+        base_url=cfg.api_url,
+        account_address=cfg.account_address
+    )
+    # Actions are not idempotent: only retry failures to connect, never a
+    # request that may already have reached the exchange
+    _mount_pool(exchange.session, Retry(
+        total=cfg.max_retry_attempts,
+        read=0,
+        status=0,
+        other=0,
+        backoff_factor=0.1
+    ))
+    exchange.session.hooks["response"].append(_orjson_response_hook)
+    return exchange
 
 
-@asynccontextmanager
-async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
+async def _bootstrap_clients(ctx: AppContext, cfg: Config) -> None:
     """
-    Manage application lifecycle with Hyperliquid SDK initialization.
+    Build the SDK clients and the tools that depend on them.
 
-    This function:
-    1. Validates environment configuration
-    2. Initializes Hyperliquid Info and Exchange clients
-    3. Creates tool instances
-    4. Yields application context
-    5. Handles cleanup on shutdown
+    Both constructors block on HTTPS metadata fetches, so they run
+    concurrently in worker threads. Read-only tools are released as soon as
+    the Info client is up; trading tools also wait for the Exchange client.
+    Failures are recorded on the context and surfaced by the wait_* methods.
     """
-    # Validate configuration
-    is_valid, error_message = validate_config()
-    if not is_valid:
-        raise ValueError(f"Configuration validation failed: {error_message}")
-
-    logger.info("Starting Hyperliquid MCP Server...")
-    logger.info(get_config_summary())
+    logger.info(f"Initializing Hyperliquid clients for {cfg.network}...")
+    exchange_task = asyncio.create_task(asyncio.to_thread(_make_exchange, cfg))
 
     try:
-        # Initialize Hyperliquid SDK clients
-        logger.info(f"Initializing Hyperliquid clients for {NETWORK}...")
-
-        # Info client for reading market data and account info
-        info_client = Info(API_URL, skip_ws=True)
-
-        # Exchange client for trading operations
-        # Create wallet from private key for signing transactions
-        wallet = Account.from_key(PRIVATE_KEY)
-        exchange_client = Exchange(
-            wallet=wallet,
-            base_url=API_URL,
-            account_address=ACCOUNT_ADDRESS
-        )
-
-        logger.info(f"Connected to Hyperliquid {NETWORK}")
-        logger.info(f"Account: {ACCOUNT_ADDRESS[:6]}...{ACCOUNT_ADDRESS[-4:]}")
-
-        # Initialize tool instances
-        trading_tools = TradingTools(exchange_client, info_client, ACCOUNT_ADDRESS)
-        account_tools = AccountTools(info_client, ACCOUNT_ADDRESS)
-        market_tools = MarketTools(info_client, ACCOUNT_ADDRESS)
-        websocket_tools = WebSocketTools(WS_URL, ACCOUNT_ADDRESS)
-
+        ctx.info_client = await asyncio.to_thread(_make_info, cfg)
+        ctx.http_adapters["info"] = ctx.info_client.session.get_adapter(cfg.api_url)
+        # Both share one governor so they back off from the same rate limit together
+        governor = RateLimitGovernor()
+        ctx.account_tools = AccountTools(ctx.info_client, cfg.account_address, governor=governor)
+        ctx.market_tools = MarketTools(ctx.info_client, cfg.account_address, governor=governor)
+        ctx.info_ready.set()
+
+        # Warm the candle cache for the streamed coins (get_candles defaults:
+        # 100 x 1h) while the Exchange client is still being built
+        prefetch_task = None
+        if cfg.stream_coins:
+            prefetch_task = asyncio.create_task(asyncio.to_thread(
+                ctx.market_tools.prefetch_candles, cfg.stream_coins, ("1h",), 100
+            ))
+
+        ctx.exchange_client = await exchange_task
+        ctx.http_adapters["exchange"] = ctx.exchange_client.session.get_adapter(cfg.api_url)
+        ctx.trading_tools = TradingTools(ctx.exchange_client, ctx.info_client, cfg.account_address)
+
+        logger.info(f"Connected to Hyperliquid {cfg.network}")
         logger.info("All tools initialized successfully")
 
-        # Create and store application context globally
-        global app_context
-        app_context = AppContext(
-            info_client=info_client,
-            exchange_client=exchange_client,
-            trading_tools=trading_tools,
-            account_tools=account_tools,
-            market_tools=market_tools,
-            websocket_tools=websocket_tools,
-            account_address=ACCOUNT_ADDRESS,
-            network=NETWORK
-        )
+        if cfg.stream_coins:
+            # Optional: reads keep working over REST if the stream is unavailable
+            try:
+                await ctx.market_tools.start_streaming(ctx.websocket_tools, cfg.stream_coins)
+            except Exception as e:
+                logger.warning(f"Market data streaming disabled: {e}")
 
-        # Yield application context
-        yield app_context
+        if prefetch_task is not None:
+            await prefetch_task
 
     except Exception as e:
         logger.error(f"Failed to initialize Hyperliquid clients: {e}")
-        raise
+        exchange_task.cancel()
+        ctx.bootstrap_error = e
 
     finally:
-        # Cleanup on shutdown
-        logger.info("Shutting down Hyperliquid MCP Server...")
-        # Add any cleanup logic here (close connections, etc.)
-
-
-# Create MCP server
-mcp = FastMCP(
-    "hyperliquid-mcp-server",
-    dependencies=["hyperliquid-python-sdk", "eth-account", "python-dotenv"],
-    lifespan=app_lifespan
-)
-
-
-# ============================================================================
-# TRADING TOOLS (9 methods)
-# ============================================================================
-
-@mcp.tool()
-async def place_order(
-    coin: str,
-    is_buy: bool,
-    size: float,
-    price: float,
-    order_type: str = "limit",
-    tif: str = "Gtc",
-    reduce_only: bool = False,
-    cloid: Optional[str] = None,
-    ctx: Context = None
-) -> Dict[str, Any]:
-    """
-    Place a single order on Hyperliquid.
-
-    Args:
-        coin: Trading pair symbol (e.g., "BTC", "ETH")
-        is_buy: True for buy order, False for sell order
-        size: Order size in base currency units
-        price: Limit price (ignored for market orders)
-        order_type: "limit" or "market"
-        tif: Time in force - "Gtc", "Ioc", "Alo"
-        reduce_only: If True, order can only reduce existing position
-        cloid: Client order ID for tracking (optional)
-
-    Returns:
-        Order placement result with order ID and status
-    """
-    if ctx:
-        if ctx: ctx.info(f"Placing {'buy' if is_buy else 'sell'} {order_type} order: {size} {coin} @ {price}")
-
-    result = await app_context.trading_tools.place_order(
-        coin=coin,
-        is_buy=is_buy,
-        size=size,
-        price=price,
-        order_type=order_type,
-        tif=tif,
-        reduce_only=reduce_only,
-        cloid=cloid
-    )
-    return result
-
-
-@mcp.tool()
-async def place_batch_orders(
-    orders: List[Dict[str, Any]],
-    ctx: Context = None
-) -> List[Dict[str, Any]]:
-    """
-    Place multiple orders in a single batch request.
-
-    Args:
-        orders: List of order dictionaries, each containing:
-            - coin: str
-            - is_buy: bool
-            - size: float
-            - price: float
-            - order_type: str (optional)
-            - tif: str (optional)
-            - reduce_only: bool (optional)
-            - cloid: str (optional)
-
-    Returns:
-        List of result dictionaries, one per order
-    """
-    # Use global app_context
-    if ctx: ctx.info(f"Placing batch of {len(orders)} orders")
-
-    result = await app_context.trading_tools.place_batch_orders(orders)
-    return result
-
-
-@mcp.tool()
-async def cancel_order(
-    coin: str,
-    order_id: Optional[int] = None,
-    cloid: Optional[str] = None,
-    ctx: Context = None
-) -> Dict[str, Any]:
-    """
-    Cancel a specific order by order ID or client order ID.
-
-    Args:
-        coin: Trading pair symbol
-        order_id: Exchange order ID (optional if cloid provided)
-        cloid: Client order ID (optional if order_id provided)
-
-    Returns:
-        Cancellation result with status
-    """
-    # Use global app_context
-    if ctx: ctx.info(f"Canceling order for {coin}: order_id={order_id}, cloid={cloid}")
-
-    result = await app_context.trading_tools.cancel_order(
-        coin=coin,
-        order_id=order_id,
-        cloid=cloid
-    )
-    return result
-
+        ctx.info_ready.set()
+        ctx.exchange_ready.set()
 
-@mcp.tool()
-async def cancel_all_orders(
-    coin: Optional[str] = None,
-    ctx: Context = None
-) -> Dict[str, Any]:
-    """
-    Cancel all open orders, optionally filtered by coin.
-
-    Args:
-        coin: Trading pair symbol (if None, cancels ALL orders across all coins)
-
-    Returns:
-        Cancellation results including count of canceled orders
-
-    Warning:
-        If coin is None, this will cancel ALL open orders on the account.
-    """
-    # Use global app_context
-    if ctx: ctx.info(f"Canceling all orders{f' for {coin}' if coin else ' across all coins'}")
-
-    result = await app_context.trading_tools.cancel_all_orders(coin)
-    return result
-
-
-@mcp.tool()
-async def modify_order(
-    coin: str,
-    order_id: int,
-    new_price: Optional[float] = None,
-    new_size: Optional[float] = None,
-    ctx: Context = None
-) -> Dict[str, Any]:
-    """
-    Modify an existing order's price and/or size.
-
-    Args:
-        coin: Trading pair symbol
-        order_id: Exchange order ID to modify
-        new_price: New limit price (optional)
-        new_size: New order size (optional)
-
-    Returns:
-        Modification result with updated order details
-
-    Note:
-        On Hyperliquid, modifying an order may result in a new order ID.
-    """
-    # Use global app_context
-    if ctx: ctx.info(f"Modifying order {order_id} for {coin}: price={new_price}, size={new_size}")
-
-    result = await app_context.trading_tools.modify_order(
-        coin=coin,
-        order_id=order_id,
-        new_price=new_price,
-        new_size=new_size
-    )
-    return result
-
-
-@mcp.tool()
-async def place_twap_order(
-    coin: str,
-    is_buy: bool,
-    total_size: float,
-    duration_minutes: int,
-    randomize: bool = False,
-    ctx: Context = None
-) -> Dict[str, Any]:
-    """
-    Place a Time-Weighted Average Price (TWAP) order.
-
-    TWAP orders split a large order into smaller chunks executed over time
-    to minimize market impact and achieve better average execution price.
-
-    Args:
-        coin: Trading pair symbol
-        is_buy: True for buy, False for sell
-        total_size: Total size to execute over the duration
-        duration_minutes: Time period to spread the order over (in minutes)
-        randomize: If True, randomize slice timing to reduce predictability
-
-    Returns:
-        TWAP order details including estimated slices and timing
-    """
-    # Use global app_context
-    if ctx: ctx.info(f"Placing TWAP order: {total_size} {coin} over {duration_minutes}m")
-
-    result = await app_context.trading_tools.place_twap_order(
-        coin=coin,
-        is_buy=is_buy,
-        total_size=total_size,
-        duration_minutes=duration_minutes,
-        randomize=randomize
-    )
-    return result
-
-
-@mcp.tool()
-async def adjust_leverage(
-    coin: str,
-    leverage: int,
-    is_cross: bool = True,
-    ctx: Context = None
-) -> Dict[str, Any]:
-    """
-    Adjust leverage for a perpetual trading pair.
-
-    Args:
-        coin: Trading pair symbol
-        leverage: Leverage multiplier (e.g., 10 for 10x)
-        is_cross: True for cross margin, False for isolated margin
-
-    Returns:
-        Leverage adjustment result
 
-    Warning:
-        Higher leverage increases both potential profits and losses.
-        Maximum leverage varies by asset (typically 20-50x).
+@asynccontextmanager
+async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     """
-    # Use global app_context
-    if ctx: ctx.info(f"Adjusting leverage for {coin} to {leverage}x ({'cross' if is_cross else 'isolated'})")
-
-    result = await app_context.trading_tools.adjust_leverage(
-        coin=coin,
-        leverage=leverage,
-        is_cross=is_cross
-    )
-    return result
-
+    Manage application lifecycle with Hyperliquid SDK initialization.
 
-@mcp.tool()
-async def modify_isolated_margin(
-    coin: str,
-    amount: float,
-    is_add: bool = True,
-    ctx: Context = None
-) -> Dict[str, Any]:
+    This function:
+    1. Validates environment configuration
+    2. Yields application context immediately so the MCP handshake is not
+       delayed by network round-trips
+    3. Initializes Hyperliquid clients and tool instances in the background
+    4. Handles cleanup on shutdown
     """
-    Add or remove USDC from an isolated margin position.
-
-    Args:
-        coin: Trading pair symbol
-        amount: Amount of USDC to add or remove
-        is_add: True to add margin, False to remove margin
-
-    Returns:
-        Margin modification result
-
-    Note:
-        This only works for positions in isolated margin mode.
+    cfg = get_config()
 
-    Warning:
-        Removing too much margin may trigger liquidation.
-    """
-    # Use global app_context
-    if ctx: ctx.info(f"{'Adding' if is_add else 'Removing'} {amount} USDC margin for {coin}")
+    # Validate configuration
+    if not cfg.is_valid:
+        raise ValueError(f"Configuration validation failed: {cfg.validation_error}")
 
-    result = await app_context.trading_tools.modify_isolated_margin(
-        coin=coin,
-        amount=amount,
-        is_add=is_add
+    logger.info("Starting Hyperliquid MCP Server...")
+    logger.info(cfg.summary)
+    logger.info(f"Account: {cfg.address_short}")
+
+    app = AppContext(
+        websocket_tools=WebSocketTools(cfg.ws_url, cfg.account_address),
+        account_address=cfg.account_address,
+        address_short=cfg.address_short,
+        network=cfg.network
     )
-    return result
-
-
-@mcp.tool()
-async def update_dead_mans_switch(
-    delay_seconds: int,
-    ctx: Context = None
-) -> Dict[str, Any]:
-    """
-    Configure dead man's switch to auto-cancel all orders after a delay.
-
-    The dead man's switch is a safety mechanism that automatically cancels
-    all open orders if not refreshed within the specified delay.
-
-    Args:
-        delay_seconds: Time in seconds before auto-canceling (minimum 5)
-
-    Returns:
-        Dead man's switch configuration result
+    bootstrap_task = asyncio.create_task(_bootstrap_clients(app, cfg))
 
-    Warning:
-        If the delay expires, ALL open orders will be canceled immediately.
-    """
-    # Use global app_context
-    if ctx: ctx.info(f"Updating dead man's switch: {delay_seconds}s delay")
+    try:
+        # Yield application context (exposed as ctx.request_context.lifespan_context)
+        yield app
 
-    result = await app_context.trading_tools.update_dead_mans_switch(delay_seconds)
-    return result
+    finally:
+        # Cleanup on shutdown
+        logger.info("Shutting down Hyperliquid MCP Server...")
+        if not bootstrap_task.done():
+            bootstrap_task.cancel()
+        # Release the streaming subscriptions and the pooled WebSocket
+        # connection before the HTTP sessions
+        try:
+            if app.market_tools is not None:
+                await app.market_tools.stop_streaming()
+            await app.websocket_tools.stop()
+        except Exception as e:
+            logger.warning(f"WebSocket shutdown failed: {e}")
+        for client in (app.info_client, app.exchange_client):
+            if client is not None:
+                client.session.close()
 
 
 # ============================================================================
-# ACCOUNT TOOLS (8 methods)
+# PASS-THROUGH TOOLS (trading, account, market)
 # ============================================================================
 
-@mcp.tool()
-async def get_user_state(
-    ctx: Context = None
-) -> Dict[str, Any]:
-    """
-    Get complete account state including balances, positions, and margin info.
-
-    Returns:
-        Account state data including:
-        - account_value: Total account value in USD
-        - total_margin_used: Margin currently in use
-        - withdrawable: Available balance to withdraw
-        - balances: List of asset balances
-        - positions: Open positions
-        - margin_summary: Margin utilization details
-    """
-    # Use global app_context
-    if ctx: ctx.info(f"Fetching user state for account {app_context.account_address[:8]}...")
-
-    result = await app_context.account_tools.get_user_state()
-    return result
-
-
-@mcp.tool()
-async def get_open_orders(
-    coin: Optional[str] = None,
-    ctx: Context = None
-) -> Dict[str, Any]:
-    """
-    Get all open orders, optionally filtered by coin.
-
-    Args:
-        coin: Optional coin symbol to filter orders (e.g., "BTC", "ETH")
-
-    Returns:
-        List of open orders with details including order ID, size, price, side
-    """
-    # Use global app_context
-    if ctx: ctx.info(f"Fetching open orders{f' for {coin}' if coin else ''}")
-
-    result = await app_context.account_tools.get_open_orders(coin)
-    return result
-
-
-@mcp.tool()
-async def get_positions(
-    ctx: Context = None
-) -> Dict[str, Any]:
-    """
-    Get all open positions with detailed metrics.
-
-    Returns:
-        List of open positions with:
-        - coin, size, entry_price, unrealized_pnl
-        - leverage, margin_used, position_value
-        - ROE percentage, liquidation price
-    """
-    # Use global app_context
-    if ctx: ctx.info("Fetching open positions")
-
-    result = await app_context.account_tools.get_positions()
-    return result
-
-
-@mcp.tool()
-async def get_user_fills(
-    coin: Optional[str] = None,
-    limit: int = 100,
-    ctx: Context = None
-) -> Dict[str, Any]:
-    """
-    Get recent trade fills, optionally filtered by coin.
-
-    Args:
-        coin: Optional coin symbol to filter fills
-        limit: Maximum number of fills to return (max 2000)
-
-    Returns:
-        List of fills with trade details including price, size, fees, PnL
-    """
-    # Use global app_context
-    if ctx: ctx.info(f"Fetching user fills{f' for {coin}' if coin else ''} (limit={limit})")
-
-    result = await app_context.account_tools.get_user_fills(coin, limit)
-    return result
-
-
-@mcp.tool()
-async def get_historical_orders(
-    coin: Optional[str] = None,
-    limit: int = 100,
-    ctx: Context = None
-) -> Dict[str, Any]:
-    """
-    Get historical orders with their status.
-
-    Args:
-        coin: Optional coin symbol to filter orders
-        limit: Maximum number of orders to return
-
-    Returns:
-        List of historical orders with status (filled, open, partially_filled)
-    """
-    # Use global app_context
-    if ctx: ctx.info(f"Fetching historical orders{f' for {coin}' if coin else ''} (limit={limit})")
-
-    result = await app_context.account_tools.get_historical_orders(coin, limit)
-    return result
-
-
-@mcp.tool()
-async def get_portfolio_value(
-    ctx: Context = None
-) -> Dict[str, Any]:
-    """
-    Get comprehensive portfolio value and PnL analysis.
-
-    Returns:
-        Portfolio analytics including:
-        - total_value, margin_used, available_margin
-        - total_pnl, realized_pnl, unrealized_pnl
-        - pnl_percentage, total_fees_paid
-        - breakdown by coin with position allocation
-    """
-    # Use global app_context
-    if ctx: ctx.info("Calculating portfolio value and PnL")
-
-    result = await app_context.account_tools.get_portfolio_value()
-    return result
+_TOOL_CLASSES = {
+    "trading_tools": TradingTools,
+    "account_tools": AccountTools,
+    "market_tools": MarketTools,
+}
 
 
-@mcp.tool()
-async def get_subaccounts(
-    ctx: Context = None
-) -> Dict[str, Any]:
-    """
-    Get list of subaccounts and their states.
-
-    Returns:
-        List of subaccounts with account values and positions
-    """
-    # Use global app_context
-    if ctx: ctx.info("Fetching subaccounts")
-
-    result = await app_context.account_tools.get_subaccounts()
-    return result
+async def _run_sync(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking SDK call in the default thread pool."""
+    return await asyncio.to_thread(fn, *args, **kwargs)
 
 
-@mcp.tool()
-async def get_rate_limit_status(
-    ctx: Context = None
-) -> Dict[str, Any]:
-    """
-    Get current rate limit usage and status.
+def _where(coin: Optional[str]) -> str:
+    return f" for {coin}" if coin else ""
 
-    Returns:
-        Rate limit information including:
-        - requests_used, requests_limit, requests_remaining
-        - weight_used, weight_limit, weight_remaining
-        - reset_time, status (healthy/warning/critical)
-        - recommendations for rate limit management
-    """
-    # Use global app_context
-    if ctx: ctx.info("Checking rate limit status")
 
-    result = await app_context.account_tools.get_rate_limit_status()
-    return result
+def _side(a: Dict[str, Any]) -> str:
+    return "buy" if a["is_buy"] else "sell"
 
 
-# ============================================================================
-# MARKET TOOLS (6 methods)
-# ============================================================================
+def _dumps(obj: Any) -> str:
+    """Encode a tool result compactly with orjson; results are read by clients, not people."""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
-@mcp.tool()
-async def get_all_mids(
-    ctx: Context = None
-) -> Dict[str, float]:
-    """
-    Get mid prices for all available coins.
 
-    Returns:
-        Dictionary mapping coin symbols to their mid prices
-        Example: {"BTC": 45000.0, "ETH": 2500.0, "SOL": 100.5}
+def _to_call_result(result: Any, wrap: bool) -> CallToolResult:
     """
-    # Use global app_context
-    if ctx: ctx.info("Fetching all mid prices")
-
-    # Note: This is NOT async in the tool class
-    result = app_context.market_tools.get_all_mids()
-    return result
+    Build the CallToolResult FastMCP would produce, but encode with orjson.
 
-
-@mcp.tool()
-async def get_l2_orderbook(
-    coin: str,
-    depth: int = 20,
-    ctx: Context = None
-) -> Dict[str, Any]:
+    Lists become one text block per item, matching FastMCP's own conversion;
+    non-object results are wrapped as {"result": ...} for structured output.
     """
-    Get Level 2 order book snapshot for a coin.
+    items = result if isinstance(result, (list, tuple)) else (result,)
+    return CallToolResult(
+        content=[TextContent(type="text", text=item if isinstance(item, str) else _dumps(item)) for item in items],
+        structuredContent={"result": result} if wrap else result
+    )
 
-    Args:
-        coin: Symbol to get order book for (e.g., "BTC", "ETH")
-        depth: Number of price levels per side (max 20)
 
-    Returns:
-        Order book with bids, asks, spread, volumes, and liquidity metrics
+async def _tool_log(ctx: Optional[Context], fmt: str, *args: Any) -> None:
     """
-    # Use global app_context
-    if ctx: ctx.info(f"Fetching L2 orderbook for {coin} (depth={depth})")
-
-    # Note: This is NOT async in the tool class
-    result = app_context.market_tools.get_l2_orderbook(coin, depth)
-    return result
-
+    Send a progress message to the MCP client.
 
-@mcp.tool()
-async def get_candles(
-    coin: str,
-    interval: str = "1h",
-    limit: int = 100,
-    ctx: Context = None
-) -> List[Dict[str, Any]]:
-    """
-    Get historical candle (OHLCV) data.
+    Client messages do not depend on this server's own log level. Without
+    a context the message goes to the local logger instead, formatted only
+    if INFO is enabled there.
 
     Args:
-        coin: Symbol to get candles for (e.g., "BTC", "ETH")
-        interval: Candle interval - "1m", "5m", "15m", "1h", "4h", "1d"
-        limit: Number of candles to return (max 5000)
-
-    Returns:
-        List of candles with timestamp, open, high, low, close, volume
-    """
-    # Use global app_context
-    if ctx: ctx.info(f"Fetching {limit} {interval} candles for {coin}")
-
-    # Note: This is NOT async in the tool class
-    result = app_context.market_tools.get_candles(coin, interval, limit)
-    return result
-
-
-@mcp.tool()
-async def get_recent_trades(
-    coin: str,
-    limit: int = 50,
-    ctx: Context = None
-) -> List[Dict[str, Any]]:
-    """
-    Get recent trades for a coin.
+        ctx: MCP request context (may be None)
+        fmt: %-style message template
+        *args: Values substituted into the template
+    """
+    if ctx is None:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(fmt, *args)
+        return
+    await ctx.info(fmt % args if args else fmt)
+
+
+# (group, method, is_async, log_fmt, log_args) - the tool name is the method
+# name; log_args maps the call arguments to the values for log_fmt
+TOOL_TABLE = [
+    # Trading tools (9 methods)
+    ("trading_tools", "place_order", True, _LOG_PLACE_ORDER,
+     lambda app, a: (_side(a), a["order_type"], a["size"], a["coin"], a["price"])),
+    ("trading_tools", "place_batch_orders", True, _LOG_PLACE_BATCH_ORDERS,
+     lambda app, a: (len(a["orders"]),)),
+    ("trading_tools", "cancel_order", True, _LOG_CANCEL_ORDER,
+     lambda app, a: (a["coin"], a["order_id"], a["cloid"])),
+    ("trading_tools", "cancel_all_orders", True, _LOG_CANCEL_ALL_ORDERS,
+     lambda app, a: (_where(a["coin"]) or " across all coins",)),
+    ("trading_tools", "modify_order", True, _LOG_MODIFY_ORDER,
+     lambda app, a: (a["order_id"], a["coin"], a["new_price"], a["new_size"])),
+    ("trading_tools", "place_twap_order", True, _LOG_PLACE_TWAP_ORDER,
+     lambda app, a: (a["total_size"], a["coin"], a["duration_minutes"])),
+    ("trading_tools", "adjust_leverage", True, _LOG_ADJUST_LEVERAGE,
+     lambda app, a: (a["coin"], a["leverage"], "cross" if a["is_cross"] else "isolated")),
+    ("trading_tools", "modify_isolated_margin", True, _LOG_MODIFY_ISOLATED_MARGIN,
+     lambda app, a: ("Adding" if a["is_add"] else "Removing", a["amount"], a["coin"])),
+    ("trading_tools", "update_dead_mans_switch", True, _LOG_UPDATE_DEAD_MANS_SWITCH,
+     lambda app, a: (a["delay_seconds"],)),
+
+    # Account tools (8 methods)
+    ("account_tools", "get_user_state", True, _LOG_GET_USER_STATE,
+     lambda app, a: (app.address_short,)),
+    ("account_tools", "get_open_orders", True, _LOG_GET_OPEN_ORDERS,
+     lambda app, a: (_where(a["coin"]),)),
+    ("account_tools", "get_positions", True, _LOG_GET_POSITIONS, None),
+    ("account_tools", "get_user_fills", True, _LOG_GET_USER_FILLS,
+     lambda app, a: (_where(a["coin"]), a["limit"])),
+    ("account_tools", "get_historical_orders", True, _LOG_GET_HISTORICAL_ORDERS,
+     lambda app, a: (_where(a["coin"]), a["limit"])),
+    ("account_tools", "get_portfolio_value", True, _LOG_GET_PORTFOLIO_VALUE, None),
+    ("account_tools", "get_subaccounts", True, _LOG_GET_SUBACCOUNTS, None),
+    ("account_tools", "get_rate_limit_status", True, _LOG_GET_RATE_LIMIT_STATUS, None),
+
+    # Market tools (7 methods)
+    ("market_tools", "get_all_mids", False, _LOG_GET_ALL_MIDS, None),
+    ("market_tools", "get_l2_orderbook", False, _LOG_GET_L2_ORDERBOOK,
+     lambda app, a: (a["coin"], a["depth"])),
+    ("market_tools", "get_candles", False, _LOG_GET_CANDLES,
+     lambda app, a: (a["limit"], a["interval"], a["coin"])),
+    ("market_tools", "get_recent_trades", False, _LOG_GET_RECENT_TRADES,
+     lambda app, a: (a["limit"], a["coin"])),
+    ("market_tools", "get_funding_rates", False, _LOG_GET_FUNDING_RATES, None),
+    ("market_tools", "get_asset_contexts", False, _LOG_GET_ASSET_CONTEXTS,
+     lambda app, a: (a["coin"],)),
+    ("market_tools", "get_asset_contexts_batch", False, _LOG_GET_ASSET_CONTEXTS_BATCH,
+     lambda app, a: (len(a["coins"]),)),
+]
+
+
+def _make_tool(
+    group: str,
+    method: str,
+    is_async: bool,
+    log_fmt: str,
+    log_args: Optional[Callable[[AppContext, Dict[str, Any]], tuple]]
+):
+    """
+    Build an MCP tool that forwards its arguments to <AppContext>.<group>.<method>.
+
+    The wrapper takes its name, docstring and parameters from the underlying
+    tool method, with the MCP Context appended, so FastMCP generates the same
+    schema a hand-written wrapper would.
 
     Args:
-        coin: Symbol to get trades for (e.g., "BTC", "ETH")
-        limit: Number of recent trades to return
-
-    Returns:
-        List of trades sorted by most recent first with price, size, side, timestamp
-    """
-    # Use global app_context
-    if ctx: ctx.info(f"Fetching {limit} recent trades for {coin}")
-
-    # Note: This is NOT async in the tool class
-    result = app_context.market_tools.get_recent_trades(coin, limit)
-    return result
-
-
-@mcp.tool()
-async def get_funding_rates(
-    ctx: Context = None
-) -> List[Dict[str, Any]]:
-    """
-    Get current funding rates for all perpetual contracts.
+        group: AppContext attribute holding the tool instance
+        method: Method name on that instance (also used as the tool name)
+        is_async: Whether the method must be awaited
+        log_fmt: %-style progress message sent to the client
+        log_args: Builds the log_fmt values from the AppContext and call arguments (None if
+            the message has no placeholders)
 
     Returns:
-        List of funding rates with:
-        - coin: Symbol
-        - funding_rate: Current funding rate (annualized %)
-        - next_funding_time: Next funding payment time
-        - mark_price, index_price, premium
-    """
-    # Use global app_context
-    if ctx: ctx.info("Fetching funding rates for all perpetuals")
-
-    # Note: This is NOT async in the tool class
-    result = app_context.market_tools.get_funding_rates()
-    return result
-
-
-@mcp.tool()
-async def get_asset_contexts(
-    coin: str,
-    ctx: Context = None
-) -> Dict[str, Any]:
-    """
-    Get comprehensive asset context and market conditions.
-
-    Args:
-        coin: Symbol to get context for (e.g., "BTC", "ETH")
+        Tool ready to pass to FastMCP(tools=...)
+    """
+    func = getattr(_TOOL_CLASSES[group], method)
+    sig = inspect.signature(func)
+    params = [p for name, p in sig.parameters.items() if name != "self"]
+    defaults = {p.name: p.default for p in params if p.default is not inspect.Parameter.empty}
+    needs_exchange = group == "trading_tools"
+    return_type = sig.return_annotation
+
+    @functools.wraps(func)
+    async def tool(*, ctx: ToolContext, **kwargs):
+        app = ctx.request_context.lifespan_context
+
+        args = log_args(app, {**defaults, **kwargs}) if log_args else ()
+        await _tool_log(ctx, log_fmt, *args)
+
+        if needs_exchange:
+            await app.wait_exchange()
+        else:
+            await app.wait_info()
+
+        bound = getattr(getattr(app, group), method)
+        if is_async:
+            result = await bound(**kwargs)
+            if needs_exchange:
+                # Orders, fills and positions may have changed
+                app.account_tools.invalidate_cache()
+        else:
+            # Synchronous SDK reads would otherwise block the event loop
+            result = await _run_sync(bound, **kwargs)
+        return _to_call_result(result, wrap_output)
+
+    ctx_param = inspect.Parameter("ctx", inspect.Parameter.KEYWORD_ONLY, annotation=ToolContext)
+    # Annotated[CallToolResult, T] keeps T as the advertised output schema
+    result_type = Annotated[CallToolResult, return_type]
+    tool.__signature__ = sig.replace(parameters=[*params, ctx_param], return_annotation=result_type)
+    tool.__annotations__ = {
+        **{k: v for k, v in func.__annotations__.items() if k != "self"},
+        "ctx": ToolContext,
+        "return": result_type,
+    }
+    # Build the Tool (and its pydantic schemas) exactly once; its metadata
+    # also says whether the result is advertised wrapped as {"result": ...}
+    registered = Tool.from_function(tool, name=method)
+    wrap_output = registered.fn_metadata.wrap_output
+    return registered
 
-    Returns:
-        Asset context including:
-        - mark_price, oracle_price, index_price
-        - funding_rate, open_interest, open_interest_usd
-        - volume_24h, trades_24h
-    """
-    # Use global app_context
-    if ctx: ctx.info(f"Fetching asset contexts for {coin}")
 
-    # Note: This is NOT async in the tool class
-    result = app_context.market_tools.get_asset_contexts(coin)
-    return result
+# Create MCP server
+mcp = FastMCP(
+    "hyperliquid-mcp-server",
+    dependencies=["hyperliquid-python-sdk", "eth-account", "python-dotenv", "orjson"],
+    lifespan=app_lifespan,
+    tools=[_make_tool(*row) for row in TOOL_TABLE]
+)
 
 
 # ============================================================================
 # WEBSOCKET TOOLS (4 methods)
 # ============================================================================
 
+# Encoded with orjson like the generated tools. FastMCP advertises a
+# Dict[str, Any] return wrapped as {"result": ...}, so wrap=True must match
+_DictToolResult = Annotated[CallToolResult, Dict[str, Any]]
+
+
 @mcp.tool()
 async def subscribe_user_events(
-    ctx: Context = None
-) -> Dict[str, Any]:
+    ctx: ToolContext
+) -> _DictToolResult:
     """
     Subscribe to user events (fills, funding, liquidations).
 
@@ -759,35 +484,33 @@ async def subscribe_user_events(
     Note:
         Requires WebSocket connection to be established first.
     """
-    # Use global app_context
-    if ctx: ctx.info(f"Subscribing to user events for {app_context.account_address[:8]}...")
+    app = ctx.request_context.lifespan_context
+    await _tool_log(ctx, _LOG_SUBSCRIBE_USER_EVENTS, app.address_short)
 
     try:
-        # Ensure WebSocket is started
-        if not app_context.websocket_tools.manager.connected:
-            await app_context.websocket_tools.start()
+        await app.websocket_tools.ensure_started()
 
-        subscription_id = await app_context.websocket_tools.subscribe_user_events()
+        subscription_id = await app.websocket_tools.subscribe_user_events()
 
-        return {
+        return _to_call_result({
             "success": True,
             "subscription_id": subscription_id,
             "subscription_type": "user_events",
-            "account": app_context.account_address
-        }
+            "account": app.account_address
+        }, wrap=True)
     except Exception as e:
-        return {
+        return _to_call_result({
             "success": False,
             "error": str(e)
-        }
+        }, wrap=True)
 
 
 @mcp.tool()
 async def subscribe_market_data(
     coin: str,
     data_types: List[str],
-    ctx: Context = None
-) -> Dict[str, Any]:
+    ctx: ToolContext
+) -> _DictToolResult:
     """
     Subscribe to market data streams.
 
@@ -801,36 +524,34 @@ async def subscribe_market_data(
     Note:
         Requires WebSocket connection to be established first.
     """
-    # Use global app_context
-    if ctx: ctx.info(f"Subscribing to market data for {coin}: {data_types}")
+    app = ctx.request_context.lifespan_context
+    await _tool_log(ctx, _LOG_SUBSCRIBE_MARKET_DATA, coin, data_types)
 
     try:
-        # Ensure WebSocket is started
-        if not app_context.websocket_tools.manager.connected:
-            await app_context.websocket_tools.start()
+        await app.websocket_tools.ensure_started()
 
-        subscription_ids = await app_context.websocket_tools.subscribe_market_data(
+        subscription_ids = await app.websocket_tools.subscribe_market_data(
             coin=coin,
             data_types=data_types
         )
 
-        return {
+        return _to_call_result({
             "success": True,
             "subscription_ids": subscription_ids,
             "coin": coin,
             "data_types": data_types
-        }
+        }, wrap=True)
     except Exception as e:
-        return {
+        return _to_call_result({
             "success": False,
             "error": str(e)
-        }
+        }, wrap=True)
 
 
 @mcp.tool()
 async def subscribe_order_updates(
-    ctx: Context = None
-) -> Dict[str, Any]:
+    ctx: ToolContext
+) -> _DictToolResult:
     """
     Subscribe to order updates and user fills.
 
@@ -841,33 +562,31 @@ async def subscribe_order_updates(
         Requires WebSocket connection to be established first.
         Subscribes to both orderUpdates and userFills channels.
     """
-    # Use global app_context
-    if ctx: ctx.info(f"Subscribing to order updates for {app_context.account_address[:8]}...")
+    app = ctx.request_context.lifespan_context
+    await _tool_log(ctx, _LOG_SUBSCRIBE_ORDER_UPDATES, app.address_short)
 
     try:
-        # Ensure WebSocket is started
-        if not app_context.websocket_tools.manager.connected:
-            await app_context.websocket_tools.start()
+        await app.websocket_tools.ensure_started()
 
-        subscription_ids = await app_context.websocket_tools.subscribe_order_updates()
+        subscription_ids = await app.websocket_tools.subscribe_order_updates()
 
-        return {
+        return _to_call_result({
             "success": True,
             "subscription_ids": subscription_ids,
             "subscription_types": ["order_updates", "user_fills"],
-            "account": app_context.account_address
-        }
+            "account": app.account_address
+        }, wrap=True)
     except Exception as e:
-        return {
+        return _to_call_result({
             "success": False,
             "error": str(e)
-        }
+        }, wrap=True)
 
 
 @mcp.tool()
 async def get_active_subscriptions(
-    ctx: Context = None
-) -> Dict[str, Any]:
+    ctx: ToolContext
+) -> _DictToolResult:
     """
     Get list of all active WebSocket subscriptions.
 
@@ -880,24 +599,24 @@ async def get_active_subscriptions(
         - messages_received: Number of messages received
         - subscribed_at: Subscription timestamp
     """
-    # Use global app_context
-    if ctx: ctx.info("Fetching active WebSocket subscriptions")
+    app = ctx.request_context.lifespan_context
+    await _tool_log(ctx, _LOG_GET_ACTIVE_SUBSCRIPTIONS)
 
     try:
-        subscriptions = app_context.websocket_tools.get_active_subscriptions()
-        connection_stats = app_context.websocket_tools.get_connection_stats()
+        subscriptions = app.websocket_tools.get_active_subscriptions()
+        connection_stats = app.websocket_tools.get_connection_stats()
 
-        return {
+        return _to_call_result({
             "success": True,
             "subscriptions": subscriptions,
             "connection_stats": connection_stats,
             "total_subscriptions": len(subscriptions)
-        }
+        }, wrap=True)
     except Exception as e:
-        return {
+        return _to_call_result({
             "success": False,
             "error": str(e)
-        }
+        }, wrap=True)
 
 
 # ============================================================================
@@ -910,70 +629,23 @@ def get_hyperliquid_config() -> str:
     return get_config_summary()
 
 
-@mcp.resource("guide://trading")
-def get_trading_guide() -> str:
-    """Guide for trading on Hyperliquid."""
-    return """Hyperliquid Trading Guide:
-
-## Order Types:
-- Market Order: Execute immediately at current market price
-- Limit Order: Execute at specific price or better
-- Reduce-Only: Only reduce existing position size
-
-## Position Management:
-- Long positions: Profit when price increases
-- Short positions: Profit when price decreases
-- Use stop-loss orders to manage risk
-- Monitor margin usage to avoid liquidation
-
-## Risk Management:
-- Never risk more than you can afford to lose
-- Use appropriate position sizing
-- Set stop-loss levels before entering trades
-- Monitor funding rates for perpetual contracts
-- Keep sufficient margin for volatile markets
-
-## Best Practices:
-1. Start with small position sizes
-2. Use limit orders to control execution price
-3. Monitor liquidation price on leveraged positions
-4. Keep track of funding rate costs
-5. Use the account state tool to monitor overall exposure
-"""
-
-
-@mcp.resource("guide://symbols")
-def get_symbols_guide() -> str:
-    """Guide to available trading symbols on Hyperliquid."""
-    return """Hyperliquid Trading Symbols:
-
-## Major Cryptocurrencies:
-- BTC - Bitcoin
-- ETH - Ethereum
-- SOL - Solana
-- AVAX - Avalanche
-- MATIC - Polygon
-
-## Order Size Guidelines:
-- Check minimum order size for each symbol
-- Use appropriate decimal precision
-- Consider liquidity before placing large orders
-
-## Price Precision:
-- Different symbols have different tick sizes
-- Limit prices must match the tick size
-- Use market data tools to check current precision
-
-## Trading Hours:
-- Hyperliquid operates 24/7
-- No trading halts or market closures
-- Funding occurs every 8 hours for perpetuals
-
-## Liquidity Considerations:
-- Check order book depth before large trades
-- Use limit orders for better execution
-- Consider market impact on large positions
-"""
+# The guides are literal text, so register them as static resources: reads
+# return the stored string with no handler call or cache lookup
+mcp.add_resource(TextResource(
+    uri="guide://trading",
+    name="get_trading_guide",
+    description="Guide for trading on Hyperliquid.",
+    mime_type="text/plain",
+    text=TRADING_GUIDE
+))
+
+mcp.add_resource(TextResource(
+    uri="guide://symbols",
+    name="get_symbols_guide",
+    description="Guide to available trading symbols on Hyperliquid.",
+    mime_type="text/plain",
+    text=SYMBOLS_GUIDE
+))
 
 
 # ============================================================================
@@ -981,5 +653,14 @@ def get_symbols_guide() -> str:
 # ============================================================================
 
 if __name__ == "__main__":
+    # Optional: uvloop's libuv event loop speeds up the WebSocket listen loop
+    # and socket I/O; mcp.run() creates its loop through the installed policy
+    try:
+        import uvloop
+        uvloop.install()
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+
     logger.info("Starting Hyperliquid MCP Server with stdio transport...")
     mcp.run(transport='stdio')
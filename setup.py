@@ -9,7 +9,7 @@ import sys
 import subprocess
 import json
 import shutil
-from pathlib import Path
+from typing import Final
 
 # ANSI color codes for terminal output
 class Colors:
@@ -23,6 +23,18 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Startup banner, rendered once at import with the color codes already applied
+_BANNER: Final[str] = "".join([
+    f"\n{Colors.BOLD}{Colors.HEADER}\n",
+    "╔════════════════════════════════════════════════════════════╗\n",
+    "║                                                            ║\n",
+    "║        Hyperliquid MCP Server Setup                        ║\n",
+    "║        Complete Trading Integration for Claude             ║\n",
+    "║                                                            ║\n",
+    "╚════════════════════════════════════════════════════════════╝\n",
+    f"{Colors.ENDC}\n\n",
+])
+
 def print_header(message):
     print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}")
     print(f"{Colors.HEADER}{Colors.BOLD}{message}{Colors.ENDC}")
@@ -41,71 +53,86 @@ def print_info(message):
     print(f"{Colors.OKCYAN}ℹ {message}{Colors.ENDC}")
 
 def check_python_version():
-    """Ensure Python 3.8+ is being used"""
+    """Ensure Python 3.10+ is being used"""
     print_header("Checking Python Version")
 
-    if sys.version_info < (3, 8):
-        print_error(f"Python 3.8+ required. Current version: {sys.version}")
+    if sys.version_info < (3, 10):
+        print_error(f"Python 3.10+ required. Current version: {sys.version}")
         sys.exit(1)
 
     print_success(f"Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro} detected")
 
-def create_virtual_environment():
+def create_virtual_environment(root):
     """Create Python virtual environment"""
     print_header("Creating Virtual Environment")
 
-    venv_path = Path("venv")
+    venv_dir = os.path.join(root, "venv")
 
-    if venv_path.exists():
+    if os.path.exists(venv_dir):
         print_warning("Virtual environment already exists, skipping creation")
         return
 
     try:
-        subprocess.run([sys.executable, "-m", "venv", "venv"], check=True)
+        subprocess.run([sys.executable, "-m", "venv", venv_dir], check=True)
         print_success("Virtual environment created at ./venv")
     except subprocess.CalledProcessError as e:
         print_error(f"Failed to create virtual environment: {e}")
         sys.exit(1)
 
-def install_dependencies():
+def _pip_needs_upgrade(pip_path):
+    """Return True if the venv's pip is older than 24"""
+    try:
+        out = subprocess.run([pip_path, "--version"], check=True,
+                             capture_output=True, text=True).stdout
+        return int(out.split()[1].split(".")[0]) < 24
+    except (subprocess.CalledProcessError, IndexError, ValueError):
+        return True
+
+def install_dependencies(venv_python):
     """Install Python dependencies from requirements.txt"""
     print_header("Installing Dependencies")
 
-    pip_path = Path("venv/bin/pip")
-    if not pip_path.exists():
-        pip_path = Path("venv/Scripts/pip.exe")  # Windows
+    pip_path = os.path.join(os.path.dirname(venv_python), "pip.exe" if os.name == "nt" else "pip")
 
-    if not pip_path.exists():
+    if not os.path.exists(pip_path):
         print_error("Could not find pip in virtual environment")
         sys.exit(1)
 
     try:
-        print_info("Upgrading pip...")
-        subprocess.run([str(pip_path), "install", "--upgrade", "pip"], check=True)
-
-        print_info("Installing requirements...")
-        subprocess.run([str(pip_path), "install", "-r", "requirements.txt"], check=True)
+        # uv resolves and installs much faster than pip; use it when available
+        if shutil.which("uv"):
+            print_info("Installing requirements with uv...")
+            subprocess.run(["uv", "pip", "install", "--python", venv_python,
+                            "-r", "requirements.txt"], check=True)
+        else:
+            if _pip_needs_upgrade(pip_path):
+                print_info("Upgrading pip...")
+                subprocess.run([pip_path, "install", "--upgrade", "pip"], check=True)
+
+            print_info("Installing requirements...")
+            subprocess.run([pip_path, "install", "--no-compile", "--prefer-binary",
+                            "-r", "requirements.txt"], check=True)
 
         print_success("All dependencies installed successfully")
     except subprocess.CalledProcessError as e:
         print_error(f"Failed to install dependencies: {e}")
         sys.exit(1)
 
-def setup_environment_file():
+def setup_environment_file(root):
     """Copy .env.example to .env if it doesn't exist"""
     print_header("Setting Up Environment Variables")
 
-    env_file = Path(".env")
-    env_example = Path(".env.example")
+    env_file = os.path.join(root, ".env")
+    env_example = os.path.join(root, ".env.example")
 
-    if env_file.exists():
+    if os.path.exists(env_file):
         print_warning(".env file already exists, skipping creation")
         print_info("Please ensure your .env file has the required variables:")
         print("  - HYPERLIQUID_PRIVATE_KEY")
         print("  - HYPERLIQUID_ACCOUNT_ADDRESS")
         return
 
-    if not env_example.exists():
+    if not os.path.exists(env_example):
         print_error(".env.example not found")
         sys.exit(1)
 
@@ -113,24 +140,27 @@ def setup_environment_file():
     print_success(".env file created from .env.example")
     print_warning("IMPORTANT: Edit .env and add your Hyperliquid credentials!")
 
-def generate_claude_config():
+def _write_json_atomic(path, data):
+    """Write data as JSON to a temp file next to path, then rename it into place"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+def generate_claude_config(root, venv_python, server_path):
     """Generate claude_desktop_config.json"""
     print_header("Generating Claude Desktop Configuration")
 
-    project_path = Path.cwd().absolute()
-    venv_python = project_path / "venv" / "bin" / "python"
-    server_path = project_path / "server.py"
-
     # Check if server.py exists
-    if not server_path.exists():
+    if not os.path.exists(server_path):
         print_error("server.py not found in project directory")
         sys.exit(1)
 
     config = {
         "mcpServers": {
             "hyperliquid-mcp-server": {
-                "command": str(venv_python),
-                "args": [str(server_path)],
+                "command": venv_python,
+                "args": [server_path],
                 "env": {
                     "HYPERLIQUID_PRIVATE_KEY": "${HYPERLIQUID_PRIVATE_KEY}",
                     "HYPERLIQUID_ACCOUNT_ADDRESS": "${HYPERLIQUID_ACCOUNT_ADDRESS}",
@@ -141,61 +171,54 @@ def generate_claude_config():
         }
     }
 
-    config_path = project_path / "claude_desktop_config.json"
-
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
+    config_path = os.path.join(root, "claude_desktop_config.json")
+    _write_json_atomic(config_path, config)
 
     print_success(f"Configuration generated at {config_path}")
 
-def update_claude_desktop_config():
+def update_claude_desktop_config(root):
     """Update Claude Desktop's global configuration"""
     print_header("Updating Claude Desktop Configuration")
 
     # Claude Desktop config path on macOS
-    claude_config_dir = Path.home() / "Library" / "Application Support" / "Claude"
-    claude_config_path = claude_config_dir / "claude_desktop_config.json"
+    claude_config_dir = os.path.join(os.path.expanduser("~"), "Library", "Application Support", "Claude")
+    claude_config_path = os.path.join(claude_config_dir, "claude_desktop_config.json")
 
-    if not claude_config_dir.exists():
+    if not os.path.exists(claude_config_dir):
         print_warning("Claude Desktop config directory not found")
         print_info("You may need to manually install the MCP server configuration")
         print_info(f"Copy claude_desktop_config.json to: {claude_config_path}")
         return
 
-    project_path = Path.cwd().absolute()
-    local_config_path = project_path / "claude_desktop_config.json"
+    local_config_path = os.path.join(root, "claude_desktop_config.json")
 
-    if not local_config_path.exists():
+    if not os.path.exists(local_config_path):
         print_error("Local claude_desktop_config.json not found")
         return
 
     # Read local config
-    with open(local_config_path, "r") as f:
+    with open(local_config_path, "rb") as f:
         new_server_config = json.load(f)
 
-    # Read or create Claude Desktop config
-    if claude_config_path.exists():
-        with open(claude_config_path, "r") as f:
-            claude_config = json.load(f)
-    else:
-        claude_config = {"mcpServers": {}}
-
-    # Ensure mcpServers exists
-    if "mcpServers" not in claude_config:
-        claude_config["mcpServers"] = {}
+    # Read or create Claude Desktop config, keeping the original bytes for the backup
+    orig_bytes = None
+    if os.path.exists(claude_config_path):
+        with open(claude_config_path, "rb") as f:
+            orig_bytes = f.read()
+    claude_config = json.loads(orig_bytes) if orig_bytes is not None else {"mcpServers": {}}
 
-    # Update with new server
-    claude_config["mcpServers"].update(new_server_config["mcpServers"])
+    # Ensure mcpServers exists and update with new server
+    claude_config.setdefault("mcpServers", {}).update(new_server_config["mcpServers"])
 
     # Backup existing config
-    if claude_config_path.exists():
-        backup_path = claude_config_path.with_suffix(".json.backup")
-        shutil.copy(claude_config_path, backup_path)
+    if orig_bytes is not None:
+        backup_path = claude_config_path + ".backup"
+        with open(backup_path, "wb") as f:
+            f.write(orig_bytes)
         print_info(f"Backup created at {backup_path}")
 
     # Write updated config
-    with open(claude_config_path, "w") as f:
-        json.dump(claude_config, f, indent=2)
+    _write_json_atomic(claude_config_path, claude_config)
 
     print_success(f"Claude Desktop config updated at {claude_config_path}")
     print_warning("Please restart Claude Desktop to load the new MCP server")
@@ -212,48 +235,55 @@ def print_next_steps():
     """Print next steps for the user"""
     print_header("Setup Complete!")
 
-    print(f"{Colors.OKGREEN}{Colors.BOLD}Next Steps:{Colors.ENDC}\n")
+    parts = []
+
+    parts.append(f"{Colors.OKGREEN}{Colors.BOLD}Next Steps:{Colors.ENDC}\n\n")
 
-    print(f"{Colors.BOLD}1. Configure your credentials:{Colors.ENDC}")
-    print(f"   Edit {Colors.OKCYAN}.env{Colors.ENDC} and add:")
-    print(f"   - HYPERLIQUID_PRIVATE_KEY (your Ethereum private key)")
-    print(f"   - HYPERLIQUID_ACCOUNT_ADDRESS (your wallet address)\n")
+    parts.append(f"{Colors.BOLD}1. Configure your credentials:{Colors.ENDC}\n")
+    parts.append(f"   Edit {Colors.OKCYAN}.env{Colors.ENDC} and add:\n")
+    parts.append(f"   - HYPERLIQUID_PRIVATE_KEY (your Ethereum private key)\n")
+    parts.append(f"   - HYPERLIQUID_ACCOUNT_ADDRESS (your wallet address)\n\n")
 
-    print(f"{Colors.BOLD}2. Test the MCP server:{Colors.ENDC}")
-    print(f"   {Colors.OKCYAN}mcp dev server.py{Colors.ENDC}\n")
+    parts.append(f"{Colors.BOLD}2. Test the MCP server:{Colors.ENDC}\n")
+    parts.append(f"   {Colors.OKCYAN}mcp dev server.py{Colors.ENDC}\n\n")
 
-    print(f"{Colors.BOLD}3. Restart Claude Desktop:{Colors.ENDC}")
-    print(f"   Quit and reopen Claude Desktop to load the MCP server\n")
+    parts.append(f"{Colors.BOLD}3. Restart Claude Desktop:{Colors.ENDC}\n")
+    parts.append(f"   Quit and reopen Claude Desktop to load the MCP server\n\n")
 
-    print(f"{Colors.BOLD}4. Verify in Claude:{Colors.ENDC}")
-    print(f"   Ask: {Colors.OKCYAN}\"What Hyperliquid tools do you have available?\"{Colors.ENDC}\n")
+    parts.append(f"{Colors.BOLD}4. Verify in Claude:{Colors.ENDC}\n")
+    parts.append(f"   Ask: {Colors.OKCYAN}\"What Hyperliquid tools do you have available?\"{Colors.ENDC}\n\n")
 
-    print(f"{Colors.BOLD}5. Start trading:{Colors.ENDC}")
-    print(f"   Example: {Colors.OKCYAN}\"Show me my current positions on Hyperliquid\"{Colors.ENDC}\n")
+    parts.append(f"{Colors.BOLD}5. Start trading:{Colors.ENDC}\n")
+    parts.append(f"   Example: {Colors.OKCYAN}\"Show me my current positions on Hyperliquid\"{Colors.ENDC}\n\n")
 
-    print(f"{Colors.WARNING}{Colors.BOLD}Security Reminder:{Colors.ENDC}")
-    print(f"   - Never commit your {Colors.FAIL}.env{Colors.ENDC} file")
-    print(f"   - Keep your private key secure")
-    print(f"   - Use testnet for development\n")
+    parts.append(f"{Colors.WARNING}{Colors.BOLD}Security Reminder:{Colors.ENDC}\n")
+    parts.append(f"   - Never commit your {Colors.FAIL}.env{Colors.ENDC} file\n")
+    parts.append(f"   - Keep your private key secure\n")
+    parts.append(f"   - Use testnet for development\n\n")
+
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
 
 def main():
     """Main setup function"""
-    print(f"\n{Colors.BOLD}{Colors.HEADER}")
-    print("╔════════════════════════════════════════════════════════════╗")
-    print("║                                                            ║")
-    print("║        Hyperliquid MCP Server Setup                        ║")
-    print("║        Complete Trading Integration for Claude             ║")
-    print("║                                                            ║")
-    print("╚════════════════════════════════════════════════════════════╝")
-    print(f"{Colors.ENDC}\n")
+    sys.stdout.write(_BANNER)
+    sys.stdout.flush()
+
+    # Resolve the project paths once and pass them to each step
+    root = os.path.abspath(os.getcwd())
+    if os.name == "nt":
+        venv_python = os.path.join(root, "venv", "Scripts", "python.exe")
+    else:
+        venv_python = os.path.join(root, "venv", "bin", "python")
+    server_path = os.path.join(root, "server.py")
 
     try:
         check_python_version()
-        create_virtual_environment()
-        install_dependencies()
-        setup_environment_file()
-        generate_claude_config()
-        update_claude_desktop_config()
+        create_virtual_environment(root)
+        install_dependencies(venv_python)
+        setup_environment_file(root)
+        generate_claude_config(root, venv_python, server_path)
+        update_claude_desktop_config(root)
         test_mcp_server()
         print_next_steps()
 
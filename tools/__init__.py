@@ -1,12 +1,45 @@
-"""Tools package for Hyperliquid MCP Server."""
-from .trading_tools import TradingTools
-from .account_tools import AccountTools
-from .market_tools import MarketTools
-from .websocket_tools import WebSocketTools
-
-__all__ = [
-    'TradingTools',
-    'AccountTools',
-    'MarketTools',
-    'WebSocketTools'
-]
+"""
+Tools package for Hyperliquid MCP Server.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+the package does not pull in the Hyperliquid SDK or websockets until a tool
+class is actually needed.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .trading_tools import TradingTools, OrderResult
+    from .account_tools import AccountTools, Position, PositionsResult, PositionsSummary
+    from .market_tools import MarketTools, OrderBookSnapshot
+    from .websocket_tools import WebSocketTools
+    from .rate_limit import RateLimitGovernor
+
+# Public name -> submodule that defines it
+_LAZY = {
+    'TradingTools': '.trading_tools',
+    'AccountTools': '.account_tools',
+    'MarketTools': '.market_tools',
+    'WebSocketTools': '.websocket_tools',
+    'OrderResult': '.trading_tools',
+    'Position': '.account_tools',
+    'PositionsResult': '.account_tools',
+    'PositionsSummary': '.account_tools',
+    'OrderBookSnapshot': '.market_tools',
+    'RateLimitGovernor': '.rate_limit',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value  # later lookups bypass __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY])
+
+
+__all__ = list(_LAZY)
@@ -0,0 +1,66 @@
+"""
+Shared static text for the Hyperliquid MCP Server.
+
+Long literals served to clients (resource bodies) live here once, so every
+module that needs them references the same string objects.
+"""
+
+from typing import Final
+
+TRADING_GUIDE: Final[str] = """Hyperliquid Trading Guide:
+
+## Order Types:
+- Market Order: Execute immediately at current market price
+- Limit Order: Execute at specific price or better
+- Reduce-Only: Only reduce existing position size
+
+## Position Management:
+- Long positions: Profit when price increases
+- Short positions: Profit when price decreases
+- Use stop-loss orders to manage risk
+- Monitor margin usage to avoid liquidation
+
+## Risk Management:
+- Never risk more than you can afford to lose
+- Use appropriate position sizing
+- Set stop-loss levels before entering trades
+- Monitor funding rates for perpetual contracts
+- Keep sufficient margin for volatile markets
+
+## Best Practices:
+1. Start with small position sizes
+2. Use limit orders to control execution price
+3. Monitor liquidation price on leveraged positions
+4. Keep track of funding rate costs
+5. Use the account state tool to monitor overall exposure
+"""
+
+SYMBOLS_GUIDE: Final[str] = """Hyperliquid Trading Symbols:
+
+## Major Cryptocurrencies:
+- BTC - Bitcoin
+- ETH - Ethereum
+- SOL - Solana
+- AVAX - Avalanche
+- MATIC - Polygon
+
+## Order Size Guidelines:
+- Check minimum order size for each symbol
+- Use appropriate decimal precision
+- Consider liquidity before placing large orders
+
+## Price Precision:
+- Different symbols have different tick sizes
+- Limit prices must match the tick size
+- Use market data tools to check current precision
+
+## Trading Hours:
+- Hyperliquid operates 24/7
+- No trading halts or market closures
+- Funding occurs every 8 hours for perpetuals
+
+## Liquidity Considerations:
+- Check order book depth before large trades
+- Use limit orders for better execution
+- Consider market impact on large positions
+"""
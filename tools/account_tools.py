@@ -9,12 +9,193 @@ This module provides comprehensive account querying capabilities including:
 - Rate limit monitoring
 """
 
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, AsyncIterator, Awaitable, Callable, Hashable, Tuple, Union
 from datetime import datetime, timezone
+from operator import itemgetter
+import asyncio
+import functools
+import heapq
+from itertools import groupby
 import logging
+import time
+
+from typing_extensions import TypedDict
+
+from .rate_limit import RateLimitGovernor
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+# user_state fields read by more than one parser
+_K_ASSET_POSITIONS = "assetPositions"
+_K_POSITION = "position"
+_K_SZI = "szi"
+
+_by_timestamp = itemgetter("timestamp")
+_by_order_id = itemgetter("order_id")
+
+
+def _safe_float(value: Any, default: float = 0.0) -> float:
+    """
+    Safely convert value to float.
+
+    Numbers are returned without going through the try/except path; the SDK
+    mostly returns numeric strings, which fall through to float().
+
+    Args:
+        value: Value to convert
+        default: Default value if conversion fails
+
+    Returns:
+        Float value or default
+    """
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+
+async def _dedupe(
+    key: Hashable,
+    fetch: Callable[[], Awaitable[Any]],
+    inflight: Dict[Hashable, asyncio.Future]
+) -> Any:
+    """
+    Coalesce concurrent calls for the same key into one upstream request.
+
+    The first caller starts `fetch` as its own task; every caller, the
+    first included, awaits that task through asyncio.shield. Cancelling
+    any caller therefore never cancels the shared fetch or the other
+    callers waiting on it.
+
+    Args:
+        key: Identifies the request being shared
+        fetch: Coroutine function producing the result
+        inflight: Map of pending tasks the key is registered in
+
+    Returns:
+        The result of the shared fetch
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        inflight[key] = task
+
+        def _done(finished: asyncio.Future) -> None:
+            if inflight.get(key) is finished:
+                del inflight[key]
+            if not finished.cancelled():
+                finished.exception()  # mark retrieved when every caller was cancelled
+
+        task.add_done_callback(_done)
+
+    return await asyncio.shield(task)
+
+
+# Response timestamps only mark when a result was produced, so one ISO
+# string is shared for up to _NOW_ISO_TTL seconds
+_NOW_ISO_TTL = 0.1
+_now_iso_cache: Tuple[float, str] = (float("-inf"), "")
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string, refreshed every 100 ms."""
+    global _now_iso_cache
+    now = time.monotonic()
+    if now - _now_iso_cache[0] > _NOW_ISO_TTL:
+        _now_iso_cache = (now, datetime.now(_UTC).isoformat())
+    return _now_iso_cache[1]
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp_cached(timestamp_ms: int) -> str:
+    """
+    Convert millisecond timestamp to human-readable format.
+
+    Cached because batched fills and orders placed together share the same
+    millisecond timestamp.
+
+    Args:
+        timestamp_ms: Unix timestamp in milliseconds
+
+    Returns:
+        ISO 8601 formatted datetime string
+    """
+    try:
+        dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=_UTC)
+        return dt.isoformat()
+    except Exception as e:
+        logger.warning(f"Failed to format timestamp {timestamp_ms}: {e}")
+        return str(timestamp_ms)
+
+
+class Position(TypedDict):
+    """A single open perpetual position."""
+    coin: str
+    side: str
+    size: float
+    entry_price: float
+    position_value: float
+    unrealized_pnl: float
+    leverage: float
+    margin_used: float
+    roe_pct: float
+    liquidation_price: float
+
+
+class PositionsSummary(TypedDict):
+    """Open positions with account-level totals."""
+    positions: List[Position]
+    total_positions: int
+    total_unrealized_pnl: float
+    total_position_value: float
+    average_roe_pct: float
+
+
+class PositionsResult(TypedDict):
+    """Result of get_positions."""
+    success: bool
+    data: Optional[PositionsSummary]
+    error: Optional[str]
+
+
+class Fill(TypedDict):
+    """A single formatted trade fill."""
+    trade_id: Any
+    order_id: Any
+    coin: str
+    side: Optional[str]
+    size: float
+    price: float
+    fee: float
+    fee_token: str
+    closed_pnl: float
+    timestamp: Union[str, int]  # ISO 8601, or milliseconds when left unformatted
+    trade_value: float
+    start_position: float
+
+
+class OpenOrder(TypedDict):
+    """A single formatted open order."""
+    order_id: Any
+    coin: str
+    side: Optional[str]
+    size: float
+    price: float
+    filled_size: float
+    remaining_size: float
+    order_type: Any
+    reduce_only: bool
+    timestamp: Union[str, int]  # ISO 8601, or milliseconds when left unformatted
+    original_size: float
+
 
 class AccountTools:
     """
@@ -24,49 +205,85 @@ class AccountTools:
     and portfolio analytics with proper error handling and formatting.
     """
 
-    def __init__(self, info_client, account_address: str):
+    def __init__(self, info_client, account_address: str, governor: Optional[RateLimitGovernor] = None):
         """
         Initialize AccountTools with Hyperliquid Info client.
 
         Args:
             info_client: Hyperliquid Info API client instance
             account_address: Ethereum address of the account to query
+            governor: Rate limit governor shared with the other tools; a
+                private one is created if omitted
         """
         self.info = info_client
         self.account = account_address
+        self.governor = governor or RateLimitGovernor()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._cache_generation = 0
 
-    def _format_timestamp(self, timestamp_ms: int) -> str:
+    async def _single_flight(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Coalesce concurrent calls for `key` on this instance (see _dedupe)."""
+        return await _dedupe(key, fetch, self._inflight)
+
+    async def _cached(self, key: str, ttl: float, fetch: Callable[[], Any]) -> Any:
         """
-        Convert millisecond timestamp to human-readable format.
+        Return a recent result of a blocking Info call, fetching it if needed.
+
+        A result younger than `ttl` seconds is reused; otherwise `fetch` runs
+        in a worker thread, with concurrent callers sharing one request. The
+        rate limit governor may delay the fetch, or serve an older result
+        when usage is critical.
 
         Args:
-            timestamp_ms: Unix timestamp in milliseconds
+            key: Cache key for the call
+            ttl: Seconds a fetched result may be reused
+            fetch: Blocking callable performing the Info request
 
         Returns:
-            ISO 8601 formatted datetime string
+            The cached or freshly fetched result
         """
-        try:
-            dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-            return dt.isoformat()
-        except Exception as e:
-            logger.warning(f"Failed to format timestamp {timestamp_ms}: {e}")
-            return str(timestamp_ms)
+        entry = self._cache.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < ttl or self.governor.serve_stale(age):
+                return entry[1]
+
+        async def load() -> Any:
+            generation = self._cache_generation
+            await self.governor.acquire()
+            value = await asyncio.to_thread(fetch)
+            # Don't store a result that was in flight across invalidate_cache()
+            if generation == self._cache_generation:
+                self._cache[key] = (time.monotonic(), value)
+            return value
+
+        return await self._single_flight(f"cached:{key}", load)
+
+    def invalidate_cache(self) -> None:
+        """
+        Drop cached Info results.
 
-    def _safe_float(self, value: Any, default: float = 0.0) -> float:
+        Called after trading actions so the next account query reflects the
+        new orders, fills and positions.
         """
-        Safely convert value to float.
+        self._cache.clear()
+        self._cache_generation += 1
+
+    async def _cached_user_state(self, ttl: float = 1.0) -> Any:
+        """
+        Fetch the raw clearinghouse state, shared across tools.
+
+        get_user_state(), get_positions() and get_portfolio_value() read the
+        same state, so they cost a single round trip between them.
 
         Args:
-            value: Value to convert
-            default: Default value if conversion fails
+            ttl: Seconds a fetched state may be reused
 
         Returns:
-            Float value or default
+            Raw response of info.user_state() for this account
         """
-        try:
-            return float(value) if value is not None else default
-        except (ValueError, TypeError):
-            return default
+        return await self._cached("user_state", ttl, lambda: self.info.user_state(self.account))
 
     async def get_user_state(self) -> Dict[str, Any]:
         """
@@ -84,8 +301,12 @@ class AccountTools:
                     - margin_summary: Margin utilization details
                 - error: Error message if failed
         """
+        return await self._single_flight("user_state", self._get_user_state)
+
+    async def _get_user_state(self) -> Dict[str, Any]:
+        """Uncoalesced implementation of get_user_state()."""
         try:
-            user_state = self.info.user_state(self.account)
+            user_state = await self._cached_user_state()
 
             if not user_state:
                 return {
@@ -96,20 +317,25 @@ class AccountTools:
 
             # Extract margin summary
             margin_summary = user_state.get("marginSummary", {})
-            account_value = self._safe_float(margin_summary.get("accountValue"))
-            total_margin_used = self._safe_float(margin_summary.get("totalMarginUsed"))
-            withdrawable = self._safe_float(user_state.get("withdrawable"))
+            account_value = _safe_float(margin_summary.get("accountValue"))
+            total_margin_used = _safe_float(margin_summary.get("totalMarginUsed"))
+            withdrawable = _safe_float(user_state.get("withdrawable"))
 
-            # Parse asset positions (balances)
+            # Parse asset positions (balances), skipping zero-size entries
             asset_positions = []
-            for asset in user_state.get("assetPositions", []):
-                position_data = asset.get("position", {})
+            _f = _safe_float
+            for asset in user_state.get(_K_ASSET_POSITIONS, []):
+                position_data = asset.get(_K_POSITION, {})
+                get = position_data.get
+                # Same test as get_positions, so "0.00", "-0.0" etc. are skipped too
+                if _f(get(_K_SZI)) == 0:
+                    continue
                 asset_positions.append({
-                    "coin": position_data.get("coin", "Unknown"),
-                    "entry_price": self._safe_float(position_data.get("entryPx")),
-                    "position_value": self._safe_float(position_data.get("positionValue")),
-                    "unrealized_pnl": self._safe_float(position_data.get("unrealizedPnl")),
-                    "return_on_equity": self._safe_float(position_data.get("returnOnEquity")),
+                    "coin": get("coin", "Unknown"),
+                    "entry_price": _f(get("entryPx")),
+                    "position_value": _f(get("positionValue")),
+                    "unrealized_pnl": _f(get("unrealizedPnl")),
+                    "return_on_equity": _f(get("returnOnEquity")),
                 })
 
             # Extract cross margin summary
@@ -124,11 +350,11 @@ class AccountTools:
                 "balances": asset_positions,
                 "positions_count": len(asset_positions),
                 "margin_summary": {
-                    "total_raw_usd": self._safe_float(margin_summary.get("totalRawUsd")),
-                    "total_ntl_pos": self._safe_float(margin_summary.get("totalNtlPos")),
-                    "cross_maintenance_margin": self._safe_float(cross_margin.get("crossMaintenanceMarginUsed"))
+                    "total_raw_usd": _safe_float(margin_summary.get("totalRawUsd")),
+                    "total_ntl_pos": _safe_float(margin_summary.get("totalNtlPos")),
+                    "cross_maintenance_margin": _safe_float(cross_margin.get("crossMaintenanceMarginUsed"))
                 },
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": _now_iso()
             }
 
             return {
@@ -159,7 +385,7 @@ class AccountTools:
                 - error: Error message if failed
         """
         try:
-            open_orders = self.info.open_orders(self.account)
+            open_orders = await self._cached("open_orders", 1.0, lambda: self.info.open_orders(self.account))
 
             if not open_orders:
                 return {
@@ -172,30 +398,13 @@ class AccountTools:
                     "error": None
                 }
 
-            formatted_orders = []
-            for order in open_orders:
-                order_coin = order.get("coin", "")
+            formatted_orders = self._format_open_orders(open_orders, coin, format_timestamps=False)
 
-                # Filter by coin if specified
-                if coin and order_coin.upper() != coin.upper():
-                    continue
-
-                formatted_orders.append({
-                    "order_id": order.get("oid"),
-                    "coin": order_coin,
-                    "side": order.get("side"),
-                    "size": self._safe_float(order.get("sz")),
-                    "price": self._safe_float(order.get("limitPx")),
-                    "filled_size": self._safe_float(order.get("szFilled", 0)),
-                    "remaining_size": self._safe_float(order.get("sz")) - self._safe_float(order.get("szFilled", 0)),
-                    "order_type": order.get("orderType", "limit"),
-                    "reduce_only": order.get("reduceOnly", False),
-                    "timestamp": self._format_timestamp(order.get("timestamp", 0)),
-                    "original_size": self._safe_float(order.get("origSz"))
-                })
-
-            # Sort by timestamp (newest first)
-            formatted_orders.sort(key=lambda x: x["timestamp"], reverse=True)
+            # Sort by timestamp (newest first) on the integer milliseconds,
+            # then format; the API does not document an ordering
+            formatted_orders.sort(key=_by_timestamp, reverse=True)
+            for order in formatted_orders:
+                order["timestamp"] = _format_timestamp_cached(order["timestamp"])
 
             return {
                 "success": True,
@@ -215,7 +424,54 @@ class AccountTools:
                 "error": f"Failed to get open orders: {str(e)}"
             }
 
-    async def get_positions(self) -> Dict[str, Any]:
+    def _format_open_orders(
+        self,
+        open_orders: List[Dict[str, Any]],
+        coin: Optional[str] = None,
+        format_timestamps: bool = True
+    ) -> List[OpenOrder]:
+        """
+        Format raw open orders, optionally filtered by coin, in API order.
+
+        Args:
+            open_orders: Raw response of info.open_orders()
+            coin: Optional coin symbol to filter orders
+            format_timestamps: If False, "timestamp" is left as integer milliseconds
+
+        Returns:
+            List of formatted orders (see get_open_orders)
+        """
+        formatted_orders = []
+        _f = _safe_float
+        coin_norm = coin.upper() if coin else None
+        for order in open_orders:
+            order_coin = order.get("coin", "")
+
+            # Filter by coin if specified
+            if coin_norm is not None and order_coin.upper() != coin_norm:
+                continue
+
+            size = _f(order.get("sz"))
+            filled_size = _f(order.get("szFilled", 0))
+            timestamp = order.get("timestamp", 0)
+
+            formatted_orders.append({
+                "order_id": order.get("oid"),
+                "coin": order_coin,
+                "side": order.get("side"),
+                "size": size,
+                "price": _f(order.get("limitPx")),
+                "filled_size": filled_size,
+                "remaining_size": size - filled_size,
+                "order_type": order.get("orderType", "limit"),
+                "reduce_only": order.get("reduceOnly", False),
+                "timestamp": _format_timestamp_cached(timestamp) if format_timestamps else timestamp,
+                "original_size": _f(order.get("origSz"))
+            })
+
+        return formatted_orders
+
+    async def get_positions(self) -> PositionsResult:
         """
         Get all open positions with detailed metrics.
 
@@ -229,7 +485,7 @@ class AccountTools:
                 - error: Error message if failed
         """
         try:
-            user_state = self.info.user_state(self.account)
+            user_state = await self._cached_user_state()
 
             if not user_state:
                 return {
@@ -242,23 +498,26 @@ class AccountTools:
             total_unrealized_pnl = 0.0
             total_position_value = 0.0
 
-            for asset in user_state.get("assetPositions", []):
-                position = asset.get("position", {})
+            _f = _safe_float
+            for asset in user_state.get(_K_ASSET_POSITIONS, []):
+                position = asset.get(_K_POSITION, {})
+                get = position.get
 
                 # Get position size
-                size = self._safe_float(position.get("szi"))
+                size = _f(get(_K_SZI))
 
                 # Skip if no position
                 if size == 0:
                     continue
 
-                coin = position.get("coin", "Unknown")
-                entry_price = self._safe_float(position.get("entryPx"))
-                position_value = self._safe_float(position.get("positionValue"))
-                unrealized_pnl = self._safe_float(position.get("unrealizedPnl"))
-                leverage = self._safe_float(position.get("leverage", {}).get("value", 1))
-                margin_used = self._safe_float(position.get("marginUsed"))
-                roe = self._safe_float(position.get("returnOnEquity")) * 100  # Convert to percentage
+                coin = get("coin", "Unknown")
+                entry_price = _f(get("entryPx"))
+                position_value = _f(get("positionValue"))
+                unrealized_pnl = _f(get("unrealizedPnl"))
+                lev = get("leverage")
+                leverage = _f(lev.get("value", 1)) if lev else 1.0
+                margin_used = _f(get("marginUsed"))
+                roe = _f(get("returnOnEquity")) * 100  # Convert to percentage
 
                 total_unrealized_pnl += unrealized_pnl
                 total_position_value += abs(position_value)
@@ -273,7 +532,7 @@ class AccountTools:
                     "leverage": leverage,
                     "margin_used": margin_used,
                     "roe_pct": roe,
-                    "liquidation_price": self._safe_float(position.get("liquidationPx"))
+                    "liquidation_price": _f(get("liquidationPx"))
                 })
 
             return {
@@ -314,59 +573,20 @@ class AccountTools:
             # Ensure limit doesn't exceed API maximum
             limit = min(limit, 2000)
 
-            user_fills = self.info.user_fills(self.account)
-
-            if not user_fills:
-                return {
-                    "success": True,
-                    "data": {
-                        "fills": [],
-                        "total_count": 0,
-                        "filtered_by_coin": coin,
-                        "limit": limit
-                    },
-                    "error": None
-                }
-
             formatted_fills = []
             total_fees = 0.0
             total_volume = 0.0
 
-            for fill in user_fills:
-                fill_coin = fill.get("coin", "")
-
-                # Filter by coin if specified
-                if coin and fill_coin.upper() != coin.upper():
-                    continue
-
-                size = self._safe_float(fill.get("sz"))
-                price = self._safe_float(fill.get("px"))
-                fee = self._safe_float(fill.get("fee"))
-
-                total_fees += fee
-                total_volume += size * price
-
-                formatted_fills.append({
-                    "trade_id": fill.get("tid"),
-                    "order_id": fill.get("oid"),
-                    "coin": fill_coin,
-                    "side": fill.get("side"),
-                    "size": size,
-                    "price": price,
-                    "fee": fee,
-                    "fee_token": fill.get("feeToken", "USDC"),
-                    "closed_pnl": self._safe_float(fill.get("closedPnl")),
-                    "timestamp": self._format_timestamp(fill.get("time", 0)),
-                    "trade_value": size * price,
-                    "start_position": self._safe_float(fill.get("startPosition"))
-                })
-
-                # Stop if we've reached the limit
-                if len(formatted_fills) >= limit:
-                    break
+            async for batch in self.iter_user_fills(coin, limit, format_timestamps=False):
+                for fill in batch:
+                    total_fees += fill["fee"]
+                    total_volume += fill["trade_value"]
+                formatted_fills.extend(batch)
 
-            # Sort by most recent first
-            formatted_fills.sort(key=lambda x: x["timestamp"], reverse=True)
+            # Sort by most recent first on the integer milliseconds, then format
+            formatted_fills.sort(key=_by_timestamp, reverse=True)
+            for fill in formatted_fills:
+                fill["timestamp"] = _format_timestamp_cached(fill["timestamp"])
 
             return {
                 "success": True,
@@ -389,6 +609,115 @@ class AccountTools:
                 "error": f"Failed to get user fills: {str(e)}"
             }
 
+    async def iter_user_fills(
+        self,
+        coin: Optional[str] = None,
+        limit: int = 100,
+        batch_size: int = 100,
+        format_timestamps: bool = True
+    ) -> AsyncIterator[List[Fill]]:
+        """
+        Iterate over recent trade fills in batches, in API order.
+
+        Fills are formatted one batch at a time so callers that forward each
+        batch never hold the full formatted list.
+
+        Args:
+            coin: Optional coin symbol to filter fills
+            limit: Maximum number of fills to yield (max 2000)
+            batch_size: Number of fills per yielded batch
+            format_timestamps: If False, "timestamp" is left as integer milliseconds
+
+        Yields:
+            Lists of up to batch_size formatted fills (see get_user_fills)
+        """
+        limit = min(limit, 2000)
+        user_fills = await self._cached("user_fills", 2.0, lambda: self.info.user_fills(self.account)) or []
+
+        batch = []
+        count = 0
+        _f = _safe_float
+        coin_norm = coin.upper() if coin else None
+        for fill in user_fills:
+            fill_coin = fill.get("coin", "")
+
+            # Filter by coin if specified
+            if coin_norm is not None and fill_coin.upper() != coin_norm:
+                continue
+
+            size = _f(fill.get("sz"))
+            price = _f(fill.get("px"))
+            timestamp = fill.get("time", 0)
+
+            batch.append({
+                "trade_id": fill.get("tid"),
+                "order_id": fill.get("oid"),
+                "coin": fill_coin,
+                "side": fill.get("side"),
+                "size": size,
+                "price": price,
+                "fee": _f(fill.get("fee")),
+                "fee_token": fill.get("feeToken", "USDC"),
+                "closed_pnl": _f(fill.get("closedPnl")),
+                "timestamp": _format_timestamp_cached(timestamp) if format_timestamps else timestamp,
+                "trade_value": size * price,
+                "start_position": _f(fill.get("startPosition"))
+            })
+            count += 1
+
+            # Stop if we've reached the limit
+            if count >= limit:
+                break
+
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    async def _sum_fills(self, coin: Optional[str] = None, limit: int = 500) -> Tuple[float, float, float]:
+        """
+        Total the most recent fills without formatting them.
+
+        Covers the same fills get_user_fills(coin, limit) would return, but
+        only accumulates the numbers get_portfolio_value needs.
+
+        Args:
+            coin: Optional coin symbol to filter fills
+            limit: Maximum number of fills to include (max 2000)
+
+        Returns:
+            Tuple of (realized_pnl, total_fees, total_volume); zeros if the
+            fills could not be fetched
+        """
+        try:
+            limit = min(limit, 2000)
+            user_fills = await self._cached("user_fills", 2.0, lambda: self.info.user_fills(self.account)) or []
+
+            realized_pnl = 0.0
+            total_fees = 0.0
+            total_volume = 0.0
+            count = 0
+            _f = _safe_float
+            coin_norm = coin.upper() if coin else None
+            for fill in user_fills:
+                if count >= limit:
+                    break
+                if coin_norm is not None and fill.get("coin", "").upper() != coin_norm:
+                    continue
+
+                realized_pnl += _f(fill.get("closedPnl"))
+                total_fees += _f(fill.get("fee"))
+                total_volume += _f(fill.get("sz")) * _f(fill.get("px"))
+                count += 1
+
+            return realized_pnl, total_fees, total_volume
+
+        except Exception as e:
+            logger.error(f"Error summing user fills for {self.account}: {e}")
+            return 0.0, 0.0, 0.0
+
     async def get_historical_orders(self, coin: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
         """
         Get historical orders with their status.
@@ -407,42 +736,76 @@ class AccountTools:
             # Note: Hyperliquid API may not have a direct historical_orders method
             # We'll use user_fills and open_orders to construct order history
 
+            # Timestamps stay as integer milliseconds while merging and
+            # ranking; only the orders returned are formatted at the end
+
             # Get open orders
-            open_orders_result = await self.get_open_orders(coin)
-            open_orders = open_orders_result.get("data", {}).get("orders", []) if open_orders_result.get("success") else []
+            try:
+                raw_orders = await self._cached("open_orders", 1.0, lambda: self.info.open_orders(self.account))
+                open_orders = self._format_open_orders(raw_orders or [], coin, format_timestamps=False)
+                open_orders.sort(key=_by_timestamp, reverse=True)
+            except Exception as e:
+                logger.error(f"Error getting open orders for {self.account}: {e}")
+                open_orders = []
 
             # Get fills to identify completed orders
-            fills_result = await self.get_user_fills(coin, limit * 2)  # Get more fills to find unique orders
-            fills = fills_result.get("data", {}).get("fills", []) if fills_result.get("success") else []
-
-            # Build order history from fills
+            try:
+                fills = []
+                async for batch in self.iter_user_fills(coin, limit, format_timestamps=False):
+                    fills.extend(batch)
+                fills.sort(key=_by_timestamp, reverse=True)
+            except Exception as e:
+                logger.error(f"Error getting user fills for {self.account}: {e}")
+                fills = []
+
+            # Build order history from fills. Fills of one order are usually
+            # adjacent in time, so each run of same-order fills is totalled in
+            # locals and folded into orders_map with a single update.
             orders_map = {}
 
-            for fill in fills:
-                oid = fill.get("order_id")
-                if oid not in orders_map:
-                    orders_map[oid] = {
+            for oid, run in groupby(fills, key=_by_order_id):
+                first = next(run)
+                size = first.get("size", 0)
+                size_sum = size
+                fills_count = 1
+                fees = first.get("fee", 0)
+                closed_pnl = first.get("closed_pnl", 0)
+                notional_sum = first.get("price", 0) * size
+                for fill in run:
+                    size = fill.get("size", 0)
+                    size_sum += size
+                    fills_count += 1
+                    fees += fill.get("fee", 0)
+                    closed_pnl += fill.get("closed_pnl", 0)
+                    notional_sum += fill.get("price", 0) * size
+
+                order = orders_map.get(oid)
+                if order is None:
+                    orders_map[oid] = order = {
                         "order_id": oid,
-                        "coin": fill.get("coin"),
-                        "side": fill.get("side"),
+                        "coin": first.get("coin"),
+                        "side": first.get("side"),
                         "total_filled_size": 0.0,
                         "average_price": 0.0,
                         "status": "filled",
                         "fills_count": 0,
                         "total_fees": 0.0,
                         "closed_pnl": 0.0,
-                        "timestamp": fill.get("timestamp")
+                        "timestamp": first.get("timestamp"),
+                        "_notional_sum": 0.0
                     }
 
-                orders_map[oid]["total_filled_size"] += fill.get("size", 0)
-                orders_map[oid]["fills_count"] += 1
-                orders_map[oid]["total_fees"] += fill.get("fee", 0)
-                orders_map[oid]["closed_pnl"] += fill.get("closed_pnl", 0)
+                order["total_filled_size"] += size_sum
+                order["fills_count"] += fills_count
+                order["total_fees"] += fees
+                order["closed_pnl"] += closed_pnl
+                order["_notional_sum"] += notional_sum
 
-                # Update average price (weighted by size)
-                current_total = orders_map[oid]["average_price"] * (orders_map[oid]["total_filled_size"] - fill.get("size", 0))
-                new_total = current_total + (fill.get("price", 0) * fill.get("size", 0))
-                orders_map[oid]["average_price"] = new_total / orders_map[oid]["total_filled_size"] if orders_map[oid]["total_filled_size"] > 0 else 0
+            # Average price (weighted by size), computed once per order
+            for order in orders_map.values():
+                notional_sum = order.pop("_notional_sum")
+                size_sum = order["total_filled_size"]
+                order["average_price"] = notional_sum / size_sum if size_sum > 0 else 0
 
             # Add open orders
             for order in open_orders:
@@ -465,12 +828,10 @@ class AccountTools:
                     orders_map[oid]["size"] = order.get("size")
                     orders_map[oid]["remaining_size"] = order.get("remaining_size")
 
-            # Convert to list and sort by timestamp
-            historical_orders = list(orders_map.values())
-            historical_orders.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-
-            # Apply limit
-            historical_orders = historical_orders[:limit]
+            # Keep the `limit` most recent orders, newest first
+            historical_orders = heapq.nlargest(limit, orders_map.values(), key=_by_timestamp)
+            for order in historical_orders:
+                order["timestamp"] = _format_timestamp_cached(order["timestamp"])
 
             # Calculate statistics
             filled_count = sum(1 for o in historical_orders if o["status"] == "filled")
@@ -514,9 +875,20 @@ class AccountTools:
                     - breakdown by coin
                 - error: Error message if failed
         """
+        return await self._single_flight("portfolio_value", self._get_portfolio_value)
+
+    async def _get_portfolio_value(self) -> Dict[str, Any]:
+        """Uncoalesced implementation of get_portfolio_value()."""
         try:
+            # The three queries are independent, so run them concurrently.
+            # Each one catches its own errors and reports failure in its result.
+            user_state_result, positions_result, fill_totals = await asyncio.gather(
+                self.get_user_state(),
+                self.get_positions(),
+                self._sum_fills(limit=500)
+            )
+
             # Get user state for account value
-            user_state_result = await self.get_user_state()
             if not user_state_result.get("success"):
                 return user_state_result
 
@@ -526,18 +898,11 @@ class AccountTools:
             available_margin = state_data.get("available_margin", 0)
 
             # Get positions for unrealized PnL
-            positions_result = await self.get_positions()
             positions_data = positions_result.get("data", {}) if positions_result.get("success") else {}
             unrealized_pnl = positions_data.get("total_unrealized_pnl", 0)
 
-            # Get recent fills for realized PnL calculation
-            fills_result = await self.get_user_fills(limit=500)
-            fills_data = fills_result.get("data", {}) if fills_result.get("success") else {}
-            fills = fills_data.get("fills", [])
-
-            # Calculate realized PnL from fills
-            realized_pnl = sum(fill.get("closed_pnl", 0) for fill in fills)
-            total_fees = fills_data.get("total_fees", 0)
+            # Realized PnL and fees from recent fills
+            realized_pnl, total_fees, _ = fill_totals
 
             # Calculate net PnL
             total_pnl = realized_pnl + unrealized_pnl
@@ -549,13 +914,14 @@ class AccountTools:
 
             # Breakdown by coin
             coin_breakdown = []
+            pct_of_total = (100.0 / total_value) if total_value > 0 else 0.0
             for position in positions_data.get("positions", []):
                 coin_breakdown.append({
                     "coin": position.get("coin"),
                     "position_value": position.get("position_value"),
                     "unrealized_pnl": position.get("unrealized_pnl"),
                     "roe_pct": position.get("roe_pct"),
-                    "percentage_of_portfolio": (abs(position.get("position_value", 0)) / total_value * 100) if total_value > 0 else 0
+                    "percentage_of_portfolio": abs(position.get("position_value", 0)) * pct_of_total
                 })
 
             return {
@@ -575,7 +941,7 @@ class AccountTools:
                     },
                     "coin_breakdown": coin_breakdown,
                     "positions_count": len(coin_breakdown),
-                    "timestamp": datetime.now(timezone.utc).isoformat()
+                    "timestamp": _now_iso()
                 },
                 "error": None
             }
@@ -605,7 +971,7 @@ class AccountTools:
             # Try to get subaccounts info
             try:
                 # Attempt to call subaccounts method if it exists
-                subaccounts_data = self.info.subaccounts(self.account)
+                subaccounts_data = await asyncio.to_thread(self.info.subaccounts, self.account)
 
                 if not subaccounts_data:
                     return {
@@ -622,15 +988,15 @@ class AccountTools:
                 total_value = 0.0
 
                 for subaccount in subaccounts_data:
-                    account_value = self._safe_float(subaccount.get("accountValue"))
+                    account_value = _safe_float(subaccount.get("accountValue"))
                     total_value += account_value
 
                     formatted_subaccounts.append({
                         "subaccount_address": subaccount.get("address"),
                         "account_value": account_value,
                         "positions_count": len(subaccount.get("positions", [])),
-                        "margin_used": self._safe_float(subaccount.get("marginUsed")),
-                        "withdrawable": self._safe_float(subaccount.get("withdrawable"))
+                        "margin_used": _safe_float(subaccount.get("marginUsed")),
+                        "withdrawable": _safe_float(subaccount.get("withdrawable"))
                     })
 
                 return {
@@ -674,15 +1040,20 @@ class AccountTools:
                     - requests_used, requests_limit
                     - weight_used, weight_limit
                     - reset_time, percentage_used
+                    - governor_mode: "normal", "throttled" or "cached_only"
                 - error: Error message if failed
         """
+        return await self._single_flight("rate_limit_status", self._get_rate_limit_status)
+
+    async def _get_rate_limit_status(self) -> Dict[str, Any]:
+        """Uncoalesced implementation of get_rate_limit_status()."""
         try:
             # Note: Check if Hyperliquid SDK has rate limit method
             # This may not be available in all SDK versions
 
             try:
                 # Attempt to get rate limit info if available
-                rate_limit_data = self.info.user_rate_limit(self.account)
+                rate_limit_data = await asyncio.to_thread(self.info.user_rate_limit, self.account)
 
                 if not rate_limit_data:
                     # Return estimated rate limit info
@@ -715,12 +1086,14 @@ class AccountTools:
                 weight_remaining = weight_limit - weight_used
 
                 # Format reset time
-                reset_time = self._format_timestamp(reset_time_ms)
+                reset_time = _format_timestamp_cached(reset_time_ms)
 
                 # Calculate seconds until reset
-                now_ms = datetime.now(timezone.utc).timestamp() * 1000
+                now_ms = datetime.now(_UTC).timestamp() * 1000
                 seconds_until_reset = max(0, (reset_time_ms - now_ms) / 1000)
 
+                self.governor.update(requests_pct, weight_pct, seconds_until_reset)
+
                 # Determine status
                 if requests_pct > 90 or weight_pct > 90:
                     status = "critical"
@@ -747,7 +1120,8 @@ class AccountTools:
                         },
                         "reset_time": reset_time,
                         "seconds_until_reset": seconds_until_reset,
-                        "recommendations": self._get_rate_limit_recommendations(requests_pct, weight_pct)
+                        "recommendations": self._get_rate_limit_recommendations(requests_pct, weight_pct),
+                        "governor_mode": self.governor.mode
                     },
                     "error": None
                 }
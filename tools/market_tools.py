@@ -10,12 +10,234 @@ Provides comprehensive market data access including:
 - Asset contexts and open interest
 """
 
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Any, Tuple, Union
 from datetime import datetime
+from functools import lru_cache
+from itertools import accumulate, islice
+import heapq
 import logging
+import threading
+import time
+
+import orjson
+from typing_extensions import TypedDict
+
+from .rate_limit import RateLimitGovernor
+
+if TYPE_CHECKING:
+    from .websocket_tools import WebSocketTools
 
 logger = logging.getLogger(__name__)
 
+# Seconds a read-only result is reused, by method name; agents poll these far
+# faster than the underlying data changes
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "get_all_mids": 0.5,
+    "get_funding_rates": 5.0,
+    "get_asset_contexts": 1.0,
+}
+
+# Streamed snapshots older than this many seconds are ignored in favour of REST
+STREAM_MAX_AGE = 5.0
+
+# Candle interval lengths in milliseconds; the keys are the supported intervals
+_INTERVAL_MS: Dict[str, int] = {
+    "1m": 60_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "1h": 3_600_000,
+    "4h": 14_400_000,
+    "1d": 86_400_000,
+}
+_MAX_CANDLES = 5000
+
+# Most (coin, interval) candle series kept; the least recently used is dropped
+_CANDLE_CACHE_KEYS = 64
+
+# Argument validation, built once: O(1) membership tests, constant messages
+_VALID_INTERVALS = frozenset(_INTERVAL_MS)
+_INVALID_INTERVAL_MSG = f"Invalid interval. Must be one of: {list(_INTERVAL_MS)}"
+_CANDLE_LIMITS = range(1, _MAX_CANDLES + 1)
+_INVALID_LIMIT_MSG = f"Limit must be between 1 and {_MAX_CANDLES}"
+_BOOK_DEPTHS = range(1, 21)
+
+
+@lru_cache(maxsize=1024)
+def _utc_date_prefix(day: int) -> str:
+    """Return the 'YYYY-MM-DDT' prefix for a day number since the epoch."""
+    return time.strftime("%Y-%m-%dT", time.gmtime(day * 86400))
+
+
+def _fast_iso_ms(t_ms: int) -> str:
+    """
+    Format epoch milliseconds as a UTC ISO-8601 string (e.g. 2024-01-01T00:00:00.000Z).
+
+    Integer arithmetic plus a per-day cached date prefix: no datetime object
+    and no local timezone lookup per row, so the output does not depend on
+    the host's TZ setting.
+    """
+    day, ms = divmod(t_ms, 86400000)
+    seconds, ms = divmod(ms, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return "%s%02d:%02d:%02d.%03dZ" % (_utc_date_prefix(day), hours, minutes, seconds, ms)
+
+
+def _candle_columns(candles: List[Dict[str, Any]], include_iso: bool = True) -> Dict[str, List[Any]]:
+    """
+    Parse raw API candles column by column.
+
+    Each column is one comprehension over the batch, so the float()
+    conversions run in tight loops instead of one dict build per candle.
+    The timestamp column is only present when include_iso is True.
+    """
+    time_ms = [c["t"] for c in candles]
+    columns: Dict[str, List[Any]] = {}
+    if include_iso:
+        columns["timestamp"] = [_fast_iso_ms(t) for t in time_ms]
+    columns.update({
+        "time_ms": time_ms,
+        "open": [float(c["o"]) for c in candles],
+        "high": [float(c["h"]) for c in candles],
+        "low": [float(c["l"]) for c in candles],
+        "close": [float(c["c"]) for c in candles],
+        "volume": [float(c["v"]) for c in candles],
+        "num_trades": [c.get("n") for c in candles],
+    })
+    return columns
+
+
+def _candle_rows(candles: List[Dict[str, Any]], include_iso: bool = True) -> List[Dict[str, Any]]:
+    """
+    Build one output dict per raw API candle.
+
+    Each row is a fixed-shape dict literal, which is cheaper than zipping
+    the _candle_columns() output back into rows.
+    """
+    if include_iso:
+        rows = [
+            {
+                "timestamp": _fast_iso_ms(c["t"]),
+                "time_ms": c["t"],
+                "open": float(c["o"]),
+                "high": float(c["h"]),
+                "low": float(c["l"]),
+                "close": float(c["c"]),
+                "volume": float(c["v"]),
+            }
+            for c in candles
+        ]
+    else:
+        rows = [
+            {
+                "time_ms": c["t"],
+                "open": float(c["o"]),
+                "high": float(c["h"]),
+                "low": float(c["l"]),
+                "close": float(c["c"]),
+                "volume": float(c["v"]),
+            }
+            for c in candles
+        ]
+
+    # Add number of trades if available
+    for row, c in zip(rows, candles):
+        if "n" in c:
+            row["num_trades"] = c["n"]
+    return rows
+
+
+def _trade_rows(trades: List[Dict[str, Any]], include_iso: bool = True) -> List[Dict[str, Any]]:
+    """Build one output dict per raw API trade (see _candle_rows)."""
+    if include_iso:
+        rows = [
+            {
+                "timestamp": _fast_iso_ms(t["time"]),
+                "time_ms": t["time"],
+                "price": float(t["px"]),
+                "size": float(t["sz"]),
+                "side": t["side"].lower(),
+            }
+            for t in trades
+        ]
+    else:
+        rows = [
+            {
+                "time_ms": t["time"],
+                "price": float(t["px"]),
+                "size": float(t["sz"]),
+                "side": t["side"].lower(),
+            }
+            for t in trades
+        ]
+
+    # Add trade ID if available
+    for row, t in zip(rows, trades):
+        if "tid" in t:
+            row["trade_id"] = t["tid"]
+    return rows
+
+
+def _trade_columns(trades: List[Dict[str, Any]], include_iso: bool = True) -> Dict[str, List[Any]]:
+    """
+    Parse raw API trades column by column (see _candle_columns).
+
+    The timestamp column is only present when include_iso is True; trade_id
+    holds None where the API omitted it.
+    """
+    time_ms = [t["time"] for t in trades]
+    columns: Dict[str, List[Any]] = {}
+    if include_iso:
+        columns["timestamp"] = [_fast_iso_ms(t) for t in time_ms]
+    columns.update({
+        "time_ms": time_ms,
+        "price": [float(t["px"]) for t in trades],
+        "size": [float(t["sz"]) for t in trades],
+        "side": [t["side"].lower() for t in trades],
+        "trade_id": [t.get("tid") for t in trades],
+    })
+    return columns
+
+
+def _parse_levels(levels: List[Any]) -> Tuple[List[List[float]], List[float]]:
+    """
+    Convert raw book levels to [price, size] float pairs plus a size column.
+
+    Every price and size is converted exactly once; the pairs reuse the
+    parsed sizes, so volume metrics need no second pass over the pairs.
+    The API sends {"px", "sz", "n"} dicts; bare [price, size] pairs are
+    accepted too.
+    """
+    if levels and isinstance(levels[0], dict):
+        sizes = [float(level["sz"]) for level in levels]
+        return [[float(level["px"]), size] for level, size in zip(levels, sizes)], sizes
+    sizes = [float(level[1]) for level in levels]
+    return [[float(level[0]), size] for level, size in zip(levels, sizes)], sizes
+
+
+class OrderBookSnapshot(TypedDict):
+    """L2 order book snapshot returned by get_l2_orderbook."""
+    coin: str
+    bids: List[List[float]]
+    asks: List[List[float]]
+    spread: float
+    spread_bps: float
+    mid_price: float
+    best_bid: float
+    best_ask: float
+    bid_volume: float
+    ask_volume: float
+    total_volume: float
+    cum_bid_depth: List[float]
+    cum_ask_depth: List[float]
+    bid_pct: List[float]
+    ask_pct: List[float]
+    volume_imbalance: float
+    timestamp: Union[int, str]
+    depth: int
+
 
 class MarketTools:
     """
@@ -28,24 +250,187 @@ class MarketTools:
     - Analyzing trading volume and liquidity
     """
 
-    def __init__(self, info_client, account_address: Optional[str] = None):
+    def __init__(
+        self,
+        info_client,
+        account_address: Optional[str] = None,
+        ttl_overrides: Optional[Dict[str, float]] = None,
+        governor: Optional[RateLimitGovernor] = None
+    ):
         """
         Initialize market data tools.
 
         Args:
             info_client: Hyperliquid Info client for reading market data
             account_address: Optional account address for personalized data
+            ttl_overrides: Per-method cache TTLs in seconds, merged over
+                DEFAULT_CACHE_TTLS (0 disables caching for that method)
+            governor: Rate limit governor shared with the other tools; a
+                private one is created if omitted
         """
         self.info = info_client
         self.account_address = account_address
         self.logger = logging.getLogger(__name__)
+        self._ttls = {**DEFAULT_CACHE_TTLS, **(ttl_overrides or {})}
+        self.governor = governor or RateLimitGovernor()
+        self._cache: Dict[Hashable, Tuple[float, Any]] = {}
+        self._locks: Dict[Hashable, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._inflight: Dict[Hashable, Future] = {}
+        # (monotonic receive time, payload) pushed by start_streaming()
+        self._mid_snapshot: Optional[Tuple[float, Dict[str, float]]] = None
+        self._book_snapshots: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._stream_ws: Optional["WebSocketTools"] = None
+        self._stream_sub_ids: List[str] = []
+        # Raw candles per (coin, interval), oldest first; later calls only
+        # fetch the tail since the last cached candle. Least recently used
+        # series are evicted beyond _CANDLE_CACHE_KEYS.
+        self._candle_cache: "OrderedDict[Tuple[str, str], List[Dict[str, Any]]]" = OrderedDict()
+        self._candle_lock = threading.Lock()
 
         self.logger.info("MarketTools initialized")
 
+    def _cached(self, key: Hashable, ttl: float, fn: Callable[[], Any]) -> Any:
+        """
+        Return a result of fn() no older than `ttl` seconds.
+
+        The tool methods run in worker threads, so misses are serialized per
+        key with a lock: concurrent callers wait for the first fetch and then
+        share its result instead of each calling the API.
+
+        Args:
+            key: Cache key
+            ttl: Seconds a result stays valid
+            fn: Callable performing the fetch
+
+        Returns:
+            The cached or freshly fetched result
+        """
+        entry = self._cache.get(key)
+        if entry is not None and self._usable(entry[0], ttl):
+            return entry[1]
+
+        with self._locks_guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+
+        with lock:
+            # Another caller may have refreshed it while we waited
+            entry = self._cache.get(key)
+            if entry is not None and self._usable(entry[0], ttl):
+                return entry[1]
+
+            self.governor.pace()
+            value = fn()
+            self._cache[key] = (time.monotonic(), value)
+            return value
+
+    def _usable(self, fetched_at: float, ttl: float) -> bool:
+        """Whether a cached result is fresh, or stale but allowed by the governor."""
+        age = time.monotonic() - fetched_at
+        return age < ttl or self.governor.serve_stale(age)
+
+    def _coalesced(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn() once for all concurrent callers with the same key.
+
+        Complements _cached() for reads that are not cached: the first caller
+        performs the request and callers arriving while it is in flight wait
+        for and share its result (or exception) instead of issuing their own.
+
+        Args:
+            key: Identity of the request, e.g. ("l2_snapshot", coin)
+            fn: Callable performing the request
+
+        Returns:
+            The result of the shared call
+        """
+        with self._locks_guard:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            self.governor.pace()
+            value = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._locks_guard:
+                del self._inflight[key]
+
+    async def start_streaming(self, ws_tools: "WebSocketTools", coins: Iterable[str]) -> None:
+        """
+        Serve mids and order books from WebSocket pushes instead of REST.
+
+        Subscribes to allMids and to l2Book for each coin; get_all_mids and
+        get_l2_orderbook then answer from the latest pushed snapshot while it
+        is newer than STREAM_MAX_AGE, and fall back to REST otherwise.
+
+        Args:
+            ws_tools: WebSocket tools whose connection carries the subscriptions
+            coins: Symbols whose L2 books should be streamed
+        """
+        await ws_tools.ensure_started()
+        self._stream_ws = ws_tools
+
+        self._stream_sub_ids.append(await ws_tools.subscribe("allMids", {}, self._on_mids))
+        for coin in coins:
+            self._stream_sub_ids.append(await ws_tools.subscribe("l2Book", {"coin": coin}, self._on_book))
+
+        self.logger.info(f"Streaming mids and L2 books for {len(self._stream_sub_ids) - 1} coins")
+
+    async def stop_streaming(self) -> None:
+        """Drop the streaming subscriptions and go back to REST for every read."""
+        if self._stream_ws is not None:
+            for sub_id in self._stream_sub_ids:
+                # Release only the streaming callback's hold, leaving any
+                # subscription a tool call made to the same feed in place
+                callback = self._on_mids if sub_id.startswith("allMids") else self._on_book
+                try:
+                    await self._stream_ws.unsubscribe(sub_id, callback)
+                except Exception as e:
+                    self.logger.warning(f"Failed to unsubscribe {sub_id}: {e}")
+
+        self._stream_ws = None
+        self._stream_sub_ids.clear()
+        self._mid_snapshot = None
+        self._book_snapshots.clear()
+
+    def _on_mids(self, message: Dict[str, Any]) -> None:
+        """Store an allMids push (runs on the event loop)."""
+        mids = (message.get("data") or {}).get("mids")
+        if mids:
+            # One tuple assignment, so reader threads never see a torn update
+            self._mid_snapshot = (time.monotonic(), dict(zip(mids, map(float, mids.values()))))
+
+    def _on_book(self, message: Dict[str, Any]) -> None:
+        """Store an l2Book push, which has the same shape as an l2_snapshot response."""
+        book = message.get("data") or {}
+        coin = book.get("coin")
+        if coin and "levels" in book:
+            self._book_snapshots[coin] = (time.monotonic(), book)
+
+    @staticmethod
+    def _fresh(entry: Optional[Tuple[float, Any]]) -> Optional[Any]:
+        """Return a streamed payload if it is recent enough to serve, else None."""
+        if entry is not None and time.monotonic() - entry[0] < STREAM_MAX_AGE:
+            return entry[1]
+        return None
+
     def get_all_mids(self) -> Dict[str, float]:
         """
         Get mid prices for all available coins
 
+        Served from the allMids stream when start_streaming() is active.
+
         Returns:
             Dictionary mapping coin symbols to their mid prices
             Example: {"BTC": 45000.0, "ETH": 2500.0, "SOL": 100.5}
@@ -53,6 +438,13 @@ class MarketTools:
         Raises:
             Exception: If API call fails
         """
+        streamed = self._fresh(self._mid_snapshot)
+        if streamed is not None:
+            return streamed
+        return self._cached("get_all_mids", self._ttls["get_all_mids"], self._fetch_all_mids)
+
+    def _fetch_all_mids(self) -> Dict[str, float]:
+        """Uncached implementation of get_all_mids()."""
         try:
             self.logger.debug("Fetching all mid prices")
             mids = self.info.all_mids()
@@ -61,11 +453,13 @@ class MarketTools:
                 self.logger.warning("No mid prices returned from API")
                 return {}
 
-            # Convert to float and format
-            result = {
-                coin: float(price)
-                for coin, price in mids.items()
-            }
+            # The API sends prices as strings; skip the conversion if the
+            # client already decoded them to floats. The payload is freshly
+            # decoded per call, so it can be returned without a copy.
+            if isinstance(next(iter(mids.values())), float):
+                result = mids
+            else:
+                result = dict(zip(mids, map(float, mids.values())))
 
             self.logger.info(f"Retrieved {len(result)} mid prices")
             return result
@@ -78,10 +472,12 @@ class MarketTools:
         self,
         coin: str,
         depth: int = 20
-    ) -> Dict[str, Any]:
+    ) -> OrderBookSnapshot:
         """
         Get Level 2 order book snapshot for a coin
 
+        Served from the l2Book stream when the coin is being streamed.
+
         Args:
             coin: Symbol to get order book for (e.g., "BTC", "ETH")
             depth: Number of price levels per side (max 20)
@@ -94,41 +490,51 @@ class MarketTools:
             - mid_price: Average of best bid and ask
             - bid_volume: Total volume on bid side
             - ask_volume: Total volume on ask side
+            - cum_bid_depth / cum_ask_depth: Cumulative size through each level
+            - bid_pct / ask_pct: Each level's size as a fraction of total_volume
+            - volume_imbalance: (bid_volume - ask_volume) / total_volume, in [-1, 1]
             - timestamp: Snapshot timestamp
 
         Raises:
             ValueError: If depth is invalid
             Exception: If API call fails
         """
-        if depth <= 0 or depth > 20:
+        if depth not in _BOOK_DEPTHS:
             raise ValueError("Depth must be between 1 and 20")
 
         try:
             self.logger.debug(f"Fetching L2 orderbook for {coin} with depth {depth}")
-            snapshot = self.info.l2_snapshot(coin)
+            snapshot = self._fresh(self._book_snapshots.get(coin))
+            if snapshot is None:
+                snapshot = self._coalesced(("l2_snapshot", coin), lambda: self.info.l2_snapshot(coin))
 
             if not snapshot:
                 raise Exception(f"No orderbook data returned for {coin}")
 
-            # Extract and limit depth
-            bids = snapshot.get("levels", [[[], []]])[0][:depth]
-            asks = snapshot.get("levels", [[[], []]])[1][:depth]
+            # Extract and limit depth, parsing each level exactly once
+            levels = snapshot.get("levels") or [[], []]
+            bids, bid_sizes = _parse_levels(levels[0][:depth])
+            asks, ask_sizes = _parse_levels(levels[1][:depth])
 
             # Calculate metrics
-            best_bid = float(bids[0][0]) if bids else 0.0
-            best_ask = float(asks[0][0]) if asks else 0.0
+            best_bid = bids[0][0] if bids else 0.0
+            best_ask = asks[0][0] if asks else 0.0
 
             spread = best_ask - best_bid if best_bid and best_ask else 0.0
             mid_price = (best_bid + best_ask) / 2 if best_bid and best_ask else 0.0
 
-            # Calculate total volumes
-            bid_volume = sum(float(level[1]) for level in bids)
-            ask_volume = sum(float(level[1]) for level in asks)
+            # Cumulative depth per level; the last entry is the side's volume
+            cum_bid_depth = list(accumulate(bid_sizes))
+            cum_ask_depth = list(accumulate(ask_sizes))
+            bid_volume = cum_bid_depth[-1] if cum_bid_depth else 0.0
+            ask_volume = cum_ask_depth[-1] if cum_ask_depth else 0.0
+            total_volume = bid_volume + ask_volume
+            volume_scale = 1 / total_volume if total_volume else 0.0
 
             result = {
                 "coin": coin,
-                "bids": [[float(price), float(size)] for price, size in bids],
-                "asks": [[float(price), float(size)] for price, size in asks],
+                "bids": bids,
+                "asks": asks,
                 "spread": spread,
                 "spread_bps": (spread / mid_price * 10000) if mid_price else 0.0,
                 "mid_price": mid_price,
@@ -136,7 +542,12 @@ class MarketTools:
                 "best_ask": best_ask,
                 "bid_volume": bid_volume,
                 "ask_volume": ask_volume,
-                "total_volume": bid_volume + ask_volume,
+                "total_volume": total_volume,
+                "cum_bid_depth": cum_bid_depth,
+                "cum_ask_depth": cum_ask_depth,
+                "bid_pct": [size * volume_scale for size in bid_sizes],
+                "ask_pct": [size * volume_scale for size in ask_sizes],
+                "volume_imbalance": (bid_volume - ask_volume) * volume_scale,
                 "timestamp": snapshot.get("time", datetime.now().isoformat()),
                 "depth": len(bids)
             }
@@ -148,11 +559,29 @@ class MarketTools:
             self.logger.error(f"Error fetching L2 orderbook for {coin}: {e}")
             raise Exception(f"Failed to get orderbook for {coin}: {str(e)}")
 
+    def get_l2_orderbook_json(self, coin: str, depth: int = 20) -> bytes:
+        """
+        Get an L2 order book snapshot as pre-encoded JSON.
+
+        Args:
+            coin: Symbol to get order book for (e.g., "BTC", "ETH")
+            depth: Number of price levels per side (max 20)
+
+        Returns:
+            UTF-8 JSON object with the get_l2_orderbook fields
+
+        Raises:
+            ValueError: If depth is invalid
+            Exception: If API call fails
+        """
+        return orjson.dumps(self.get_l2_orderbook(coin, depth))
+
     def get_candles(
         self,
         coin: str,
         interval: str = "1h",
-        limit: int = 100
+        limit: int = 100,
+        include_iso: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Get historical candle (OHLCV) data
@@ -161,10 +590,11 @@ class MarketTools:
             coin: Symbol to get candles for (e.g., "BTC", "ETH")
             interval: Candle interval - "1m", "5m", "15m", "1h", "4h", "1d"
             limit: Number of candles to return (max 5000)
+            include_iso: Include the ISO timestamp field (time_ms is always present)
 
         Returns:
             List of candle dictionaries with:
-            - timestamp: Candle open time (ISO format)
+            - timestamp: Candle open time (ISO 8601, UTC)
             - time_ms: Candle open time (milliseconds)
             - open: Open price
             - high: High price
@@ -177,51 +607,210 @@ class MarketTools:
             ValueError: If interval is invalid
             Exception: If API call fails
         """
-        valid_intervals = ["1m", "5m", "15m", "1h", "4h", "1d"]
-        if interval not in valid_intervals:
-            raise ValueError(f"Invalid interval. Must be one of: {valid_intervals}")
+        result = []
+        for batch in self.iter_candles(coin, interval, limit, include_iso=include_iso):
+            result.extend(batch)
+        return result
+
+    def iter_candles(
+        self,
+        coin: str,
+        interval: str = "1h",
+        limit: int = 100,
+        batch_size: int = 100,
+        include_iso: bool = True
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over historical candles in batches.
+
+        Candles are parsed one batch at a time, so callers that forward each
+        batch (e.g. encode and write it) never hold the full parsed list.
+
+        Args:
+            coin: Symbol to get candles for (e.g., "BTC", "ETH")
+            interval: Candle interval - "1m", "5m", "15m", "1h", "4h", "1d"
+            limit: Number of candles to return (max 5000)
+            batch_size: Number of candles per yielded batch
+            include_iso: Include the ISO timestamp field
 
-        if limit <= 0 or limit > 5000:
-            raise ValueError("Limit must be between 1 and 5000")
+        Yields:
+            Lists of up to batch_size candle dictionaries (see get_candles)
+
+        Raises:
+            ValueError: If interval is invalid
+            Exception: If API call fails
+        """
+        candles = self._fetch_candles(coin, interval, limit)
+        if not candles:
+            return
 
         try:
-            self.logger.debug(f"Fetching {limit} candles for {coin} at {interval} interval")
-            candles = self.info.candles_snapshot(coin, interval, limit)
+            for start in range(0, len(candles), batch_size):
+                yield _candle_rows(candles[start:start + batch_size], include_iso)
 
-            if not candles:
-                self.logger.warning(f"No candle data returned for {coin}")
-                return []
+            self.logger.info(f"Retrieved {len(candles)} candles for {coin}")
 
-            result = []
-            for candle in candles:
-                # Parse candle data
-                candle_dict = {
-                    "timestamp": datetime.fromtimestamp(candle["t"] / 1000).isoformat(),
-                    "time_ms": candle["t"],
-                    "open": float(candle["o"]),
-                    "high": float(candle["h"]),
-                    "low": float(candle["l"]),
-                    "close": float(candle["c"]),
-                    "volume": float(candle["v"]),
-                }
-
-                # Add number of trades if available
-                if "n" in candle:
-                    candle_dict["num_trades"] = candle["n"]
-
-                result.append(candle_dict)
-
-            self.logger.info(f"Retrieved {len(result)} candles for {coin}")
-            return result
+        except Exception as e:
+            self.logger.error(f"Error parsing candles for {coin}: {e}")
+            raise Exception(f"Failed to get candles for {coin}: {str(e)}")
+
+    def get_candles_arrays(
+        self,
+        coin: str,
+        interval: str = "1h",
+        limit: int = 100,
+        include_iso: bool = True
+    ) -> Dict[str, List[Any]]:
+        """
+        Get historical candles as parallel columns instead of per-candle dicts.
 
+        Cheaper than get_candles for numeric consumers: no dict is built per
+        candle, and each column can be handed straight to an array library.
+
+        Args:
+            coin: Symbol to get candles for (e.g., "BTC", "ETH")
+            interval: Candle interval - "1m", "5m", "15m", "1h", "4h", "1d"
+            limit: Number of candles to return (max 5000)
+            include_iso: Include the ISO timestamp column
+
+        Returns:
+            Dictionary of equal-length lists keyed like get_candles fields
+            (timestamp, time_ms, open, high, low, close, volume, num_trades);
+            num_trades holds None where the API omitted it
+
+        Raises:
+            ValueError: If interval is invalid
+            Exception: If API call fails
+        """
+        candles = self._fetch_candles(coin, interval, limit)
+
+        try:
+            columns = _candle_columns(candles or [], include_iso)
+        except Exception as e:
+            self.logger.error(f"Error parsing candles for {coin}: {e}")
+            raise Exception(f"Failed to get candles for {coin}: {str(e)}")
+
+        if candles:
+            self.logger.info(f"Retrieved {len(candles)} candles for {coin}")
+        return columns
+
+    def get_candles_json(
+        self,
+        coin: str,
+        interval: str = "1h",
+        limit: int = 100,
+        include_iso: bool = True
+    ) -> bytes:
+        """
+        Get historical candles as pre-encoded JSON.
+
+        Encodes the columnar get_candles_arrays() payload with orjson, for
+        callers that forward the bytes as-is and never need the Python objects.
+
+        Args:
+            coin: Symbol to get candles for (e.g., "BTC", "ETH")
+            interval: Candle interval - "1m", "5m", "15m", "1h", "4h", "1d"
+            limit: Number of candles to return (max 5000)
+            include_iso: Include the ISO timestamp column
+
+        Returns:
+            UTF-8 JSON object of equal-length columns (see get_candles_arrays)
+
+        Raises:
+            ValueError: If interval is invalid
+            Exception: If API call fails
+        """
+        return orjson.dumps(self.get_candles_arrays(coin, interval, limit, include_iso))
+
+    def prefetch_candles(self, coins: Iterable[str], intervals: Iterable[str], limit: int = 500) -> None:
+        """
+        Warm the candle cache so the first get_candles call only fetches the tail.
+
+        Args:
+            coins: Symbols to prefetch
+            intervals: Candle intervals to prefetch for each coin
+            limit: Number of candles to keep per (coin, interval)
+        """
+        for coin in coins:
+            for interval in intervals:
+                try:
+                    self._fetch_candles(coin, interval, limit)
+                except Exception as e:
+                    self.logger.warning(f"Failed to prefetch {interval} candles for {coin}: {e}")
+
+    def _fetch_candles(self, coin: str, interval: str, limit: int) -> List[Dict[str, Any]]:
+        """Validate arguments and return the last `limit` raw candles."""
+        if interval not in _VALID_INTERVALS:
+            raise ValueError(_INVALID_INTERVAL_MSG)
+
+        if limit not in _CANDLE_LIMITS:
+            raise ValueError(_INVALID_LIMIT_MSG)
+
+        try:
+            self.logger.debug(f"Fetching {limit} candles for {coin} at {interval} interval")
+            candles = self._coalesced(
+                ("candles_snapshot", coin, interval, limit),
+                lambda: self._load_candles(coin, interval, limit)
+            )
         except Exception as e:
             self.logger.error(f"Error fetching candles for {coin}: {e}")
             raise Exception(f"Failed to get candles for {coin}: {str(e)}")
 
+        if not candles:
+            self.logger.warning(f"No candle data returned for {coin}")
+        return candles
+
+    def _load_candles(self, coin: str, interval: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Fetch candles through the per-(coin, interval) cache.
+
+        With at least `limit` candles cached and the last one no more than
+        `limit` intervals old, only candles from the last cached one onwards
+        are requested (that candle may still have been open when it was
+        fetched) and merged onto the cached list. Otherwise, including after
+        a long idle gap that the tail could not bridge, the full window of
+        `limit` intervals is fetched and replaces the series.
+
+        Calls for the same (coin, interval) are serialized, whatever their
+        limit, so the read-merge-write of the series never races.
+        """
+        key = (coin, interval)
+        window_ms = limit * _INTERVAL_MS[interval]
+
+        with self._locks_guard:
+            series_lock = self._locks.setdefault(("candles", coin, interval), threading.Lock())
+
+        with series_lock:
+            now_ms = int(time.time() * 1000)
+            with self._candle_lock:
+                cached = self._candle_cache.get(key)
+
+            if cached and len(cached) >= limit and now_ms - cached[-1]["t"] <= window_ms:
+                tail = self.info.candles_snapshot(coin, interval, cached[-1]["t"], now_ms) or []
+                if tail:
+                    first_new = tail[0]["t"]
+                    keep = len(cached)
+                    while keep and cached[keep - 1]["t"] >= first_new:
+                        keep -= 1
+                    merged = cached[:keep] + tail
+                else:
+                    merged = cached
+            else:
+                merged = self.info.candles_snapshot(coin, interval, now_ms - window_ms, now_ms) or []
+
+            if merged:
+                with self._candle_lock:
+                    self._candle_cache[key] = merged[-_MAX_CANDLES:]
+                    self._candle_cache.move_to_end(key)
+                    if len(self._candle_cache) > _CANDLE_CACHE_KEYS:
+                        self._candle_cache.popitem(last=False)
+            return merged[-limit:]
+
     def get_recent_trades(
         self,
         coin: str,
-        limit: int = 50
+        limit: int = 50,
+        include_iso: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Get recent trades for a coin
@@ -229,10 +818,11 @@ class MarketTools:
         Args:
             coin: Symbol to get trades for (e.g., "BTC", "ETH")
             limit: Number of recent trades to return
+            include_iso: Include the ISO timestamp field (time_ms is always present)
 
         Returns:
             List of trade dictionaries sorted by most recent first:
-            - timestamp: Trade execution time (ISO format)
+            - timestamp: Trade execution time (ISO 8601, UTC)
             - time_ms: Trade execution time (milliseconds)
             - price: Trade price
             - size: Trade size
@@ -246,43 +836,63 @@ class MarketTools:
             raise ValueError("Limit must be positive")
 
         try:
-            self.logger.debug(f"Fetching {limit} recent trades for {coin}")
-            trades = self.info.recent_trades(coin)
+            result = _trade_rows(self._select_recent_trades(coin, limit), include_iso)
 
-            if not trades:
-                self.logger.warning(f"No trade data returned for {coin}")
-                return []
+            self.logger.info(f"Retrieved {len(result)} recent trades for {coin}")
+            return result
 
-            # Sort by timestamp descending (most recent first)
-            sorted_trades = sorted(
-                trades,
-                key=lambda x: x.get("time", 0),
-                reverse=True
-            )[:limit]
+        except Exception as e:
+            self.logger.error(f"Error fetching recent trades for {coin}: {e}")
+            raise Exception(f"Failed to get recent trades for {coin}: {str(e)}")
 
-            result = []
-            for trade in sorted_trades:
-                trade_dict = {
-                    "timestamp": datetime.fromtimestamp(trade["time"] / 1000).isoformat(),
-                    "time_ms": trade["time"],
-                    "price": float(trade["px"]),
-                    "size": float(trade["sz"]),
-                    "side": trade["side"].lower(),
-                }
+    def get_recent_trades_arrays(
+        self,
+        coin: str,
+        limit: int = 50,
+        include_iso: bool = True
+    ) -> Dict[str, List[Any]]:
+        """
+        Get recent trades as parallel columns instead of per-trade dicts.
 
-                # Add trade ID if available
-                if "tid" in trade:
-                    trade_dict["trade_id"] = trade["tid"]
+        Args:
+            coin: Symbol to get trades for (e.g., "BTC", "ETH")
+            limit: Number of recent trades to return
+            include_iso: Include the ISO timestamp column
 
-                result.append(trade_dict)
+        Returns:
+            Dictionary of equal-length lists, most recent first, keyed like
+            get_recent_trades fields (timestamp, time_ms, price, size, side,
+            trade_id); trade_id holds None where the API omitted it
 
-            self.logger.info(f"Retrieved {len(result)} recent trades for {coin}")
-            return result
+        Raises:
+            Exception: If API call fails
+        """
+        if limit <= 0:
+            raise ValueError("Limit must be positive")
+
+        try:
+            return _trade_columns(self._select_recent_trades(coin, limit), include_iso)
 
         except Exception as e:
             self.logger.error(f"Error fetching recent trades for {coin}: {e}")
             raise Exception(f"Failed to get recent trades for {coin}: {str(e)}")
 
+    def _select_recent_trades(self, coin: str, limit: int) -> List[Dict[str, Any]]:
+        """Fetch raw trades and return the `limit` most recent, newest first."""
+        self.logger.debug(f"Fetching {limit} recent trades for {coin}")
+        trades = self._coalesced(("recent_trades", coin), lambda: self.info.recent_trades(coin))
+
+        if not trades:
+            self.logger.warning(f"No trade data returned for {coin}")
+            return []
+
+        # Only `limit` trades are kept, so select them with a bounded heap
+        # instead of sorting the whole response
+        times = [trade.get("time", 0) for trade in trades]
+        if all(a >= b for a, b in zip(times, islice(times, 1, None))):
+            return trades[:limit]
+        return heapq.nlargest(limit, trades, key=lambda x: x.get("time", 0))
+
     def get_funding_rates(self) -> List[Dict[str, Any]]:
         """
         Get current funding rates for all perpetual contracts
@@ -300,43 +910,51 @@ class MarketTools:
         Raises:
             Exception: If API call fails
         """
+        return self._cached("get_funding_rates", self._ttls["get_funding_rates"], self._fetch_funding_rates)
+
+    def _fetch_funding_rates(self) -> List[Dict[str, Any]]:
+        """Uncached implementation of get_funding_rates()."""
         try:
             self.logger.debug("Fetching funding rates for all perpetuals")
-            meta = self.info.meta()
+            meta = self._get_meta()
 
             if not meta or "universe" not in meta:
                 raise Exception("No metadata returned from API")
 
             result = []
+            # Bound once: the loop runs for every listed perpetual
+            _float = float
+            fromtimestamp = datetime.fromtimestamp
+            append = result.append
             for asset in meta["universe"]:
                 if asset.get("name"):
                     funding_info = {
                         "coin": asset["name"],
-                        "funding_rate": float(asset.get("funding", 0)) * 100,  # Convert to %
+                        "funding_rate": _float(asset.get("funding", 0)) * 100,  # Convert to %
                     }
 
                     # Add next funding time if available
                     if "nextFundingTime" in asset:
-                        funding_info["next_funding_time"] = datetime.fromtimestamp(
+                        funding_info["next_funding_time"] = fromtimestamp(
                             asset["nextFundingTime"] / 1000
                         ).isoformat()
 
                     # Add predicted rate if available
                     if "predictedFunding" in asset:
-                        funding_info["predicted_rate"] = float(asset["predictedFunding"]) * 100
+                        funding_info["predicted_rate"] = _float(asset["predictedFunding"]) * 100
 
                     # Add premium if available
                     if "premium" in asset:
-                        funding_info["premium"] = float(asset["premium"])
+                        funding_info["premium"] = _float(asset["premium"])
 
                     # Add prices if available
                     if "markPx" in asset:
-                        funding_info["mark_price"] = float(asset["markPx"])
+                        funding_info["mark_price"] = _float(asset["markPx"])
 
                     if "indexPx" in asset:
-                        funding_info["index_price"] = float(asset["indexPx"])
+                        funding_info["index_price"] = _float(asset["indexPx"])
 
-                    result.append(funding_info)
+                    append(funding_info)
 
             self.logger.info(f"Retrieved funding rates for {len(result)} perpetuals")
             return result
@@ -369,68 +987,125 @@ class MarketTools:
         Raises:
             Exception: If API call fails or coin not found
         """
-        try:
-            self.logger.debug(f"Fetching asset contexts for {coin}")
-            data = self.info.meta_and_asset_ctxs()
+        return self.get_asset_contexts_batch([coin])[coin]
 
-            if not data:
-                raise Exception("No data returned from API")
-
-            # Find the specific coin in universe
-            meta = data[0]  # Metadata
-            asset_ctxs = data[1]  # Asset contexts
+    def get_asset_contexts_batch(self, coins: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get asset contexts for several coins from a single API call
 
-            coin_meta = None
-            coin_ctx = None
+        Args:
+            coins: Symbols to get context for (e.g., ["BTC", "ETH"])
 
-            # Find coin in metadata
-            for idx, asset in enumerate(meta.get("universe", [])):
-                if asset.get("name") == coin:
-                    coin_meta = asset
-                    if idx < len(asset_ctxs):
-                        coin_ctx = asset_ctxs[idx]
-                    break
+        Returns:
+            Dictionary mapping each coin to its asset context
+            (same fields as get_asset_contexts)
 
-            if not coin_meta:
-                raise Exception(f"Coin {coin} not found in market data")
+        Raises:
+            Exception: If API call fails or a coin is not found
+        """
+        label = ", ".join(coins)
+        try:
+            self.logger.debug(f"Fetching asset contexts for {label}")
+            universe, asset_ctxs, name_to_idx = self._get_meta_and_ctxs()
+
+            result = {}
+            for coin in coins:
+                idx = name_to_idx.get(coin)
+                if idx is None:
+                    raise Exception(f"Coin {coin} not found in market data")
+                coin_ctx = asset_ctxs[idx] if idx < len(asset_ctxs) else None
+                result[coin] = self._build_asset_ctx(coin, universe[idx], coin_ctx)
+
+            self.logger.info(f"Retrieved asset context for {label}")
+            return result
 
-            result = {
-                "coin": coin,
-                "mark_price": float(coin_ctx.get("markPx", 0)) if coin_ctx else 0.0,
-                "oracle_price": float(coin_ctx.get("oraclePx", 0)) if coin_ctx else 0.0,
-                "funding_rate": float(coin_meta.get("funding", 0)) * 100,
-                "open_interest": float(coin_ctx.get("openInterest", 0)) if coin_ctx else 0.0,
-            }
+        except Exception as e:
+            self.logger.error(f"Error fetching asset contexts for {label}: {e}")
+            raise Exception(f"Failed to get asset contexts for {label}: {str(e)}")
 
-            # Calculate OI in USD
-            if result["mark_price"] and result["open_interest"]:
-                result["open_interest_usd"] = result["mark_price"] * result["open_interest"]
-            else:
-                result["open_interest_usd"] = 0.0
+    def _get_meta(self) -> Dict[str, Any]:
+        """
+        Return perp metadata, reusing a fresh meta_and_asset_ctxs payload.
 
-            # Add index price if available
-            if coin_meta.get("indexPx"):
-                result["index_price"] = float(coin_meta["indexPx"])
+        meta_and_asset_ctxs() carries the same universe as meta(), so when
+        asset contexts were fetched within the funding rates TTL the universe
+        is taken from that cached payload instead of a second request.
+        """
+        entry = self._cache.get("meta_and_asset_ctxs")
+        if entry is not None and self._usable(entry[0], self._ttls["get_funding_rates"]):
+            return {"universe": entry[1][0]}
+        return self.info.meta()
+
+    def _get_meta_and_ctxs(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, int]]:
+        """Cached _fetch_meta_and_asset_ctxs(), shared by all asset context reads."""
+        return self._cached(
+            "meta_and_asset_ctxs",
+            self._ttls["get_asset_contexts"],
+            self._fetch_meta_and_asset_ctxs
+        )
+
+    def _fetch_meta_and_asset_ctxs(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, int]]:
+        """
+        Fetch perp metadata and asset contexts, indexed by coin name.
 
-            # Add prevailing price if available
-            if coin_ctx and "prevailPx" in coin_ctx:
-                result["prevailing_px"] = float(coin_ctx["prevailPx"])
+        Returns:
+            Tuple of (universe, asset_ctxs, name -> universe index)
+        """
+        data = self.info.meta_and_asset_ctxs()
 
-            # Add funding details
-            if coin_ctx and "funding" in coin_ctx:
-                result["funding"] = float(coin_ctx["funding"])
+        if not data:
+            raise Exception("No data returned from API")
 
-            # Add 24h volume and trades if available
-            if coin_ctx:
-                if "dayNtlVlm" in coin_ctx:
-                    result["volume_24h"] = float(coin_ctx["dayNtlVlm"])
+        universe = data[0].get("universe", [])  # Metadata
+        asset_ctxs = data[1]  # Asset contexts
 
-                if "dayNtlTrades" in coin_ctx:
-                    result["trades_24h"] = int(coin_ctx["dayNtlTrades"])
+        # Built back to front so the first occurrence of a name wins, as
+        # with a linear scan
+        name_to_idx: Dict[str, int] = {
+            universe[idx].get("name"): idx for idx in range(len(universe) - 1, -1, -1)
+        }
 
-            self.logger.info(f"Retrieved asset context for {coin}")
-            return result
+        return universe, asset_ctxs, name_to_idx
 
-        except Exception as e:
-            self.logger.error(f"Error fetching asset contexts for {coin}: {e}")
-            raise Exception(f"Failed to get asset contexts for {coin}: {str(e)}")
+    def _build_asset_ctx(
+        self,
+        coin: str,
+        coin_meta: Dict[str, Any],
+        coin_ctx: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Format one coin's metadata and asset context (see get_asset_contexts)."""
+        result = {
+            "coin": coin,
+            "mark_price": float(coin_ctx.get("markPx", 0)) if coin_ctx else 0.0,
+            "oracle_price": float(coin_ctx.get("oraclePx", 0)) if coin_ctx else 0.0,
+            "funding_rate": float(coin_meta.get("funding", 0)) * 100,
+            "open_interest": float(coin_ctx.get("openInterest", 0)) if coin_ctx else 0.0,
+        }
+
+        # Calculate OI in USD
+        if result["mark_price"] and result["open_interest"]:
+            result["open_interest_usd"] = result["mark_price"] * result["open_interest"]
+        else:
+            result["open_interest_usd"] = 0.0
+
+        # Add index price if available
+        if coin_meta.get("indexPx"):
+            result["index_price"] = float(coin_meta["indexPx"])
+
+        # Add prevailing price if available
+        if coin_ctx and "prevailPx" in coin_ctx:
+            result["prevailing_px"] = float(coin_ctx["prevailPx"])
+
+        # Add funding details
+        if coin_ctx and "funding" in coin_ctx:
+            result["funding"] = float(coin_ctx["funding"])
+
+        # Add 24h volume and trades if available
+        if coin_ctx:
+            if "dayNtlVlm" in coin_ctx:
+                result["volume_24h"] = float(coin_ctx["dayNtlVlm"])
+
+            if "dayNtlTrades" in coin_ctx:
+                result["trades_24h"] = int(coin_ctx["dayNtlTrades"])
+
+        return result
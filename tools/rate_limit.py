@@ -0,0 +1,108 @@
+"""
+Rate Limit Governor for Hyperliquid MCP Server
+
+Turns the usage reported by get_rate_limit_status into client behaviour:
+requests are spaced out as usage climbs past 70% and, past 90%, cached
+results are served instead of calling the API. One instance is shared by
+the account and market tools so both back off together.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitGovernor:
+    """
+    Pace Info API calls according to the last observed rate limit usage.
+
+    Modes:
+    - normal: usage at or below THROTTLE_PCT, no delay
+    - throttled: each call waits base_interval scaled from 1x at 70% to 5x at 100%
+    - cached_only: usage above CACHED_ONLY_PCT; callers serve cached results
+      up to max_stale seconds old and only fetch when they have none
+
+    A reading expires when the limit window resets (or after default_window
+    seconds if the reset time is unknown), returning the governor to normal.
+    """
+
+    THROTTLE_PCT = 70.0
+    CACHED_ONLY_PCT = 90.0
+
+    def __init__(
+        self,
+        base_interval: float = 0.1,
+        max_stale: float = 30.0,
+        default_window: float = 60.0
+    ):
+        """
+        Initialize the governor.
+
+        Args:
+            base_interval: Seconds to wait per call at the throttling threshold
+            max_stale: Oldest cached result (seconds) served in cached_only mode
+            default_window: Seconds a reading stays valid when no reset time is given
+        """
+        self.base_interval = base_interval
+        self.max_stale = max_stale
+        self.default_window = default_window
+        # (usage percent, monotonic expiry), replaced as one tuple so worker
+        # threads never see a torn update
+        self._reading: Tuple[float, float] = (0.0, 0.0)
+
+    def update(self, requests_pct: float, weight_pct: float, reset_in: Optional[float] = None) -> None:
+        """
+        Record the latest rate limit usage.
+
+        Args:
+            requests_pct: Percentage of the request limit used
+            weight_pct: Percentage of the weight limit used
+            reset_in: Seconds until the limit window resets, if known
+        """
+        pct = max(requests_pct, weight_pct)
+        self._reading = (pct, time.monotonic() + (reset_in or self.default_window))
+
+        if pct > self.THROTTLE_PCT:
+            logger.info(f"Rate limit usage at {pct:.1f}%: {self.mode} mode")
+
+    @property
+    def usage_pct(self) -> float:
+        """Last observed usage percentage, or 0 once the reading has expired."""
+        pct, expires_at = self._reading
+        return pct if time.monotonic() < expires_at else 0.0
+
+    @property
+    def mode(self) -> str:
+        """Current mode: "normal", "throttled" or "cached_only"."""
+        pct = self.usage_pct
+        if pct > self.CACHED_ONLY_PCT:
+            return "cached_only"
+        if pct > self.THROTTLE_PCT:
+            return "throttled"
+        return "normal"
+
+    def delay(self) -> float:
+        """Seconds to wait before the next API call."""
+        pct = min(self.usage_pct, 100.0)
+        if pct <= self.THROTTLE_PCT:
+            return 0.0
+        return self.base_interval * (1 + 4 * (pct - self.THROTTLE_PCT) / (100.0 - self.THROTTLE_PCT))
+
+    def serve_stale(self, age: float) -> bool:
+        """Whether a cached result `age` seconds old should be served instead of fetching."""
+        return age < self.max_stale and self.mode == "cached_only"
+
+    def pace(self) -> None:
+        """Block the calling (worker) thread for the current delay."""
+        delay = self.delay()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire(self) -> None:
+        """Wait on the event loop for the current delay."""
+        delay = self.delay()
+        if delay:
+            await asyncio.sleep(delay)
@@ -9,10 +9,86 @@ Author: Backend Developer
 Date: 2025-11-09
 """
 
-from typing import Dict, List, Optional, Any, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Union
+import asyncio
+import functools
+import math
 import time
 from datetime import datetime, timedelta
 
+from typing_extensions import Required, TypedDict
+
+# Accepted order_type and time-in-force values
+_VALID_ORDER_TYPES = frozenset(("limit", "market"))
+_VALID_TIF = frozenset(("Gtc", "Ioc", "Alo"))
+
+# Successful placements remembered per cloid so client retries are not
+# re-sent: at most _CLOID_CACHE_SIZE entries, each for _CLOID_CACHE_TTL seconds.
+# A retry is only answered locally when its order parameters match.
+_CLOID_CACHE_SIZE = 4096
+_CLOID_CACHE_TTL = 60.0
+
+# Most orders remembered per coin for cancel_all_orders(coin)'s early cancel;
+# fills are not observed, so the oldest entries are dropped beyond this
+_RESTING_TRACK_SIZE = 256
+
+# Value types the column fast path in _check_batch_numbers accepts as-is
+_PLAIN_NUMBER_TYPES = frozenset((float, int))
+
+
+def _dig(obj: Any, *path: Union[str, int], default: Any = None) -> Any:
+    """
+    Follow a path of keys/indexes into a nested exchange response.
+
+    Args:
+        obj: Response object (dicts and lists)
+        *path: Keys and list indexes to follow in order
+        default: Returned if any step is missing or of the wrong type
+
+    Returns:
+        The value at the end of the path, or default
+    """
+    try:
+        for key in path:
+            obj = obj[key]
+        return obj
+    except (KeyError, IndexError, TypeError):
+        return default
+
+
+def _placement_key(
+    coin: Any,
+    is_buy: Any,
+    size: Any,
+    price: Any,
+    order_type: Any,
+    tif: Any,
+    reduce_only: Any
+) -> Tuple[Any, ...]:
+    """Order parameters a cloid retry must repeat to be answered from the cache."""
+    return (coin, is_buy, size, price, order_type, tif if order_type == "limit" else None, bool(reduce_only))
+
+
+class OrderResult(TypedDict, total=False):
+    """Result of place_order; failed orders carry only success, error, coin and timestamp."""
+    success: Required[bool]
+    order_id: Optional[int]
+    status: str
+    coin: str
+    side: str
+    size: float
+    price: float
+    order_type: str
+    tif: str
+    reduce_only: bool
+    cloid: Optional[str]
+    deduplicated: bool
+    timestamp: str
+    response: Dict[str, Any]
+    error: Any
+
 
 class TradingTools:
     """
@@ -27,6 +103,23 @@ class TradingTools:
     - Dead man's switch for risk management
     """
 
+    __slots__ = (
+        "exchange",
+        "info",
+        "account",
+        "_order",
+        "_cancel",
+        "_bulk_orders",
+        "_bulk_cancel",
+        "_modify_order",
+        "_update_leverage",
+        "_update_isolated_margin",
+        "_open_orders",
+        "_signer",
+        "_cloid_cache",
+        "_resting_orders",
+    )
+
     def __init__(self, exchange_client, info_client, account_address: str):
         """
         Initialize TradingTools with Hyperliquid SDK clients.
@@ -40,6 +133,187 @@ class TradingTools:
         self.info = info_client
         self.account = account_address
 
+        # SDK methods resolved once; twap_order and update_dead_mans_switch
+        # are not part of every SDK version, so they stay looked up per call
+        self._order = exchange_client.order
+        self._cancel = exchange_client.cancel
+        self._bulk_orders = exchange_client.bulk_orders
+        self._bulk_cancel = exchange_client.bulk_cancel
+        self._modify_order = exchange_client.modify_order
+        self._update_leverage = exchange_client.update_leverage
+        self._update_isolated_margin = exchange_client.update_isolated_margin
+        self._open_orders = info_client.open_orders
+
+        # Every signed Exchange call runs on this one worker thread, in
+        # submission order: the SDK derives nonces from the millisecond clock
+        # and shares one requests.Session, so signed calls must never overlap,
+        # and the event loop stays free while they wait on the network
+        self._signer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hl-signer")
+
+        # cloid -> (monotonic time stored, _placement_key, successful placement result)
+        self._cloid_cache: "OrderedDict[str, Tuple[float, Tuple[Any, ...], Dict[str, Any]]]" = OrderedDict()
+
+        # coin -> {oid: open-order entry} for orders this instance placed and
+        # has not seen canceled or modified, oldest first and capped at
+        # _RESTING_TRACK_SIZE per coin; lets cancel_all_orders(coin) start
+        # canceling before the authoritative open_orders fetch returns
+        self._resting_orders: Dict[str, Dict[int, Dict[str, Any]]] = {}
+
+    async def _signed(self, fn, *args, **kwargs) -> Any:
+        """Run a signed Exchange call on the signer thread and await its result."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._signer, functools.partial(fn, *args, **kwargs)
+        )
+
+    def _recall_cloid(self, cloid: str, key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        """
+        Return the remembered result for a recently placed cloid, if any.
+
+        Args:
+            cloid: Client order ID
+            key: _placement_key of the order being placed now
+
+        Returns:
+            Copy of the original result marked "deduplicated", or None if the
+            cloid is unknown, its entry has expired, or it was placed with
+            different parameters (the exchange then rejects the duplicate)
+        """
+        entry = self._cloid_cache.get(cloid)
+        if entry is None:
+            return None
+
+        stored_at, stored_key, result = entry
+        if time.monotonic() - stored_at >= _CLOID_CACHE_TTL:
+            del self._cloid_cache[cloid]
+            return None
+
+        if stored_key != key:
+            return None
+
+        self._cloid_cache.move_to_end(cloid)
+        return {**result, "deduplicated": True}
+
+    def _track_resting(
+        self,
+        coin: str,
+        order_id: Optional[int],
+        is_buy: bool,
+        size: Any,
+        price: Any,
+        cloid: Optional[str] = None
+    ) -> None:
+        """Record an order that rested on the book, in the shape of an open_orders entry."""
+        if order_id is None:
+            return
+        tracked = self._resting_orders.setdefault(coin, {})
+        tracked[order_id] = {
+            "coin": coin,
+            "oid": order_id,
+            "side": "B" if is_buy else "A",
+            "sz": size,
+            "limitPx": price,
+            "cloid": cloid
+        }
+        if len(tracked) > _RESTING_TRACK_SIZE:
+            del tracked[next(iter(tracked))]
+
+    def _forget_resting(self, coin: str, order_id: Optional[int] = None, cloid: Optional[str] = None) -> None:
+        """Stop tracking an order that was canceled or modified, by oid or cloid."""
+        tracked = self._resting_orders.get(coin)
+        if not tracked:
+            return
+        if order_id:
+            tracked.pop(order_id, None)
+        elif cloid:
+            for oid, entry in tracked.items():
+                if entry["cloid"] == cloid:
+                    del tracked[oid]
+                    break
+
+    def _remember_cloid(self, cloid: str, key: Tuple[Any, ...], result: Dict[str, Any]) -> None:
+        """Remember a successful placement, evicting the least recently used entry when full."""
+        self._cloid_cache[cloid] = (time.monotonic(), key, result)
+        self._cloid_cache.move_to_end(cloid)
+        if len(self._cloid_cache) > _CLOID_CACHE_SIZE:
+            self._cloid_cache.popitem(last=False)
+
+    @staticmethod
+    def _check_batch_numbers(orders: List[Dict[str, Any]]) -> Dict[int, str]:
+        """
+        Validate every order's size and price before any network call.
+
+        Missing values are left to the per-order checks in place_batch_orders;
+        any value that is present must be a positive, finite number (numeric
+        strings are accepted).
+
+        Each field is first checked as a whole column: when every value is a
+        plain int/float, a positive min() and a finite sum() prove the column
+        valid without per-value float()/isfinite() calls. Anything else (None,
+        strings, NaN, inf, overflow) drops to the per-order loop, which also
+        produces the error message.
+
+        Args:
+            orders: Raw order dictionaries as passed to place_batch_orders
+
+        Returns:
+            order index -> error message for the first bad field of each
+            offending order (empty when every value is valid)
+        """
+        errors: Dict[int, str] = {}
+        for key in ("size", "price"):
+            column = [order.get(key) for order in orders]
+            if set(map(type, column)) <= _PLAIN_NUMBER_TYPES and min(column) > 0 and math.isfinite(sum(column)):
+                continue
+
+            for idx, value in enumerate(column):
+                if value is None or idx in errors:
+                    continue
+                if isinstance(value, bool):
+                    errors[idx] = f"{key} must be a number, got {value!r}"
+                    continue
+                try:
+                    number = float(value)
+                except (TypeError, ValueError):
+                    errors[idx] = f"{key} must be a number, got {value!r}"
+                    continue
+                if not (number > 0 and math.isfinite(number)):
+                    errors[idx] = f"{key} must be a positive finite number, got {value!r}"
+        return errors
+
+    @staticmethod
+    def _batch_order_error(
+        coin: Any,
+        is_buy: Any,
+        size: Any,
+        price: Any,
+        order_type: Any,
+        tif: Any
+    ) -> Optional[str]:
+        """
+        Check one place_batch_orders entry without raising.
+
+        Sizes and prices have already passed _check_batch_numbers, so only
+        their presence is checked here.
+
+        Returns:
+            Error message for the first failed check, or None if the order is valid
+        """
+        missing = [
+            name for name, value in
+            (("coin", coin), ("is_buy", is_buy), ("size", size), ("price", price))
+            if value is None
+        ]
+        if missing:
+            return f"Missing required fields: {', '.join(missing)}"
+
+        if order_type not in _VALID_ORDER_TYPES:
+            return f"Invalid order_type: {order_type}. Must be 'limit' or 'market'"
+
+        if tif not in _VALID_TIF:
+            return f"Invalid time in force: {tif}. Must be 'Gtc', 'Ioc', or 'Alo'"
+
+        return None
+
     async def place_order(
         self,
         coin: str,
@@ -49,8 +323,9 @@ class TradingTools:
         order_type: str = "limit",
         tif: str = "Gtc",
         reduce_only: bool = False,
-        cloid: Optional[str] = None
-    ) -> Dict[str, Any]:
+        cloid: Optional[str] = None,
+        verbose: bool = False
+    ) -> OrderResult:
         """
         Place a single order on Hyperliquid.
 
@@ -64,13 +339,16 @@ class TradingTools:
                  "Alo" (Add Liquidity Only)
             reduce_only: If True, order can only reduce existing position
             cloid: Client order ID for tracking (optional)
+            verbose: Include the full exchange response in the result
 
         Returns:
             Dict containing:
                 - success: bool
                 - order_id: int (if successful)
                 - status: str
-                - response: dict (full exchange response)
+                - response: dict (full exchange response, only if verbose)
+                - deduplicated: bool (True if cloid was placed recently and
+                  this result was returned without resending the order)
                 - error: str (if failed)
 
         Raises:
@@ -81,52 +359,45 @@ class TradingTools:
             if size <= 0:
                 raise ValueError(f"Order size must be positive, got {size}")
 
-            if order_type not in ["limit", "market"]:
+            if order_type not in _VALID_ORDER_TYPES:
                 raise ValueError(f"Invalid order_type: {order_type}. Must be 'limit' or 'market'")
 
-            if tif not in ["Gtc", "Ioc", "Alo"]:
+            if tif not in _VALID_TIF:
                 raise ValueError(f"Invalid time in force: {tif}. Must be 'Gtc', 'Ioc', or 'Alo'")
 
+            # A retry of a recent successful placement is answered locally
+            if cloid:
+                placement_key = _placement_key(coin, is_buy, size, price, order_type, tif, reduce_only)
+                cached = self._recall_cloid(cloid, placement_key)
+                if cached is not None:
+                    return cached
+
             # Prepare order parameters
-            order_params = {
+            order_kwargs = {
                 "coin": coin,
                 "is_buy": is_buy,
                 "sz": size,
                 "limit_px": price,
-                "order_type": {"limit": "limit", "market": "market"}[order_type],
+                "order_type": order_type,
                 "reduce_only": reduce_only
             }
 
             # Add time in force for limit orders
             if order_type == "limit":
-                order_params["tif"] = tif
+                order_kwargs["tif"] = tif
 
             # Add client order ID if provided
             if cloid:
-                order_params["cloid"] = cloid
+                order_kwargs["cloid"] = cloid
 
             # Execute order
-            response = self.exchange.order(
-                coin=coin,
-                is_buy=is_buy,
-                sz=size,
-                limit_px=price,
-                order_type=order_params["order_type"],
-                reduce_only=reduce_only,
-                **({
-                    "tif": tif
-                } if order_type == "limit" else {}),
-                **({
-                    "cloid": cloid
-                } if cloid else {})
-            )
+            response = await self._signed(self._order, **order_kwargs)
 
             # Parse response
             if response and response.get("status") == "ok":
-                result = response.get("response", {})
-                return {
+                result: OrderResult = {
                     "success": True,
-                    "order_id": result.get("data", {}).get("statuses", [{}])[0].get("resting", {}).get("oid"),
+                    "order_id": _dig(response, "response", "data", "statuses", 0, "resting", "oid"),
                     "status": "placed",
                     "coin": coin,
                     "side": "buy" if is_buy else "sell",
@@ -136,9 +407,14 @@ class TradingTools:
                     "tif": tif,
                     "reduce_only": reduce_only,
                     "cloid": cloid,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "response": response
+                    "timestamp": datetime.utcnow().isoformat()
                 }
+                if verbose:
+                    result["response"] = response
+                if cloid:
+                    self._remember_cloid(cloid, placement_key, result)
+                self._track_resting(coin, result["order_id"], is_buy, size, price, cloid)
+                return result
             else:
                 return {
                     "success": False,
@@ -150,14 +426,14 @@ class TradingTools:
         except ValueError as ve:
             return {
                 "success": False,
-                "error": f"Validation error: {str(ve)}",
+                "error": f"Validation error: {ve}",
                 "coin": coin,
                 "timestamp": datetime.utcnow().isoformat()
             }
         except Exception as e:
             return {
                 "success": False,
-                "error": f"Order placement failed: {str(e)}",
+                "error": f"Order placement failed: {e}",
                 "coin": coin,
                 "timestamp": datetime.utcnow().isoformat()
             }
@@ -200,100 +476,145 @@ class TradingTools:
                     "timestamp": datetime.utcnow().isoformat()
                 }]
 
-            # Validate all orders first
+            # Malformed numbers fail only their own order, never the batch
+            number_errors = self._check_batch_numbers(orders)
+
+            # Validate all orders first; every entry (error stubs included)
+            # carries coin/is_buy/sz/limit_px so result assembly reads them
+            # from here instead of re-querying the raw orders
             validated_orders = []
             for idx, order in enumerate(orders):
-                try:
-                    # Extract parameters with defaults
-                    coin = order.get("coin")
-                    is_buy = order.get("is_buy")
-                    size = order.get("size")
-                    price = order.get("price")
-
-                    if not all([coin, is_buy is not None, size, price]):
-                        raise ValueError("Missing required fields: coin, is_buy, size, price")
-
-                    order_type = order.get("order_type", "limit")
-                    tif = order.get("tif", "Gtc")
-                    reduce_only = order.get("reduce_only", False)
-                    cloid = order.get("cloid")
-
-                    # Validate
-                    if size <= 0:
-                        raise ValueError(f"Order size must be positive, got {size}")
-
-                    validated_order = {
+                coin = order.get("coin")
+                is_buy = order.get("is_buy")
+                size = order.get("size")
+                price = order.get("price")
+                order_type = order.get("order_type", "limit")
+                tif = order.get("tif", "Gtc")
+
+                error = number_errors.get(idx) or self._batch_order_error(
+                    coin, is_buy, size, price, order_type, tif
+                )
+                if error is not None:
+                    validated_orders.append({
                         "coin": coin,
                         "is_buy": is_buy,
                         "sz": size,
                         "limit_px": price,
-                        "order_type": order_type,
-                        "reduce_only": reduce_only,
-                        "order_index": idx
-                    }
+                        "error": error,
+                        "order_index": idx,
+                        "success": False
+                    })
+                    continue
 
-                    if order_type == "limit":
-                        validated_order["tif"] = tif
+                # Numeric strings were accepted above; the exchange needs numbers
+                validated_order = {
+                    "coin": coin,
+                    "is_buy": is_buy,
+                    "sz": float(size) if isinstance(size, str) else size,
+                    "limit_px": float(price) if isinstance(price, str) else price,
+                    "order_type": order_type,
+                    "reduce_only": order.get("reduce_only", False),
+                    "order_index": idx
+                }
 
-                    if cloid:
-                        validated_order["cloid"] = cloid
+                if order_type == "limit":
+                    validated_order["tif"] = tif
 
-                    validated_orders.append(validated_order)
+                cloid = order.get("cloid")
+                if cloid:
+                    validated_order["cloid"] = cloid
 
-                except Exception as e:
-                    validated_orders.append({
-                        "error": str(e),
-                        "order_index": idx,
-                        "success": False
-                    })
+                validated_orders.append(validated_order)
+
+            # Orders that failed validation, and retries of cloids placed
+            # recently, never reach the exchange; their results go straight
+            # into their slots in the result list
+            good = []
+            results: List[Optional[Dict[str, Any]]] = [None] * len(validated_orders)
+            # order_index -> _placement_key, for orders carrying a cloid
+            placement_keys: Dict[int, Tuple[Any, ...]] = {}
+
+            # One timestamp for the whole batch
+            ts = datetime.utcnow().isoformat()
+            for vo in validated_orders:
+                if "error" in vo:
+                    results[vo["order_index"]] = {
+                        "success": False,
+                        "error": vo["error"],
+                        "coin": vo["coin"],
+                        "order_index": vo["order_index"],
+                        "timestamp": ts
+                    }
+                    continue
+
+                cloid = vo.get("cloid")
+                if cloid:
+                    vo_key = placement_keys[vo["order_index"]] = _placement_key(
+                        vo["coin"], vo["is_buy"], vo["sz"], vo["limit_px"],
+                        vo["order_type"], vo.get("tif"), vo["reduce_only"]
+                    )
+                    cached = self._recall_cloid(cloid, vo_key)
+                else:
+                    cached = None
+                if cached is not None:
+                    cached["order_index"] = vo["order_index"]
+                    results[vo["order_index"]] = cached
+                else:
+                    good.append(vo)
+
+            if not good:
+                return results
 
             # Execute batch order
-            batch_response = self.exchange.bulk_orders(validated_orders)
+            batch_response = await self._signed(self._bulk_orders, good)
 
-            # Parse results
-            results = []
             if batch_response and batch_response.get("status") == "ok":
-                response_data = batch_response.get("response", {}).get("data", {})
-                statuses = response_data.get("statuses", [])
+                statuses = _dig(batch_response, "response", "data", "statuses") or []
+                statuses = statuses + [{"error": "No status returned"}] * (len(good) - len(statuses))
 
-                for idx, (order, status) in enumerate(zip(orders, statuses)):
+                for vo, status in zip(good, statuses):
                     if status.get("resting"):
-                        results.append({
+                        result = results[vo["order_index"]] = {
                             "success": True,
                             "order_id": status["resting"].get("oid"),
                             "status": "placed",
-                            "coin": order.get("coin"),
-                            "side": "buy" if order.get("is_buy") else "sell",
-                            "size": order.get("size"),
-                            "price": order.get("price"),
-                            "order_index": idx,
-                            "timestamp": datetime.utcnow().isoformat()
-                        })
+                            "coin": vo["coin"],
+                            "side": "buy" if vo["is_buy"] else "sell",
+                            "size": vo["sz"],
+                            "price": vo["limit_px"],
+                            "order_index": vo["order_index"],
+                            "timestamp": ts
+                        }
+                        if "cloid" in vo:
+                            self._remember_cloid(vo["cloid"], placement_keys[vo["order_index"]], result)
+                        self._track_resting(
+                            vo["coin"], result["order_id"], vo["is_buy"], vo["sz"], vo["limit_px"], vo.get("cloid")
+                        )
                     else:
-                        results.append({
+                        results[vo["order_index"]] = {
                             "success": False,
                             "error": status.get("error", "Order not resting"),
-                            "coin": order.get("coin"),
-                            "order_index": idx,
-                            "timestamp": datetime.utcnow().isoformat()
-                        })
+                            "coin": vo["coin"],
+                            "order_index": vo["order_index"],
+                            "timestamp": ts
+                        }
             else:
-                # All orders failed
-                for idx, order in enumerate(orders):
-                    results.append({
+                # Every submitted order failed
+                for vo in good:
+                    results[vo["order_index"]] = {
                         "success": False,
                         "error": batch_response.get("response", "Batch order failed"),
-                        "coin": order.get("coin"),
-                        "order_index": idx,
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
+                        "coin": vo["coin"],
+                        "order_index": vo["order_index"],
+                        "timestamp": ts
+                    }
 
             return results
 
         except Exception as e:
             return [{
                 "success": False,
-                "error": f"Batch order execution failed: {str(e)}",
+                "error": f"Batch order execution failed: {e}",
                 "timestamp": datetime.utcnow().isoformat()
             }]
 
@@ -301,7 +622,8 @@ class TradingTools:
         self,
         coin: str,
         order_id: Optional[int] = None,
-        cloid: Optional[str] = None
+        cloid: Optional[str] = None,
+        verbose: bool = False
     ) -> Dict[str, Any]:
         """
         Cancel a specific order by order ID or client order ID.
@@ -310,13 +632,14 @@ class TradingTools:
             coin: Trading pair symbol
             order_id: Exchange order ID (optional if cloid provided)
             cloid: Client order ID (optional if order_id provided)
+            verbose: Include the full exchange response in the result
 
         Returns:
             Dict containing:
                 - success: bool
                 - order_id: int (canceled order ID)
                 - status: str
-                - response: dict (full exchange response)
+                - response: dict (full exchange response, only if verbose)
                 - error: str (if failed)
 
         Raises:
@@ -327,33 +650,28 @@ class TradingTools:
                 raise ValueError("Must provide either order_id or cloid")
 
             # Prepare cancellation request
-            cancel_params = {"coin": coin}
+            cancel_kwargs = {"coin": coin, "oid": order_id or None}
 
-            if order_id:
-                cancel_params["oid"] = order_id
-            elif cloid:
-                cancel_params["cloid"] = cloid
+            if cloid and not order_id:
+                cancel_kwargs["cloid"] = cloid
 
             # Execute cancellation
-            response = self.exchange.cancel(
-                coin=coin,
-                oid=order_id if order_id else None,
-                **({
-                    "cloid": cloid
-                } if cloid and not order_id else {})
-            )
+            response = await self._signed(self._cancel, **cancel_kwargs)
 
             # Parse response
             if response and response.get("status") == "ok":
-                return {
+                self._forget_resting(coin, order_id, cloid)
+                result = {
                     "success": True,
                     "order_id": order_id,
                     "cloid": cloid,
                     "coin": coin,
                     "status": "canceled",
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "response": response
+                    "timestamp": datetime.utcnow().isoformat()
                 }
+                if verbose:
+                    result["response"] = response
+                return result
             else:
                 return {
                     "success": False,
@@ -367,14 +685,14 @@ class TradingTools:
         except ValueError as ve:
             return {
                 "success": False,
-                "error": f"Validation error: {str(ve)}",
+                "error": f"Validation error: {ve}",
                 "coin": coin,
                 "timestamp": datetime.utcnow().isoformat()
             }
         except Exception as e:
             return {
                 "success": False,
-                "error": f"Order cancellation failed: {str(e)}",
+                "error": f"Order cancellation failed: {e}",
                 "coin": coin,
                 "timestamp": datetime.utcnow().isoformat()
             }
@@ -394,15 +712,72 @@ class TradingTools:
                 - status: str
                 - error: str (if failed)
 
+        Note:
+            When coin is given and this instance placed orders on it, those
+            orders are canceled while the open orders list is still being
+            fetched; anything else the list shows is canceled afterwards. If
+            the list cannot be fetched, the orders already canceled are
+            returned with status "partial" and an error.
+
         Warning:
             If coin is None, this will cancel ALL open orders on the account.
             Use with caution.
         """
         try:
-            # Get all open orders
-            open_orders_response = self.info.open_orders(self.account)
+            # Get all open orders (blocking SDK calls run off the event loop).
+            # Orders known to rest on this coin are canceled in parallel with
+            # the unsigned fetch; the cancels go through the signer thread
+            # like every other signed call.
+            if coin is None:
+                known = {}
+                self._resting_orders.clear()
+            else:
+                known = self._resting_orders.pop(coin, {})
+
+            early_canceled = []
+            if known:
+                # The early cancel is best effort: if it raises, the
+                # open_orders path below still cancels everything
+                early_cancels = [{"coin": coin, "oid": oid} for oid in known]
+                open_orders_response, early_response = await asyncio.gather(
+                    asyncio.to_thread(self._open_orders, self.account),
+                    self._signed(self._bulk_cancel, early_cancels),
+                    return_exceptions=True
+                )
+                if isinstance(early_response, dict) and early_response.get("status") == "ok":
+                    early_statuses = _dig(early_response, "response", "data", "statuses") or []
+                    early_canceled = [
+                        self._canceled_entry(order)
+                        for order, status in zip(known.values(), early_statuses)
+                        if status == "success"
+                    ]
+                if isinstance(open_orders_response, BaseException):
+                    # Keep tracking whatever the early cancel did not remove
+                    done = {entry["order_id"] for entry in early_canceled}
+                    self._resting_orders.setdefault(coin, {}).update(
+                        (oid, entry) for oid, entry in known.items() if oid not in done
+                    )
+                    if not early_canceled:
+                        raise open_orders_response
+                    # Report what was canceled; the rest could not be listed
+                    return {
+                        "success": False,
+                        "canceled_count": len(early_canceled),
+                        "failed_count": 0,
+                        "orders": early_canceled,
+                        "failed_orders": None,
+                        "status": "partial",
+                        "error": f"Open orders could not be fetched: {open_orders_response}",
+                        "coin": coin,
+                        "timestamp": datetime.utcnow().isoformat()
+                    }
+            else:
+                open_orders_response = await asyncio.to_thread(self._open_orders, self.account)
+
+            # Orders the early cancel already removed may still be listed
+            done_oids = {entry["order_id"] for entry in early_canceled}
 
-            if not open_orders_response:
+            if not open_orders_response and not early_canceled:
                 return {
                     "success": True,
                     "canceled_count": 0,
@@ -413,12 +788,15 @@ class TradingTools:
                 }
 
             # Filter by coin if specified
-            orders_to_cancel = []
-            for order in open_orders_response:
-                if coin is None or order.get("coin") == coin:
-                    orders_to_cancel.append(order)
+            if coin is None:
+                orders_to_cancel = open_orders_response
+            else:
+                orders_to_cancel = [
+                    order for order in open_orders_response or ()
+                    if order.get("coin") == coin and order.get("oid") not in done_oids
+                ]
 
-            if not orders_to_cancel:
+            if not orders_to_cancel and not early_canceled:
                 return {
                     "success": True,
                     "canceled_count": 0,
@@ -428,41 +806,37 @@ class TradingTools:
                     "timestamp": datetime.utcnow().isoformat()
                 }
 
-            # Cancel all matching orders
-            canceled_orders = []
+            # Cancel all matching orders in one signed request; fall back to
+            # one request per order if the bulk call is rejected as a whole
+            canceled_orders = early_canceled
             failed_cancellations = []
 
-            for order in orders_to_cancel:
-                try:
-                    order_coin = order.get("coin")
-                    order_id = order.get("oid")
-
-                    cancel_response = self.exchange.cancel(
-                        coin=order_coin,
-                        oid=order_id
+            if orders_to_cancel:
+                cancels = [{"coin": order.get("coin"), "oid": order.get("oid")} for order in orders_to_cancel]
+                bulk_response = await self._signed(self._bulk_cancel, cancels)
+
+                if bulk_response and bulk_response.get("status") == "ok":
+                    statuses = _dig(bulk_response, "response", "data", "statuses") or []
+                    statuses = statuses + [None] * (len(orders_to_cancel) - len(statuses))
+
+                    for order, status in zip(orders_to_cancel, statuses):
+                        if status == "success":
+                            canceled_orders.append(self._canceled_entry(order))
+                        else:
+                            if isinstance(status, dict):
+                                error = status.get("error", "Unknown error")
+                            else:
+                                error = status or "No status returned"
+                            failed_cancellations.append({
+                                "coin": order.get("coin"),
+                                "order_id": order.get("oid"),
+                                "error": error
+                            })
+                else:
+                    each_canceled, failed_cancellations = await self._signed(
+                        self._cancel_each, orders_to_cancel
                     )
-
-                    if cancel_response and cancel_response.get("status") == "ok":
-                        canceled_orders.append({
-                            "coin": order_coin,
-                            "order_id": order_id,
-                            "side": order.get("side"),
-                            "size": order.get("sz"),
-                            "price": order.get("limitPx")
-                        })
-                    else:
-                        failed_cancellations.append({
-                            "coin": order_coin,
-                            "order_id": order_id,
-                            "error": cancel_response.get("response", "Unknown error")
-                        })
-
-                except Exception as e:
-                    failed_cancellations.append({
-                        "coin": order.get("coin"),
-                        "order_id": order.get("oid"),
-                        "error": str(e)
-                    })
+                    canceled_orders.extend(each_canceled)
 
             return {
                 "success": len(failed_cancellations) == 0,
@@ -478,17 +852,75 @@ class TradingTools:
         except Exception as e:
             return {
                 "success": False,
-                "error": f"Cancel all orders failed: {str(e)}",
+                "error": f"Cancel all orders failed: {e}",
                 "coin": coin,
                 "timestamp": datetime.utcnow().isoformat()
             }
 
+    def _cancel_each(
+        self,
+        orders: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Cancel orders one request at a time (fallback for cancel_all_orders).
+
+        Runs on the signer thread. The requests stay sequential: every signed
+        action uses the current time in milliseconds as its nonce, and the
+        exchange rejects reused nonces, so parallel cancels from one wallet
+        would fail at random.
+
+        Args:
+            orders: Open orders as returned by Info.open_orders
+
+        Returns:
+            Tuple of (canceled order entries, failed cancellation entries)
+        """
+        canceled_orders = []
+        failed_cancellations = []
+
+        for order in orders:
+            try:
+                order_coin = order.get("coin")
+                order_id = order.get("oid")
+
+                cancel_response = self._cancel(order_coin, order_id)
+
+                if cancel_response and cancel_response.get("status") == "ok":
+                    canceled_orders.append(self._canceled_entry(order))
+                else:
+                    failed_cancellations.append({
+                        "coin": order_coin,
+                        "order_id": order_id,
+                        "error": cancel_response.get("response", "Unknown error")
+                    })
+
+            except Exception as e:
+                failed_cancellations.append({
+                    "coin": order.get("coin"),
+                    "order_id": order.get("oid"),
+                    "error": str(e)
+                })
+
+        return canceled_orders, failed_cancellations
+
+    @staticmethod
+    def _canceled_entry(order: Dict[str, Any]) -> Dict[str, Any]:
+        """Describe a successfully canceled open order for cancel_all_orders()."""
+        return {
+            "coin": order.get("coin"),
+            "order_id": order.get("oid"),
+            "side": order.get("side"),
+            "size": order.get("sz"),
+            "price": order.get("limitPx")
+        }
+
     async def modify_order(
         self,
         coin: str,
         order_id: int,
         new_price: Optional[float] = None,
-        new_size: Optional[float] = None
+        new_size: Optional[float] = None,
+        verbose: bool = False
     ) -> Dict[str, Any]:
         """
         Modify an existing order's price and/or size.
@@ -498,6 +930,7 @@ class TradingTools:
             order_id: Exchange order ID to modify
             new_price: New limit price (optional)
             new_size: New order size (optional)
+            verbose: Include the full exchange response in the result
 
         Returns:
             Dict containing:
@@ -522,46 +955,41 @@ class TradingTools:
                 raise ValueError(f"New size must be positive, got {new_size}")
 
             # Prepare modification parameters
-            modify_params = {
+            modify_kwargs = {
                 "coin": coin,
                 "oid": order_id
             }
 
             if new_price is not None:
-                modify_params["limit_px"] = new_price
+                modify_kwargs["limit_px"] = new_price
 
             if new_size is not None:
-                modify_params["sz"] = new_size
+                modify_kwargs["sz"] = new_size
 
             # Execute modification
-            response = self.exchange.modify_order(
-                coin=coin,
-                oid=order_id,
-                **({
-                    "limit_px": new_price
-                } if new_price is not None else {}),
-                **({
-                    "sz": new_size
-                } if new_size is not None else {})
-            )
+            response = await self._signed(self._modify_order, **modify_kwargs)
 
             # Parse response
             if response and response.get("status") == "ok":
+                # The exchange may assign the modified order a new oid
+                self._forget_resting(coin, order_id)
                 modifications = {}
                 if new_price is not None:
                     modifications["price"] = new_price
                 if new_size is not None:
                     modifications["size"] = new_size
 
-                return {
+                result = {
                     "success": True,
                     "order_id": order_id,
                     "coin": coin,
                     "modifications": modifications,
                     "status": "modified",
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "response": response
+                    "timestamp": datetime.utcnow().isoformat()
                 }
+                if verbose:
+                    result["response"] = response
+                return result
             else:
                 return {
                     "success": False,
@@ -574,7 +1002,7 @@ class TradingTools:
         except ValueError as ve:
             return {
                 "success": False,
-                "error": f"Validation error: {str(ve)}",
+                "error": f"Validation error: {ve}",
                 "order_id": order_id,
                 "coin": coin,
                 "timestamp": datetime.utcnow().isoformat()
@@ -582,7 +1010,7 @@ class TradingTools:
         except Exception as e:
             return {
                 "success": False,
-                "error": f"Order modification failed: {str(e)}",
+                "error": f"Order modification failed: {e}",
                 "order_id": order_id,
                 "coin": coin,
                 "timestamp": datetime.utcnow().isoformat()
@@ -594,7 +1022,8 @@ class TradingTools:
         is_buy: bool,
         total_size: float,
         duration_minutes: int,
-        randomize: bool = False
+        randomize: bool = False,
+        verbose: bool = False
     ) -> Dict[str, Any]:
         """
         Place a Time-Weighted Average Price (TWAP) order.
@@ -608,6 +1037,7 @@ class TradingTools:
             total_size: Total size to execute over the duration
             duration_minutes: Time period to spread the order over (in minutes)
             randomize: If True, randomize slice timing to reduce predictability
+            verbose: Include the full exchange response in the result
 
         Returns:
             Dict containing:
@@ -644,21 +1074,15 @@ class TradingTools:
             }
 
             # Execute TWAP order
-            response = self.exchange.twap_order(
-                coin=coin,
-                is_buy=is_buy,
-                sz=total_size,
-                duration=duration_minutes * 60,
-                randomize=randomize
-            )
+            response = await self._signed(self.exchange.twap_order, **twap_params)
 
             # Parse response
             if response and response.get("status") == "ok":
-                twap_data = response.get("response", {}).get("data", {})
+                now = datetime.utcnow()
 
-                return {
+                result = {
                     "success": True,
-                    "twap_id": twap_data.get("twap_id", f"twap_{int(time.time())}"),
+                    "twap_id": _dig(response, "response", "data", "twap_id", default=f"twap_{int(time.time())}"),
                     "coin": coin,
                     "side": "buy" if is_buy else "sell",
                     "total_size": total_size,
@@ -666,12 +1090,12 @@ class TradingTools:
                     "estimated_slices": estimated_slices,
                     "randomize": randomize,
                     "status": "active",
-                    "start_time": datetime.utcnow().isoformat(),
-                    "estimated_end_time": (
-                        datetime.utcnow() + timedelta(minutes=duration_minutes)
-                    ).isoformat(),
-                    "response": response
+                    "start_time": now.isoformat(),
+                    "estimated_end_time": (now + timedelta(minutes=duration_minutes)).isoformat()
                 }
+                if verbose:
+                    result["response"] = response
+                return result
             else:
                 return {
                     "success": False,
@@ -683,14 +1107,14 @@ class TradingTools:
         except ValueError as ve:
             return {
                 "success": False,
-                "error": f"Validation error: {str(ve)}",
+                "error": f"Validation error: {ve}",
                 "coin": coin,
                 "timestamp": datetime.utcnow().isoformat()
             }
         except Exception as e:
             return {
                 "success": False,
-                "error": f"TWAP order placement failed: {str(e)}",
+                "error": f"TWAP order placement failed: {e}",
                 "coin": coin,
                 "timestamp": datetime.utcnow().isoformat()
             }
@@ -699,7 +1123,8 @@ class TradingTools:
         self,
         coin: str,
         leverage: int,
-        is_cross: bool = True
+        is_cross: bool = True,
+        verbose: bool = False
     ) -> Dict[str, Any]:
         """
         Adjust leverage for a perpetual trading pair.
@@ -708,6 +1133,7 @@ class TradingTools:
             coin: Trading pair symbol
             leverage: Leverage multiplier (e.g., 10 for 10x)
             is_cross: True for cross margin, False for isolated margin
+            verbose: Include the full exchange response in the result
 
         Returns:
             Dict containing:
@@ -736,7 +1162,8 @@ class TradingTools:
                 raise ValueError(f"Leverage {leverage}x exceeds typical maximum of 50x")
 
             # Execute leverage update
-            response = self.exchange.update_leverage(
+            response = await self._signed(
+                self._update_leverage,
                 coin=coin,
                 leverage=leverage,
                 is_cross=is_cross
@@ -744,15 +1171,17 @@ class TradingTools:
 
             # Parse response
             if response and response.get("status") == "ok":
-                return {
+                result = {
                     "success": True,
                     "coin": coin,
                     "leverage": leverage,
                     "margin_mode": "cross" if is_cross else "isolated",
                     "status": "updated",
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "response": response
+                    "timestamp": datetime.utcnow().isoformat()
                 }
+                if verbose:
+                    result["response"] = response
+                return result
             else:
                 return {
                     "success": False,
@@ -764,14 +1193,14 @@ class TradingTools:
         except ValueError as ve:
             return {
                 "success": False,
-                "error": f"Validation error: {str(ve)}",
+                "error": f"Validation error: {ve}",
                 "coin": coin,
                 "timestamp": datetime.utcnow().isoformat()
             }
         except Exception as e:
             return {
                 "success": False,
-                "error": f"Leverage adjustment failed: {str(e)}",
+                "error": f"Leverage adjustment failed: {e}",
                 "coin": coin,
                 "timestamp": datetime.utcnow().isoformat()
             }
@@ -780,7 +1209,8 @@ class TradingTools:
         self,
         coin: str,
         amount: float,
-        is_add: bool = True
+        is_add: bool = True,
+        verbose: bool = False
     ) -> Dict[str, Any]:
         """
         Add or remove USDC from an isolated margin position.
@@ -789,6 +1219,7 @@ class TradingTools:
             coin: Trading pair symbol
             amount: Amount of USDC to add or remove
             is_add: True to add margin, False to remove margin
+            verbose: Include the full exchange response in the result
 
         Returns:
             Dict containing:
@@ -809,13 +1240,17 @@ class TradingTools:
             Removing too much margin may trigger liquidation if position
             margin falls below maintenance requirements.
         """
+        # One clock read serves every return path
+        timestamp = datetime.utcnow().isoformat()
+
         try:
             # Input validation
             if amount <= 0:
                 raise ValueError(f"Amount must be positive, got {amount}")
 
             # Execute margin update
-            response = self.exchange.update_isolated_margin(
+            response = await self._signed(
+                self._update_isolated_margin,
                 coin=coin,
                 is_buy=is_add,
                 ntli=amount  # Note: ntli = notional transfer leverage isolated
@@ -823,39 +1258,41 @@ class TradingTools:
 
             # Parse response
             if response and response.get("status") == "ok":
-                return {
+                result = {
                     "success": True,
                     "coin": coin,
                     "amount": amount,
                     "action": "added" if is_add else "removed",
                     "status": "updated",
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "response": response
+                    "timestamp": timestamp
                 }
+                if verbose:
+                    result["response"] = response
+                return result
             else:
                 return {
                     "success": False,
                     "error": response.get("response", "Isolated margin update failed"),
                     "coin": coin,
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": timestamp
                 }
 
         except ValueError as ve:
             return {
                 "success": False,
-                "error": f"Validation error: {str(ve)}",
+                "error": f"Validation error: {ve}",
                 "coin": coin,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp
             }
         except Exception as e:
             return {
                 "success": False,
-                "error": f"Isolated margin modification failed: {str(e)}",
+                "error": f"Isolated margin modification failed: {e}",
                 "coin": coin,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp
             }
 
-    async def update_dead_mans_switch(self, delay_seconds: int) -> Dict[str, Any]:
+    async def update_dead_mans_switch(self, delay_seconds: int, verbose: bool = False) -> Dict[str, Any]:
         """
         Configure dead man's switch to auto-cancel all orders after a delay.
 
@@ -866,6 +1303,7 @@ class TradingTools:
 
         Args:
             delay_seconds: Time in seconds before auto-canceling (minimum 5)
+            verbose: Include the full exchange response in the result
 
         Returns:
             Dict containing:
@@ -885,6 +1323,10 @@ class TradingTools:
             Set the delay high enough to account for network latency and
             temporary disconnections.
         """
+        # One clock read serves every return path and the trigger time
+        now = datetime.utcnow()
+        timestamp = now.isoformat()
+
         try:
             # Input validation
             if delay_seconds < 5:
@@ -893,39 +1335,42 @@ class TradingTools:
                 )
 
             # Execute dead man's switch update
-            response = self.exchange.update_dead_mans_switch(
+            response = await self._signed(
+                self.exchange.update_dead_mans_switch,
                 timeout=delay_seconds
             )
 
             # Calculate trigger time
-            trigger_time = datetime.utcnow() + timedelta(seconds=delay_seconds)
+            trigger_time = now + timedelta(seconds=delay_seconds)
 
             # Parse response
             if response and response.get("status") == "ok":
-                return {
+                result = {
                     "success": True,
                     "delay_seconds": delay_seconds,
                     "trigger_time": trigger_time.isoformat(),
                     "status": "armed",
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "response": response
+                    "timestamp": timestamp
                 }
+                if verbose:
+                    result["response"] = response
+                return result
             else:
                 return {
                     "success": False,
                     "error": response.get("response", "Dead man's switch update failed"),
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": timestamp
                 }
 
         except ValueError as ve:
             return {
                 "success": False,
-                "error": f"Validation error: {str(ve)}",
-                "timestamp": datetime.utcnow().isoformat()
+                "error": f"Validation error: {ve}",
+                "timestamp": timestamp
             }
         except Exception as e:
             return {
                 "success": False,
-                "error": f"Dead man's switch update failed: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat()
+                "error": f"Dead man's switch update failed: {e}",
+                "timestamp": timestamp
             }
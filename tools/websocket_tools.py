@@ -9,17 +9,56 @@ Provides real-time WebSocket connectivity for:
 """
 
 import asyncio
-import json
+import contextlib
 import logging
+import random
 import time
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple, Union
 from datetime import datetime
 from enum import Enum
+import orjson
 import websockets
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
 logger = logging.getLogger(__name__)
 
+# Accepted subscribe_market_data() types (a tuple keeps the error message ordered)
+_MARKET_DATA_TYPES = ("l2Book", "trades", "candle")
+
+# Upper bound on the backoff between reconnection attempts (seconds)
+_MAX_RECONNECT_DELAY = 30.0
+
+# Messages kept for get_next_message(); the oldest are dropped beyond this
+_MESSAGE_QUEUE_SIZE = 1024
+
+# Most distinct raw channel names remembered with their routing key
+_CHANNEL_KEY_CACHE_SIZE = 64
+
+# Shared managers keyed by (ws_url, account_address or ""), so every
+# WebSocketTools for the same endpoint multiplexes its subscriptions over one
+# connection and one listen task. _ws_refcounts counts the holders of each.
+_ws_pool: Dict[Tuple[str, str], "WebSocketManager"] = {}
+_ws_refcounts: Dict[Tuple[str, str], int] = {}
+
+
+def _acquire_manager(key: Tuple[str, str]) -> "WebSocketManager":
+    """Return the pooled manager for key, creating it on first use."""
+    manager = _ws_pool.get(key)
+    if manager is None:
+        manager = _ws_pool[key] = WebSocketManager(*key)
+    _ws_refcounts[key] = _ws_refcounts.get(key, 0) + 1
+    return manager
+
+
+def _release_manager(key: Tuple[str, str]) -> Optional["WebSocketManager"]:
+    """Drop one reference; return the manager if that was the last one."""
+    remaining = _ws_refcounts.get(key, 0) - 1
+    if remaining > 0:
+        _ws_refcounts[key] = remaining
+        return None
+    _ws_refcounts.pop(key, None)
+    return _ws_pool.pop(key, None)
+
 
 class SubscriptionType(Enum):
     """WebSocket subscription types"""
@@ -29,6 +68,7 @@ class SubscriptionType(Enum):
     CANDLE = "candle"
     ORDER_UPDATES = "orderUpdates"
     USER_FILLS = "userFills"
+    ALL_MIDS = "allMids"
 
 
 class WebSocketManager:
@@ -45,23 +85,42 @@ class WebSocketManager:
             user_address: User's wallet address for authenticated subscriptions
         """
         self.url = url
-        self.user_address = user_address
+        self.user_address = user_address or None
         self.ws = None
+        self.listen_task: Optional[asyncio.Task] = None
+        self._start_lock = asyncio.Lock()
         self.connected = False
         self.subscriptions: Dict[str, Dict[str, Any]] = {}
-        self.message_handlers: Dict[str, List[Callable]] = {}
+        # sub_id -> [(is_coroutine_function, callback)], classified once at
+        # registration so dispatch does no introspection per message
+        self.message_handlers: Dict[str, List[Tuple[bool, Callable]]] = {}
+        # Lowercased channel -> (sub_id, subscription dict, handler list) for
+        # each subscription it is delivered to, so dispatch needs no per-ID
+        # lookups. Tuples are replaced, never mutated, so dispatch can iterate
+        # one while a handler subscribes or unsubscribes.
+        self._sub_by_channel: Dict[str, Tuple[Tuple[str, Dict[str, Any], List[Tuple[bool, Callable]]], ...]] = {}
+        # Raw channel name -> routing key; the server uses a handful of
+        # names, so split/lower runs once per name instead of per message
+        self._channel_keys: Dict[str, str] = {}
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = 5
         self.base_reconnect_delay = 1.0
-        self.message_queue = asyncio.Queue()
+        self.message_queue = asyncio.Queue(maxsize=_MESSAGE_QUEUE_SIZE)
+        # Set once someone polls get_next_message(); until then messages
+        # only go to callbacks
+        self.queue_enabled = False
         self.running = False
-        self.stats = {
-            "messages_received": 0,
-            "messages_sent": 0,
-            "reconnections": 0,
-            "last_message_time": None,
-            "connection_start_time": None
-        }
+        # Message times are taken from the monotonic clock and converted to
+        # wall-clock ISO strings only when read
+        self._wall_anchor = time.time()
+        self._mono_anchor_ns = time.monotonic_ns()
+        self._last_message_ns: Optional[int] = None
+        # Counters are plain attributes; get_stats() assembles the dict
+        self._messages_received = 0
+        self._messages_sent = 0
+        self._reconnections = 0
+        self._dropped_messages = 0
+        self._connection_start_time: Optional[str] = None
 
         logger.info(f"WebSocketManager initialized with URL: {url}")
 
@@ -69,15 +128,19 @@ class WebSocketManager:
         """Establish WebSocket connection"""
         try:
             logger.info(f"Connecting to WebSocket: {self.url}")
+            # Frames are small JSON documents; per-message deflate costs more
+            # CPU and latency than it saves in bandwidth
             self.ws = await websockets.connect(
                 self.url,
+                compression=None,
+                max_queue=32,
                 ping_interval=20,
                 ping_timeout=10,
                 close_timeout=10
             )
             self.connected = True
             self.reconnect_attempts = 0
-            self.stats["connection_start_time"] = datetime.now().isoformat()
+            self._connection_start_time = datetime.now().isoformat()
             logger.info("WebSocket connected successfully")
 
             # Resubscribe to all active subscriptions
@@ -88,6 +151,25 @@ class WebSocketManager:
             self.connected = False
             raise
 
+    async def start(self):
+        """Connect and start the listen task, unless already running"""
+        async with self._start_lock:
+            if self.listen_task is not None and not self.listen_task.done():
+                return
+            await self.connect()
+            self.listen_task = asyncio.create_task(self.listen())
+
+    async def stop(self):
+        """Stop the listen task and close the connection"""
+        task, self.listen_task = self.listen_task, None
+        if task is not None:
+            task.cancel()
+            # listen() handles its own errors, so cancellation is the only
+            # way it ends
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.disconnect()
+
     async def disconnect(self):
         """Close WebSocket connection"""
         try:
@@ -102,23 +184,32 @@ class WebSocketManager:
             self.ws = None
 
     async def reconnect(self):
-        """Reconnect with exponential backoff"""
-        if self.reconnect_attempts >= self.max_reconnect_attempts:
-            logger.error(f"Max reconnection attempts ({self.max_reconnect_attempts}) reached")
-            raise Exception("Failed to reconnect after maximum attempts")
+        """
+        Reconnect with jittered exponential backoff
 
-        self.reconnect_attempts += 1
-        delay = self.base_reconnect_delay * (2 ** (self.reconnect_attempts - 1))
+        Retries in a loop (capped at _MAX_RECONNECT_DELAY between attempts)
+        until connect() succeeds or max_reconnect_attempts is reached.
+        """
+        while self.reconnect_attempts < self.max_reconnect_attempts:
+            self.reconnect_attempts += 1
+            delay = min(self.base_reconnect_delay * (1 << (self.reconnect_attempts - 1)), _MAX_RECONNECT_DELAY)
+            # Jitter so many clients dropped together do not retry in lockstep
+            delay *= 0.5 + random.random()
+
+            logger.warning(
+                f"Reconnecting in {delay:.1f}s (attempt {self.reconnect_attempts}/{self.max_reconnect_attempts})"
+            )
+            await asyncio.sleep(delay)
 
-        logger.warning(f"Reconnecting in {delay}s (attempt {self.reconnect_attempts}/{self.max_reconnect_attempts})")
-        await asyncio.sleep(delay)
+            try:
+                await self.connect()
+                self._reconnections += 1
+                return
+            except Exception as e:
+                logger.error(f"Reconnection attempt {self.reconnect_attempts} failed: {e}")
 
-        try:
-            await self.connect()
-            self.stats["reconnections"] += 1
-        except Exception as e:
-            logger.error(f"Reconnection attempt {self.reconnect_attempts} failed: {e}")
-            await self.reconnect()
+        logger.error(f"Max reconnection attempts ({self.max_reconnect_attempts}) reached")
+        raise Exception("Failed to reconnect after maximum attempts")
 
     async def _resubscribe_all(self):
         """Resubscribe to all active subscriptions after reconnection"""
@@ -128,25 +219,47 @@ class WebSocketManager:
         logger.info(f"Resubscribing to {len(self.subscriptions)} active subscriptions")
         for sub_id, sub_data in self.subscriptions.items():
             try:
-                await self._send_message(sub_data["message"])
+                await self._send_message(sub_data["subscribe_frame"])
                 logger.debug(f"Resubscribed to {sub_id}")
             except Exception as e:
                 logger.error(f"Failed to resubscribe to {sub_id}: {e}")
 
-    async def _send_message(self, message: Dict[str, Any]):
-        """Send message to WebSocket"""
+    async def _send_message(self, message: Union[Dict[str, Any], str]):
+        """Send message to WebSocket (a dict, or an already-encoded JSON string)"""
         if not self.connected or not self.ws:
             raise Exception("WebSocket not connected")
 
         try:
-            message_json = json.dumps(message)
+            # Sent as a text frame; the server does not accept binary frames
+            message_json = message if isinstance(message, str) else orjson.dumps(message).decode()
             await self.ws.send(message_json)
-            self.stats["messages_sent"] += 1
+            self._messages_sent += 1
             logger.debug(f"Sent message: {message_json}")
         except Exception as e:
             logger.error(f"Failed to send message: {e}")
             raise
 
+    def _route(self, sub_id: str, subscription_type: str) -> None:
+        """Deliver messages on subscription_type's channel to sub_id (replacing any older entry)."""
+        key = subscription_type.lower()
+        routed = tuple(entry for entry in self._sub_by_channel.get(key, ()) if entry[0] != sub_id)
+        handlers = self.message_handlers.setdefault(sub_id, [])
+        self._sub_by_channel[key] = (*routed, (sub_id, self.subscriptions[sub_id], handlers))
+
+    def _set_handlers(self, sub_id: str, handlers: List[Tuple[bool, Callable]]) -> None:
+        """Replace sub_id's handler list (never mutated in place while routed)."""
+        self.message_handlers[sub_id] = handlers
+        self._route(sub_id, self.subscriptions[sub_id]["type"])
+
+    def _unroute(self, sub_id: str, subscription_type: str) -> None:
+        """Stop delivering messages to sub_id."""
+        key = subscription_type.lower()
+        routed = tuple(entry for entry in self._sub_by_channel.get(key, ()) if entry[0] != sub_id)
+        if routed:
+            self._sub_by_channel[key] = routed
+        else:
+            self._sub_by_channel.pop(key, None)
+
     async def subscribe(
         self,
         subscription_type: str,
@@ -163,6 +276,11 @@ class WebSocketManager:
 
         Returns:
             Subscription ID
+
+        Subscribing again with the same type and parameters (for example from
+        another WebSocketTools sharing this connection) adds a holder and its
+        callback to the existing subscription; the server subscription is only
+        dropped once every holder has unsubscribed.
         """
         # Create subscription message
         subscription = {
@@ -175,52 +293,92 @@ class WebSocketManager:
             "subscription": subscription
         }
 
-        # Generate subscription ID
-        sub_id = f"{subscription_type}_{hash(json.dumps(params, sort_keys=True))}"
+        # Generate subscription ID (parameters are plain strings; anything
+        # unhashable is hashed through its canonical JSON form instead)
+        try:
+            params_hash = hash(tuple(sorted(params.items())))
+        except TypeError:
+            params_hash = hash(orjson.dumps(params, option=orjson.OPT_SORT_KEYS))
+        sub_id = f"{subscription_type}_{params_hash}"
+
+        existing = self.subscriptions.get(sub_id)
+        if existing is not None:
+            existing["holders"] += 1
+            if callback:
+                self._set_handlers(sub_id, [
+                    *self.message_handlers.get(sub_id, ()),
+                    (asyncio.iscoroutinefunction(callback), callback)
+                ])
+            logger.info(f"Joined existing subscription {sub_id} ({existing['holders']} holders)")
+            return sub_id
 
-        # Store subscription
+        # Store subscription, with the subscribe/unsubscribe frames encoded
+        # once for reuse on every reconnect and on unsubscribe
         self.subscriptions[sub_id] = {
             "type": subscription_type,
             "params": params,
             "message": message,
+            "subscribe_frame": orjson.dumps(message).decode(),
+            "unsubscribe_frame": orjson.dumps({"method": "unsubscribe", "subscription": subscription}).decode(),
             "callback": callback,
+            "holders": 1,
             "messages_received": 0,
             "subscribed_at": datetime.now().isoformat()
         }
+        self._route(sub_id, subscription_type)
 
         # Register callback
         if callback:
             if sub_id not in self.message_handlers:
                 self.message_handlers[sub_id] = []
-            self.message_handlers[sub_id].append(callback)
+            self.message_handlers[sub_id].append((asyncio.iscoroutinefunction(callback), callback))
 
         # Send subscription message
         try:
-            await self._send_message(message)
+            await self._send_message(self.subscriptions[sub_id]["subscribe_frame"])
             logger.info(f"Subscribed to {subscription_type} with ID: {sub_id}")
             return sub_id
         except Exception as e:
             del self.subscriptions[sub_id]
+            self.message_handlers.pop(sub_id, None)
+            self._unroute(sub_id, subscription_type)
             raise Exception(f"Failed to subscribe: {str(e)}")
 
-    async def unsubscribe(self, sub_id: str):
-        """Unsubscribe from a channel"""
+    async def unsubscribe(self, sub_id: str, callback: Optional[Callable] = None):
+        """
+        Release one holder of a subscription
+
+        Args:
+            sub_id: Subscription to release
+            callback: The callback that holder registered, which stops
+                receiving messages
+
+        The unsubscribe frame is only sent when the last holder releases;
+        while disconnected the subscription is just dropped locally, so it is
+        not restored on reconnect.
+        """
         if sub_id not in self.subscriptions:
             raise ValueError(f"Subscription {sub_id} not found")
 
         sub_data = self.subscriptions[sub_id]
 
-        message = {
-            "method": "unsubscribe",
-            "subscription": {
-                "type": sub_data["type"],
-                **sub_data["params"]
-            }
-        }
+        if sub_data["holders"] > 1:
+            sub_data["holders"] -= 1
+            if callback:
+                handlers = list(self.message_handlers.get(sub_id, ()))
+                for i, (_, handler) in enumerate(handlers):
+                    if handler == callback:
+                        del handlers[i]
+                        break
+                self._set_handlers(sub_id, handlers)
+            logger.info(f"Released {sub_id} ({sub_data['holders']} holders left)")
+            return
 
         try:
-            await self._send_message(message)
+            if self.connected:
+                await self._send_message(sub_data["unsubscribe_frame"])
             del self.subscriptions[sub_id]
+            self._unroute(sub_id, sub_data["type"])
             if sub_id in self.message_handlers:
                 del self.message_handlers[sub_id]
             logger.info(f"Unsubscribed from {sub_id}")
@@ -231,55 +389,61 @@ class WebSocketManager:
     async def _handle_message(self, message: str):
         """Handle incoming WebSocket message"""
         try:
-            data = json.loads(message)
-            self.stats["messages_received"] += 1
-            self.stats["last_message_time"] = datetime.now().isoformat()
+            data = orjson.loads(message)
+            self._messages_received += 1
+            received_ns = self._last_message_ns = time.monotonic_ns()
 
-            # Route message to appropriate handlers
+            # Route message to the subscriptions on its channel
             channel = data.get("channel", "")
+            key = self._channel_keys.get(channel)
+            if key is None:
+                key = channel.split("@", 1)[0].lower()
+                if len(self._channel_keys) < _CHANNEL_KEY_CACHE_SIZE:
+                    self._channel_keys[channel] = key
+
+            subscriptions = self.subscriptions
+            for sub_id, sub_data, handlers in self._sub_by_channel.get(key, ()):
+                if subscriptions.get(sub_id) is not sub_data:
+                    # Unsubscribed (or replaced) by an earlier handler for this message
+                    continue
+                sub_data["messages_received"] += 1
+
+                # Call registered callbacks
+                for is_coro, handler in handlers:
+                    try:
+                        if is_coro:
+                            await handler(data)
+                        else:
+                            handler(data)
+                    except Exception as e:
+                        logger.error(f"Error in message handler: {e}")
+
+            # Add to message queue for polling, dropping the oldest message
+            # when the poller falls behind so memory stays bounded
+            if self.queue_enabled:
+                item = (received_ns, data)
+                try:
+                    self.message_queue.put_nowait(item)
+                except asyncio.QueueFull:
+                    self.message_queue.get_nowait()
+                    self.message_queue.put_nowait(item)
+                    self._dropped_messages += 1
 
-            for sub_id, sub_data in self.subscriptions.items():
-                # Check if message belongs to this subscription
-                if self._message_matches_subscription(data, sub_data):
-                    sub_data["messages_received"] += 1
-
-                    # Call registered callbacks
-                    if sub_id in self.message_handlers:
-                        for handler in self.message_handlers[sub_id]:
-                            try:
-                                if asyncio.iscoroutinefunction(handler):
-                                    await handler(data)
-                                else:
-                                    handler(data)
-                            except Exception as e:
-                                logger.error(f"Error in message handler: {e}")
-
-            # Add to message queue for polling
-            await self.message_queue.put({
-                "timestamp": datetime.now().isoformat(),
-                "data": data
-            })
-
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse message: {e}")
         except Exception as e:
             logger.error(f"Error handling message: {e}")
 
-    def _message_matches_subscription(
-        self,
-        message: Dict[str, Any],
-        subscription: Dict[str, Any]
-    ) -> bool:
-        """Check if message matches subscription"""
-        # This is a simple implementation - may need to be more sophisticated
-        # based on actual Hyperliquid WebSocket protocol
-        msg_type = message.get("channel", "").split("@")[0]
-        sub_type = subscription.get("type", "")
-
-        return msg_type.lower() == sub_type.lower()
-
     async def listen(self):
-        """Main message listening loop"""
+        """
+        Main message listening loop
+
+        Frames are read with async iteration rather than one wait_for(recv())
+        per message: frames already buffered by the connection are returned
+        without suspending, so a burst is drained back to back, and no timeout
+        task is created per message. Keepalive pings (ping_interval) detect
+        dead connections.
+        """
         self.running = True
 
         while self.running:
@@ -287,12 +451,14 @@ class WebSocketManager:
                 if not self.connected:
                     await self.reconnect()
 
-                message = await asyncio.wait_for(self.ws.recv(), timeout=30.0)
-                await self._handle_message(message)
+                async for message in self.ws:
+                    await self._handle_message(message)
+
+                # Iteration ends when the connection closes normally
+                self.connected = False
+                if self.running:
+                    logger.warning("Connection closed by server")
 
-            except asyncio.TimeoutError:
-                # No message received in timeout period - this is normal
-                continue
             except ConnectionClosed as e:
                 logger.warning(f"Connection closed: {e}")
                 self.connected = False
@@ -308,16 +474,24 @@ class WebSocketManager:
                 if self.running:
                     await asyncio.sleep(1)
 
+    def wall_time_iso(self, monotonic_ns: int) -> str:
+        """Convert a time.monotonic_ns() reading into a local ISO timestamp."""
+        return datetime.fromtimestamp(
+            self._wall_anchor + (monotonic_ns - self._mono_anchor_ns) / 1e9
+        ).isoformat()
+
     def get_stats(self) -> Dict[str, Any]:
         """Get connection statistics"""
+        last_ns = self._last_message_ns
         return {
             "connected": self.connected,
             "subscriptions": len(self.subscriptions),
-            "messages_received": self.stats["messages_received"],
-            "messages_sent": self.stats["messages_sent"],
-            "reconnections": self.stats["reconnections"],
-            "last_message_time": self.stats["last_message_time"],
-            "connection_start_time": self.stats["connection_start_time"],
+            "messages_received": self._messages_received,
+            "messages_sent": self._messages_sent,
+            "reconnections": self._reconnections,
+            "dropped_messages": self._dropped_messages,
+            "last_message_time": self.wall_time_iso(last_ns) if last_ns is not None else None,
+            "connection_start_time": self._connection_start_time,
             "reconnect_attempts": self.reconnect_attempts
         }
 
@@ -344,35 +518,98 @@ class WebSocketTools:
         self.ws_url = ws_url
         self.account_address = account_address
         self.logger = logging.getLogger(__name__)
-        self.manager = WebSocketManager(ws_url, account_address)
-        self.active_tasks: List[asyncio.Task] = []
+        # Instances for the same endpoint share one pooled manager, which
+        # refcounts each subscription; _owned records this instance's holds
+        # (sub_id -> the callback of each) so listing, unsubscribe_all and
+        # stop() only touch its own subscriptions
+        self._pool_key = (ws_url, account_address or "")
+        self.manager = _acquire_manager(self._pool_key)
+        self._holds_manager = True
+        self._owned: Dict[str, List[Optional[Callable]]] = {}
+        self._start_lock = asyncio.Lock()
+        self._started = asyncio.Event()
 
         self.logger.info(f"WebSocketTools initialized with URL: {ws_url}")
 
+    async def ensure_started(self):
+        """
+        Start the connection once, however many callers race to subscribe.
+
+        Concurrent callers wait on the same startup; after it succeeds the
+        listen loop owns reconnection, so later calls return immediately.
+        """
+        if self._started.is_set():
+            return
+
+        async with self._start_lock:
+            if not self._started.is_set():
+                await self.start()
+                self._started.set()
+
     async def start(self):
         """Start WebSocket connection and listening"""
-        await self.manager.connect()
+        if not self._holds_manager:
+            # Restarted after stop(): rejoin (or recreate) the pooled manager
+            self.manager = _acquire_manager(self._pool_key)
+            self._holds_manager = True
 
-        # Start listening task
-        listen_task = asyncio.create_task(self.manager.listen())
-        self.active_tasks.append(listen_task)
+        # No-op if another instance already started the shared connection
+        await self.manager.start()
 
         logger.info("WebSocket tools started")
 
     async def stop(self):
-        """Stop WebSocket connection and cleanup"""
-        # Cancel all active tasks
-        for task in self.active_tasks:
-            task.cancel()
+        """
+        Stop WebSocket connection and cleanup
+
+        This instance's subscriptions are released first. The shared
+        connection is only closed when the last WebSocketTools using it
+        stops; until then it keeps serving the other instances.
+        """
+        self._started.clear()
 
-        # Wait for tasks to complete
-        await asyncio.gather(*self.active_tasks, return_exceptions=True)
+        await self.unsubscribe_all()
 
-        # Disconnect
-        await self.manager.disconnect()
+        if self._holds_manager:
+            self._holds_manager = False
+            last_user = _release_manager(self._pool_key)
+            if last_user is not None:
+                await last_user.stop()
 
         logger.info("WebSocket tools stopped")
 
+    async def subscribe(
+        self,
+        subscription_type: str,
+        params: Dict[str, Any],
+        callback: Optional[Callable] = None
+    ) -> str:
+        """
+        Subscribe on the shared connection and record the hold as this instance's
+
+        Args:
+            subscription_type: Channel type (e.g. "l2Book", "allMids")
+            params: Subscription parameters
+            callback: Optional callback function for messages
+
+        Returns:
+            Subscription ID
+        """
+        sub_id = await self.manager.subscribe(subscription_type, params, callback)
+        self._owned.setdefault(sub_id, []).append(callback)
+        return sub_id
+
+    async def _release(self, sub_id: str, callback: Optional[Callable]) -> None:
+        """Release one of this instance's holds on sub_id."""
+        callbacks = self._owned.get(sub_id)
+        if not callbacks or callback not in callbacks:
+            raise ValueError(f"Subscription {sub_id} not found")
+
+        await self.manager.unsubscribe(sub_id, callback)
+        callbacks.remove(callback)
+        if not callbacks:
+            del self._owned[sub_id]
+
     async def subscribe_user_events(
         self,
         callback: Optional[Callable] = None
@@ -398,7 +635,7 @@ class WebSocketTools:
         }
 
         try:
-            sub_id = await self.manager.subscribe(
+            sub_id = await self.subscribe(
                 SubscriptionType.USER_EVENTS.value,
                 params,
                 callback
@@ -430,14 +667,11 @@ class WebSocketTools:
             ValueError: If invalid data_type provided
             Exception: If subscription fails
         """
-        valid_types = ["l2Book", "trades", "candle"]
         for data_type in data_types:
-            if data_type not in valid_types:
-                raise ValueError(f"Invalid data type: {data_type}. Must be one of {valid_types}")
+            if data_type not in _MARKET_DATA_TYPES:
+                raise ValueError(f"Invalid data type: {data_type}. Must be one of {list(_MARKET_DATA_TYPES)}")
 
-        subscription_ids = []
-
-        for data_type in data_types:
+        def params_for(data_type: str) -> Dict[str, Any]:
             params = {
                 "coin": coin
             }
@@ -445,24 +679,33 @@ class WebSocketTools:
             # Add interval for candle subscriptions
             if data_type == "candle":
                 params["interval"] = "1m"  # Default to 1 minute
+            return params
 
-            try:
-                sub_id = await self.manager.subscribe(
-                    data_type,
-                    params,
-                    callback
-                )
-                subscription_ids.append(sub_id)
+        # The subscriptions are independent, so their frames are sent
+        # concurrently; results come back in data_types order
+        results = await asyncio.gather(
+            *(self.subscribe(data_type, params_for(data_type), callback) for data_type in data_types),
+            return_exceptions=True
+        )
+
+        subscription_ids = []
+        failure: Optional[BaseException] = None
+
+        for data_type, result in zip(data_types, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to subscribe to {data_type} for {coin}: {result}")
+                failure = failure or result
+            else:
+                subscription_ids.append(result)
                 logger.info(f"Subscribed to {data_type} for {coin}")
-            except Exception as e:
-                logger.error(f"Failed to subscribe to {data_type} for {coin}: {e}")
-                # Unsubscribe from already created subscriptions
-                for existing_sub_id in subscription_ids:
-                    try:
-                        await self.manager.unsubscribe(existing_sub_id)
-                    except:
-                        pass
-                raise
+
+        if failure is not None:
+            # Unsubscribe from the subscriptions that did go through
+            await asyncio.gather(
+                *(self._release(sub_id, callback) for sub_id in subscription_ids),
+                return_exceptions=True
+            )
+            raise failure
 
         return subscription_ids
 
@@ -495,7 +738,7 @@ class WebSocketTools:
             }
 
             # Subscribe to orderUpdates
-            sub_id1 = await self.manager.subscribe(
+            sub_id1 = await self.subscribe(
                 SubscriptionType.ORDER_UPDATES.value,
                 params,
                 callback
@@ -503,7 +746,7 @@ class WebSocketTools:
             subscription_ids.append(sub_id1)
 
             # Subscribe to userFills
-            sub_id2 = await self.manager.subscribe(
+            sub_id2 = await self.subscribe(
                 SubscriptionType.USER_FILLS.value,
                 params,
                 callback
@@ -518,14 +761,14 @@ class WebSocketTools:
             # Cleanup
             for sub_id in subscription_ids:
                 try:
-                    await self.manager.unsubscribe(sub_id)
+                    await self._release(sub_id, callback)
                 except:
                     pass
             raise
 
     def get_active_subscriptions(self) -> List[Dict[str, Any]]:
         """
-        Get list of all active subscriptions
+        Get list of this instance's active subscriptions
 
         Returns:
             List of subscription dictionaries with:
@@ -538,7 +781,10 @@ class WebSocketTools:
         """
         subscriptions = []
 
-        for sub_id, sub_data in self.manager.subscriptions.items():
+        for sub_id in self._owned:
+            sub_data = self.manager.subscriptions.get(sub_id)
+            if sub_data is None:
+                continue
             subscriptions.append({
                 "subscription_id": sub_id,
                 "subscription_type": sub_data["type"],
@@ -550,26 +796,35 @@ class WebSocketTools:
 
         return subscriptions
 
-    async def unsubscribe(self, subscription_id: str):
+    async def unsubscribe(self, subscription_id: str, callback: Optional[Callable] = None):
         """
         Unsubscribe from a specific subscription
 
         Args:
             subscription_id: ID of subscription to remove
+            callback: Release only the hold registered with this callback;
+                by default every hold this instance has on the ID is released
 
         Raises:
-            ValueError: If subscription_id not found
+            ValueError: If subscription_id is not one of this instance's
             Exception: If unsubscribe fails
         """
-        await self.manager.unsubscribe(subscription_id)
+        if callback is not None:
+            await self._release(subscription_id, callback)
+            return
+
+        if subscription_id not in self._owned:
+            raise ValueError(f"Subscription {subscription_id} not found")
+        for held in list(self._owned[subscription_id]):
+            await self._release(subscription_id, held)
 
     async def unsubscribe_all(self):
-        """Unsubscribe from all active subscriptions"""
-        subscription_ids = list(self.manager.subscriptions.keys())
+        """Unsubscribe from all of this instance's subscriptions"""
+        subscription_ids = list(self._owned)
 
         for sub_id in subscription_ids:
             try:
-                await self.manager.unsubscribe(sub_id)
+                await self.unsubscribe(sub_id)
             except Exception as e:
                 logger.error(f"Failed to unsubscribe from {sub_id}: {e}")
 
@@ -588,17 +843,26 @@ class WebSocketTools:
         """
         Poll for next message from queue
 
+        Messages are only queued once this has been called; the queue holds
+        the latest _MESSAGE_QUEUE_SIZE messages and drops older ones.
+
         Args:
             timeout: Maximum time to wait for message
 
         Returns:
             Message dictionary or None if timeout
         """
+        self.manager.queue_enabled = True
+
         try:
-            message = await asyncio.wait_for(
+            received_ns, data = await asyncio.wait_for(
                 self.manager.message_queue.get(),
                 timeout=timeout
             )
-            return message
         except asyncio.TimeoutError:
             return None
+
+        return {
+            "timestamp": self.manager.wall_time_iso(received_ns),
+            "data": data
+        }